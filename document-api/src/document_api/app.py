@@ -1,16 +1,44 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+import json
+import os
 import tempfile
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Literal, Optional
+from typing import AsyncIterator, Dict, Literal, Optional, Union
 from uuid import uuid4
 
 from fastapi import Depends, FastAPI, File, HTTPException, UploadFile, status
-from fastapi.responses import HTMLResponse
-
-from .models import DocumentListResponse, DocumentRecord, WorkflowDebugRecord
+from fastapi.responses import HTMLResponse, PlainTextResponse, StreamingResponse
+from strategy.k1.metrics import EXTRACTION_METRICS
+from strategy.datalab_pool import get_async_datalab_pool, get_datalab_pool
+from strategy.openrouter_client import get_async_openrouter_client, get_openrouter_client
+from strategy.k1.versions import STRATEGY_VERSIONS, UnknownStrategyVersionError
+from strategy.parse_cache import get_parse_cache
+from strategy.pool import get_cpu_pool
+
+from .models import (
+    DocumentListResponse,
+    DocumentRecord,
+    StrategyVersionInfo,
+    StrategyVersionListResponse,
+    WorkflowDebugRecord,
+)
 from .store import InMemoryDocumentStore
-from .workflow_runner import WorkflowRunner, run_k1_workflow
+from .workflow_runner import WorkflowRunner, run_k1_workflow_async
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Spawn CPU workers before the first request rather than during it.
+    if os.getenv("TAXMAN_CPU_POOL_WARMUP", "").lower() in ("1", "true", "yes"):
+        await asyncio.to_thread(get_cpu_pool().warm_up)
+    yield
+    # Async Datalab and OpenRouter clients hold sessions bound to this event loop.
+    await get_async_datalab_pool().aclose()
+    await get_async_openrouter_client().aclose()
 
 
 app = FastAPI(
@@ -19,6 +47,7 @@ app = FastAPI(
     description="Upload tax PDFs, run the K-1 workflow, and fetch parsed results.",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Simple module-level dependencies so tests can override them.
@@ -30,7 +59,7 @@ def get_document_store() -> InMemoryDocumentStore:
 
 
 def get_workflow_runner() -> WorkflowRunner:
-    return run_k1_workflow
+    return run_k1_workflow_async
 
 
 def _validate_upload(file: UploadFile) -> None:
@@ -329,6 +358,47 @@ def get_workflow(
     return record
 
 
+@app.get(
+    "/strategy-versions",
+    response_model=StrategyVersionListResponse,
+    summary="List the regex strategy versions that can be requested",
+    tags=["strategies"],
+)
+def list_strategy_versions() -> StrategyVersionListResponse:
+    default_version = STRATEGY_VERSIONS.default_version
+    return StrategyVersionListResponse(
+        default_version=default_version,
+        versions=[
+            StrategyVersionInfo(
+                version=entry.version,
+                description=entry.description,
+                configured_fields=len(entry.strategy_config),
+                default=entry.version == default_version,
+                loaded=STRATEGY_VERSIONS.is_loaded(entry.version),
+            )
+            for entry in STRATEGY_VERSIONS.versions()
+        ],
+    )
+
+
+@app.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Process-wide extraction, parse cache and Datalab pool metrics in Prometheus text format",
+    tags=["metrics"],
+)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        EXTRACTION_METRICS.render_prometheus()
+        + get_parse_cache().render_prometheus()
+        + get_datalab_pool().render_prometheus()
+        + get_async_datalab_pool().render_prometheus()
+        + get_openrouter_client().render_prometheus()
+        + get_async_openrouter_client().render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 @app.post(
     "/documents",
     response_model=DocumentRecord,
@@ -353,41 +423,90 @@ async def create_document(
     wandb_run_name: Optional[str] = None,
     write_log_file: bool = False,
     log_filename: Optional[str] = None,
+    stream: bool = False,
     store: InMemoryDocumentStore = Depends(get_document_store),
     workflow_runner: WorkflowRunner = Depends(get_workflow_runner),
-) -> DocumentRecord:
+) -> Union[DocumentRecord, StreamingResponse]:
+    """With `stream=true`, respond with NDJSON: cover-page field values as the
+    parse finds them, then the stored document."""
     _validate_upload(file)
+    if strategy_version and workflow != "llm":
+        # Regex runs compile their strategy version; reject unknown ones up front.
+        try:
+            STRATEGY_VERSIONS.get(strategy_version)
+        except UnknownStrategyVersionError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     payload = await file.read()
     if not payload:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Uploaded file is empty")
+    filename = Path(file.filename).name or "document.pdf"
+
+    async def run(on_partial=None) -> DocumentRecord:
+        options = {"on_partial": on_partial} if on_partial is not None else {}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pdf_path = Path(tmp_dir) / filename
+            pdf_path.write_bytes(payload)
+            parsed_result = workflow_runner(
+                pdf_path=pdf_path,
+                workflow_config=workflow_config,
+                workflow=workflow,
+                use_mock_parser=use_mock_parser,
+                use_mock_llm=use_mock_llm,
+                llm_model=llm_model,
+                required_fields=[field.strip() for field in required_fields.split(",")] if required_fields else None,
+                strategy_version=strategy_version,
+                enable_wandb=enable_wandb,
+                wandb_project=wandb_project,
+                wandb_entity=wandb_entity,
+                wandb_run_name=wandb_run_name,
+                write_log_file=write_log_file,
+                log_filename=log_filename,
+                **options,
+            )
+            if inspect.isawaitable(parsed_result):
+                parsed_result = await parsed_result
+
+        document_id = uuid4().hex
+        record = DocumentRecord(id=document_id, **parsed_result.model_dump())
+        store.save_debug(
+            document_record=record,
+            pdf_bytes=payload,
+            pdf_filename=filename,
+            trace=parsed_result.trace,
+        )
+        return record
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        filename = Path(file.filename).name or "document.pdf"
-        pdf_path = Path(tmp_dir) / filename
-        pdf_path.write_bytes(payload)
-        parsed_result = workflow_runner(
-            pdf_path=pdf_path,
-            workflow_config=workflow_config,
-            workflow=workflow,
-            use_mock_parser=use_mock_parser,
-            use_mock_llm=use_mock_llm,
-            llm_model=llm_model,
-            required_fields=[field.strip() for field in required_fields.split(",")] if required_fields else None,
-            strategy_version=strategy_version,
-            enable_wandb=enable_wandb,
-            wandb_project=wandb_project,
-            wandb_entity=wandb_entity,
-            wandb_run_name=wandb_run_name,
-            write_log_file=write_log_file,
-            log_filename=log_filename,
+    if stream:
+        return StreamingResponse(
+            _document_events(run),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/x-ndjson",
         )
+    return await run()
 
-    document_id = uuid4().hex
-    record = DocumentRecord(id=document_id, **parsed_result.model_dump())
-    store.save_debug(
-        document_record=record,
-        pdf_bytes=payload,
-        pdf_filename=filename,
-        trace=parsed_result.trace,
-    )
-    return record
+
+async def _document_events(run) -> AsyncIterator[str]:
+    """NDJSON events: `partial` field values as they are found, then the `document`."""
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+
+    def on_partial(field_values: Dict[str, str]) -> None:
+        # Called from whichever thread is extracting; hand off to the loop.
+        loop.call_soon_threadsafe(
+            events.put_nowait, {"event": "partial", "field_values": field_values}
+        )
+
+    task = asyncio.ensure_future(run(on_partial))
+    task.add_done_callback(lambda _task: events.put_nowait(None))
+    try:
+        while (event := await events.get()) is not None:
+            yield json.dumps(event) + "\n"
+    finally:
+        # The client went away mid-stream; stop the run.
+        task.cancel()
+    try:
+        record = task.result()
+    except Exception as exc:
+        yield json.dumps({"event": "error", "detail": str(exc)}) + "\n"
+        return
+    yield json.dumps({"event": "document", "document": record.model_dump(mode="json")}) + "\n"
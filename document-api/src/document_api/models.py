@@ -47,6 +47,23 @@ class WorkflowDebugRecord(BaseModel):
     response_body: DocumentRecord
 
 
+class StrategyVersionInfo(BaseModel):
+    """One registered regex strategy version."""
+
+    version: str
+    description: str = ""
+    configured_fields: int = 0
+    default: bool = False
+    loaded: bool = False
+
+
+class StrategyVersionListResponse(BaseModel):
+    """Strategy versions the API can serve."""
+
+    default_version: str
+    versions: List[StrategyVersionInfo] = Field(default_factory=list)
+
+
 class DocumentListResponse(BaseModel):
     """Simple listing of known document identifiers."""
 
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Optional, Protocol, runtime_checkable
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional, Protocol, Union, runtime_checkable
 
 from fastapi.encoders import jsonable_encoder
 
+from strategy.config_cache import config_generation
 from workflow.config import DEFAULT_WORKFLOW_OPTIONS, WorkflowConfigError, resolve_run_options
 from workflow.core import WorkflowResult
 from workflow.k1 import build_k1_llm_extract_workflow, build_k1_workflow
@@ -15,6 +18,8 @@ from .telemetry import log_to_wandb as record_wandb_run, write_run_log
 
 DEFAULT_RUN_CONFIG = dict(DEFAULT_WORKFLOW_OPTIONS)
 
+PartialCallback = Callable[[Dict[str, str]], None]
+
 
 @runtime_checkable
 class WorkflowRunner(Protocol):
@@ -36,7 +41,8 @@ class WorkflowRunner(Protocol):
         wandb_run_name: Optional[str] = None,
         write_log_file: bool = False,
         log_filename: Optional[str] = None,
-    ) -> WorkflowRunResult: ...
+        on_partial: Optional[PartialCallback] = None,
+    ) -> Union[WorkflowRunResult, Awaitable[WorkflowRunResult]]: ...
 
 
 def _as_mapping(value: Optional[Mapping]) -> dict:
@@ -89,6 +95,7 @@ def _build_k1(
     llm_model: str,
     required_fields: Optional[Iterable[str]],
     strategy_version: str,
+    on_partial: Optional[PartialCallback] = None,
 ):
     workflow_kind = (workflow or "regex").lower()
     if workflow_kind == "llm":
@@ -98,6 +105,7 @@ def _build_k1(
             use_mock_llm=use_mock_llm,
             required_fields=required_fields,
             llm_model=llm_model,
+            on_partial=on_partial,
         )
     if workflow_kind == "regex":
         return build_k1_workflow(
@@ -105,6 +113,7 @@ def _build_k1(
             use_mock_parser=use_mock_parser,
             required_fields=required_fields,
             strategy_version=strategy_version,
+            on_partial=on_partial,
         )
     raise ValueError(f"Unsupported workflow '{workflow_kind}'. Use 'regex' or 'llm'.")
 
@@ -123,48 +132,100 @@ def _context_snapshot(context) -> dict:
     return jsonable_encoder(snapshot)
 
 
+def _trace_entry(result, input_ctx: dict, post_ctx: dict) -> dict:
+    return {
+        "name": result.name,
+        "strategy_name": result.strategy_name,
+        "strategy_version": result.strategy_version,
+        "input_context": input_ctx,
+        "output": result.output,
+        "artifacts": result.artifacts,
+        "errors": result.errors,
+        "post_context": post_ctx,
+    }
+
+
 def _run_with_trace(workflow_obj, context):
     results = []
     trace = []
     for activity in workflow_obj.activities:
         input_ctx = _context_snapshot(context)
         result = activity.run(context)
-        post_ctx = _context_snapshot(context)
         results.append(result)
-        trace.append(
-            {
-                "name": result.name,
-                "strategy_name": result.strategy_name,
-                "strategy_version": result.strategy_version,
-                "input_context": input_ctx,
-                "output": result.output,
-                "artifacts": result.artifacts,
-                "errors": result.errors,
-                "post_context": post_ctx,
-            }
-        )
+        trace.append(_trace_entry(result, input_ctx, _context_snapshot(context)))
     return WorkflowResult(context=context, activity_results=results), trace
 
 
-def run_k1_workflow(
+async def _run_with_trace_async(workflow_obj, context):
+    results = []
+    trace = []
+    for activity in workflow_obj.activities:
+        input_ctx = _context_snapshot(context)
+        result = await activity.run_async(context)
+        results.append(result)
+        trace.append(_trace_entry(result, input_ctx, _context_snapshot(context)))
+    return WorkflowResult(context=context, activity_results=results), trace
+
+
+@dataclass
+class _PreparedRun:
+    """A resolved config and built workflow, ready to run."""
+
+    run_config: dict[str, Any]
+    resolved_config: dict[str, Any]
+    applied_config: Optional[str]
+    workflow_obj: Any
+    context: Any
+
+
+def _record_telemetry(
+    result: WorkflowRunResult,
+    run_config: dict[str, Any],
     *,
-    pdf_path: Path,
-    workflow: Optional[str] = None,
-    workflow_config: Optional[str] = None,
-    workflow_config_path: Optional[Path] = None,
-    use_mock_parser: Optional[bool] = None,
-    use_mock_llm: Optional[bool] = None,
-    llm_model: Optional[str] = None,
-    required_fields: Optional[Iterable[str]] = None,
-    strategy_version: Optional[str] = None,
-    enable_wandb: bool = False,
-    wandb_project: Optional[str] = None,
-    wandb_entity: Optional[str] = None,
-    wandb_run_name: Optional[str] = None,
-    write_log_file: bool = False,
-    log_filename: Optional[str] = None,
+    enable_wandb: bool,
+    wandb_project: Optional[str],
+    wandb_entity: Optional[str],
+    wandb_run_name: Optional[str],
+    write_log_file: bool,
+    log_filename: Optional[str],
 ) -> WorkflowRunResult:
-    """Execute the K-1 workflow and normalize outputs for API responses."""
+    if enable_wandb:
+        try:
+            wandb_url = record_wandb_run(
+                result=result,
+                config=run_config,
+                project=wandb_project,
+                entity=wandb_entity,
+                run_name=wandb_run_name,
+            )
+            if wandb_url:
+                result.metadata["wandb_run_url"] = wandb_url
+        except Exception as exc:  # pragma: no cover - telemetry guard
+            result.metadata["wandb_error"] = str(exc)
+    if write_log_file:
+        try:
+            log_path = write_run_log(result=result, config=run_config, filename=log_filename)
+            result.metadata["local_log_file"] = str(log_path)
+        except Exception as exc:  # pragma: no cover - telemetry guard
+            result.metadata["log_error"] = str(exc)
+    return result
+
+
+def _prepare_run(
+    *,
+    pdf_path: Path,
+    workflow: Optional[str],
+    workflow_config: Optional[str],
+    workflow_config_path: Optional[Path],
+    use_mock_parser: Optional[bool],
+    use_mock_llm: Optional[bool],
+    llm_model: Optional[str],
+    required_fields: Optional[Iterable[str]],
+    strategy_version: Optional[str],
+    telemetry: dict[str, Any],
+    on_partial: Optional[PartialCallback] = None,
+) -> Union[_PreparedRun, WorkflowRunResult]:
+    """Resolve the config and build the workflow, or return the failed result."""
     try:
         resolved_config, applied_config = _resolve_run_config(
             workflow_config=workflow_config,
@@ -199,8 +260,10 @@ def run_k1_workflow(
             llm_model=resolved_config["llm_model"],
             required_fields=resolved_config.get("required_fields"),
             strategy_version=resolved_config["strategy_version"],
+            on_partial=on_partial,
         )
     except Exception as exc:  # pragma: no cover - defensive
+        run_config["config_generation"] = config_generation()
         result = WorkflowRunResult(
             succeeded=False,
             errors=[str(exc)],
@@ -211,31 +274,28 @@ def run_k1_workflow(
             artifacts={},
             trace=[],
         )
-        if enable_wandb:
+        if telemetry["enable_wandb"]:
             try:
                 record_wandb_run(
                     result=result,
                     config=run_config,
-                    project=wandb_project,
-                    entity=wandb_entity,
-                    run_name=wandb_run_name,
+                    project=telemetry["wandb_project"],
+                    entity=telemetry["wandb_entity"],
+                    run_name=telemetry["wandb_run_name"],
                 )
             except Exception:
                 result.metadata["wandb_error"] = "Failed to log to W&B"
-        if write_log_file:
+        if telemetry["write_log_file"]:
             try:
-                write_run_log(result=result, config=run_config, filename=log_filename)
+                write_run_log(result=result, config=run_config, filename=telemetry["log_filename"])
             except Exception:
                 result.metadata["log_error"] = "Failed to write log file"
         return result
+    return _PreparedRun(run_config, resolved_config, applied_config, workflow_obj, context)
 
-    try:
-        workflow_result, trace = _run_with_trace(workflow_obj, context)
-    except Exception as exc:  # pragma: no cover - defensive
-        context.add_error(str(exc))
-        workflow_result = WorkflowResult(context=context, activity_results=[])
-        trace = []
 
+def _finish_run(prepared: _PreparedRun, workflow_result: WorkflowResult, trace: list) -> WorkflowRunResult:
+    context = prepared.context
     errors = list(context.errors)
     artifacts = {}
     for activity in workflow_result.activity_results:
@@ -251,10 +311,13 @@ def run_k1_workflow(
 
     succeeded = workflow_result.succeeded and not errors
     metadata = _as_mapping(getattr(context, "metadata", None))
-    metadata.setdefault("workflow", resolved_config["workflow"])
-    if applied_config:
-        metadata.setdefault("workflow_config", applied_config)
-    return_result = WorkflowRunResult(
+    metadata.setdefault("workflow", prepared.resolved_config["workflow"])
+    if prepared.applied_config:
+        metadata.setdefault("workflow_config", prepared.applied_config)
+    # Read after the activities ran: extraction may have hot-reloaded a config.
+    prepared.run_config["config_generation"] = config_generation()
+    metadata.setdefault("config_generation", prepared.run_config["config_generation"])
+    return WorkflowRunResult(
         succeeded=succeeded,
         errors=errors,
         field_values=_as_mapping(getattr(context, "field_values", None)),
@@ -264,23 +327,123 @@ def run_k1_workflow(
         artifacts=artifacts,
         trace=trace,
     )
-    if enable_wandb:
-        try:
-            wandb_url = record_wandb_run(
-                result=return_result,
-                config=run_config,
-                project=wandb_project,
-                entity=wandb_entity,
-                run_name=wandb_run_name,
-            )
-            if wandb_url:
-                return_result.metadata["wandb_run_url"] = wandb_url
-        except Exception as exc:  # pragma: no cover - telemetry guard
-            return_result.metadata["wandb_error"] = str(exc)
-    if write_log_file:
-        try:
-            log_path = write_run_log(result=return_result, config=run_config, filename=log_filename)
-            return_result.metadata["local_log_file"] = str(log_path)
-        except Exception as exc:  # pragma: no cover - telemetry guard
-            return_result.metadata["log_error"] = str(exc)
-    return return_result
+
+
+def run_k1_workflow(
+    *,
+    pdf_path: Path,
+    workflow: Optional[str] = None,
+    workflow_config: Optional[str] = None,
+    workflow_config_path: Optional[Path] = None,
+    use_mock_parser: Optional[bool] = None,
+    use_mock_llm: Optional[bool] = None,
+    llm_model: Optional[str] = None,
+    required_fields: Optional[Iterable[str]] = None,
+    strategy_version: Optional[str] = None,
+    enable_wandb: bool = False,
+    wandb_project: Optional[str] = None,
+    wandb_entity: Optional[str] = None,
+    wandb_run_name: Optional[str] = None,
+    write_log_file: bool = False,
+    log_filename: Optional[str] = None,
+    on_partial: Optional[PartialCallback] = None,
+) -> WorkflowRunResult:
+    """Execute the K-1 workflow and normalize outputs for API responses.
+
+    `on_partial` receives cover-page field values as soon as they are found,
+    before the parse finishes (see `strategy.progressive`).
+    """
+    telemetry = dict(
+        enable_wandb=enable_wandb,
+        wandb_project=wandb_project,
+        wandb_entity=wandb_entity,
+        wandb_run_name=wandb_run_name,
+        write_log_file=write_log_file,
+        log_filename=log_filename,
+    )
+    prepared = _prepare_run(
+        pdf_path=pdf_path,
+        workflow=workflow,
+        workflow_config=workflow_config,
+        workflow_config_path=workflow_config_path,
+        use_mock_parser=use_mock_parser,
+        use_mock_llm=use_mock_llm,
+        llm_model=llm_model,
+        required_fields=required_fields,
+        strategy_version=strategy_version,
+        telemetry=telemetry,
+        on_partial=on_partial,
+    )
+    if isinstance(prepared, WorkflowRunResult):
+        return prepared
+
+    try:
+        workflow_result, trace = _run_with_trace(prepared.workflow_obj, prepared.context)
+    except Exception as exc:  # pragma: no cover - defensive
+        prepared.context.add_error(str(exc))
+        workflow_result = WorkflowResult(context=prepared.context, activity_results=[])
+        trace = []
+    result = _finish_run(prepared, workflow_result, trace)
+    return _record_telemetry(result, prepared.run_config, **telemetry)
+
+
+async def run_k1_workflow_async(
+    *,
+    pdf_path: Path,
+    workflow: Optional[str] = None,
+    workflow_config: Optional[str] = None,
+    workflow_config_path: Optional[Path] = None,
+    use_mock_parser: Optional[bool] = None,
+    use_mock_llm: Optional[bool] = None,
+    llm_model: Optional[str] = None,
+    required_fields: Optional[Iterable[str]] = None,
+    strategy_version: Optional[str] = None,
+    enable_wandb: bool = False,
+    wandb_project: Optional[str] = None,
+    wandb_entity: Optional[str] = None,
+    wandb_run_name: Optional[str] = None,
+    write_log_file: bool = False,
+    log_filename: Optional[str] = None,
+    on_partial: Optional[PartialCallback] = None,
+) -> WorkflowRunResult:
+    """`run_k1_workflow` on the event loop.
+
+    Activities are awaited, so a remote parse holds no thread while Datalab
+    works. Config resolution and telemetry, which touch files and the
+    network synchronously, run on worker threads.
+    """
+    telemetry = dict(
+        enable_wandb=enable_wandb,
+        wandb_project=wandb_project,
+        wandb_entity=wandb_entity,
+        wandb_run_name=wandb_run_name,
+        write_log_file=write_log_file,
+        log_filename=log_filename,
+    )
+    prepared = await asyncio.to_thread(
+        _prepare_run,
+        pdf_path=pdf_path,
+        workflow=workflow,
+        workflow_config=workflow_config,
+        workflow_config_path=workflow_config_path,
+        use_mock_parser=use_mock_parser,
+        use_mock_llm=use_mock_llm,
+        llm_model=llm_model,
+        required_fields=required_fields,
+        strategy_version=strategy_version,
+        telemetry=telemetry,
+        on_partial=on_partial,
+    )
+    if isinstance(prepared, WorkflowRunResult):
+        return prepared
+
+    try:
+        workflow_result, trace = await _run_with_trace_async(prepared.workflow_obj, prepared.context)
+    except Exception as exc:  # pragma: no cover - defensive
+        prepared.context.add_error(str(exc))
+        workflow_result = WorkflowResult(context=prepared.context, activity_results=[])
+        trace = []
+    result = _finish_run(prepared, workflow_result, trace)
+    if not (enable_wandb or write_log_file):
+        return result
+    return await asyncio.to_thread(_record_telemetry, result, prepared.run_config, **telemetry)
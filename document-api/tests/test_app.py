@@ -129,6 +129,7 @@ def test_workflow_config_picks_llm(client: TestClient):
     assert payload["succeeded"] is True
     assert payload["metadata"]["workflow"] == "llm"
     assert payload["metadata"]["workflow_config"] == "llm-mock"
+    assert isinstance(payload["metadata"]["config_generation"], int)
     assert payload["artifacts"]["extract_fields"]["strategy_name"] == "MockOpenRouterExtractK1"
 
 
@@ -179,3 +180,17 @@ def test_workflow_trace_endpoint(client: TestClient):
     assert decoded == pdf_bytes
     assert body["response_body"]["id"] == doc_id
     assert len(body["steps"]) >= 1
+
+
+def test_streamed_upload_publishes_partial_fields_first(client: TestClient):
+    response = client.post("/documents", params={"stream": "true"}, files=_pdf_upload())
+
+    assert response.status_code == 201
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["event"] for event in events] == ["partial", "document"]
+    assert events[0]["field_values"]["partnership_name"] == "abc partnership"
+    document = events[1]["document"]
+    assert document["field_values"]["partnership_name"] == "abc partnership"
+    assert document["metadata"]["partial_field_values"] == events[0]["field_values"]
+    assert client.get(f"/documents/{document['id']}").status_code == 200
@@ -84,3 +84,58 @@ def test_workflow_trace_base64_round_trip(client: TestClient):
     decoded = base64.b64decode(payload["pdf_base64"].encode("ascii"))
     assert decoded == upload["file"][1]
     assert payload["pdf_filename"] == "trace2.pdf"
+
+
+def test_startup_warms_cpu_pool_when_enabled(monkeypatch):
+    import sys
+
+    app_module = sys.modules["document_api.app"]
+    warmed = []
+
+    class FakePool:
+        def warm_up(self):
+            warmed.append(True)
+            return 1
+
+    monkeypatch.setattr(app_module, "get_cpu_pool", lambda: FakePool())
+    monkeypatch.setenv("TAXMAN_CPU_POOL_WARMUP", "1")
+    with TestClient(app):
+        pass
+    monkeypatch.setenv("TAXMAN_CPU_POOL_WARMUP", "0")
+    with TestClient(app):
+        pass
+
+    assert warmed == [True]
+
+
+def test_metrics_endpoint_serves_extraction_metrics(client: TestClient):
+    upload = _upload(("metrics.pdf", b"%PDF-1.4 metrics", "application/pdf"))
+    assert client.post("/documents", files=upload).status_code == 201
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "taxman_extraction_documents_total" in response.text
+    assert "taxman_extraction_strategy_seconds_total{field=" in response.text
+    assert "taxman_parse_cache_hits_total" in response.text
+
+
+def test_strategy_versions_endpoint_lists_registered_versions(client: TestClient):
+    response = client.get("/strategy-versions")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["default_version"] == "v1.0.0"
+    entry = next(item for item in payload["versions"] if item["version"] == "v1.0.0")
+    assert entry["default"] is True
+
+
+def test_unknown_strategy_version_is_rejected_before_running(client: TestClient):
+    upload = _upload(("doc.pdf", b"%PDF-1.4 data", "application/pdf"))
+
+    response = client.post("/documents?strategy_version=v9.9.9", files=upload)
+
+    assert response.status_code == 400
+    assert "v1.0.0" in response.json()["detail"]
+    assert document_store.list_ids() == []
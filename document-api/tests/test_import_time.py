@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+# First-party self time measured ~0.08s locally; leave headroom for slow CI hosts.
+IMPORT_BUDGET_SECONDS = 0.25
+FIRST_PARTY = ("document_api", "strategy", "workflow")
+DEFERRED_MODULES = ("datalab_sdk", "wandb", "weave")
+
+PROBE = """
+import sys
+import document_api.app
+from strategy.models.k1 import pydantic_model
+
+print(",".join(sorted(name for name in sys.modules if "." not in name)))
+print(pydantic_model.generic_k1_lines_model.cache_info().currsize)
+"""
+
+
+def _import_app():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def _first_party_seconds(importtime_log: str) -> float:
+    total_us = 0
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = (
+            part.strip() for part in line[len("import time:"):].split("|")
+        )
+        if name.split(".")[0] in FIRST_PARTY:
+            total_us += int(self_us)
+    return total_us / 1e6
+
+
+def test_app_import_stays_within_budget():
+    result = _import_app()
+    top_level, generic_models_built = result.stdout.splitlines()[-2:]
+
+    assert not set(DEFERRED_MODULES) & set(top_level.split(","))
+    assert generic_models_built == "0"
+    assert _first_party_seconds(result.stderr) < IMPORT_BUDGET_SECONDS
@@ -1,9 +1,11 @@
+import asyncio
 from pathlib import Path
 
 import pytest
+import yaml
 
 from document_api import workflow_runner
-from document_api.workflow_runner import _resolve_run_config, _build_k1, run_k1_workflow
+from document_api.workflow_runner import _resolve_run_config, _build_k1, run_k1_workflow, run_k1_workflow_async
 from document_api.models import WorkflowRunResult
 
 
@@ -78,3 +80,45 @@ def test_run_k1_workflow_records_wandb_url(monkeypatch):
 
     assert result.metadata["wandb_run_url"] == "http://wandb.url/run"
     assert called["project"] == "proj"
+
+
+def test_run_k1_workflow_async_matches_sync_runner():
+    options = dict(pdf_path=FIXTURE_PDF, use_mock_parser=True, use_mock_llm=True)
+
+    sync_result = run_k1_workflow(**options)
+    async_result = asyncio.run(run_k1_workflow_async(**options))
+
+    assert async_result.succeeded is sync_result.succeeded is True
+    assert async_result.field_values == sync_result.field_values
+    assert [step["name"] for step in async_result.trace] == [step["name"] for step in sync_result.trace]
+
+
+def test_runners_take_keyword_arguments_only():
+    with pytest.raises(TypeError):
+        run_k1_workflow(FIXTURE_PDF)
+    with pytest.raises(TypeError):
+        run_k1_workflow_async(FIXTURE_PDF)
+
+
+def test_run_records_the_config_generation_extraction_used(monkeypatch, tmp_path: Path):
+    from strategy.config_cache import CONFIG_CACHE, config_generation
+    from strategy.extraction import ExtractRegexK1
+
+    execute = ExtractRegexK1.execute
+    reloaded = tmp_path / "reloaded.yaml"
+    reloaded.write_text("reloaded: true\n")
+
+    def execute_with_reload(self, context):
+        # Stands in for a config file hot-reloaded while the run extracts.
+        CONFIG_CACHE.load(reloaded, yaml.safe_load)
+        return execute(self, context)
+
+    monkeypatch.setattr(ExtractRegexK1, "execute", execute_with_reload)
+    logged = {}
+    monkeypatch.setattr(workflow_runner, "record_wandb_run", lambda **kwargs: logged.update(kwargs))
+    before = config_generation()
+
+    result = run_k1_workflow(pdf_path=FIXTURE_PDF, use_mock_parser=True, use_mock_llm=True, enable_wandb=True)
+
+    assert result.metadata["config_generation"] == config_generation() > before
+    assert logged["config"]["config_generation"] == result.metadata["config_generation"]
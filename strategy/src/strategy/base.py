@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any, Dict, Generic, List, Mapping, Protocol, TypeVar
 
@@ -52,5 +53,13 @@ class BaseStrategy(Generic[TResult]):
     def execute(self, context: ContextProtocol) -> StrategyResult[TResult]:
         raise NotImplementedError
 
+    async def execute_async(self, context: ContextProtocol) -> StrategyResult[TResult]:
+        """Awaitable `execute`; runs it on a worker thread unless a strategy overrides it.
+
+        Strategies that wait on remote services override this to await the
+        I/O directly, so an event loop can keep many of them in flight.
+        """
+        return await asyncio.to_thread(self.execute, context)
+
     def __call__(self, context: ContextProtocol) -> StrategyResult[TResult]:
         return self.execute(context)
@@ -0,0 +1,145 @@
+"""Process-wide cache of parsed config files with mtime-based hot reload.
+
+Workflow presets, strategy versions and field strategy configs are parsed
+once and served from memory. Every read re-validates the file with a single
+`stat`, and a changed file is re-parsed and swapped in atomically. Readers
+see either the old or the new value, never a mix.
+
+The same-tick edits that mtime alone cannot see are handled like git's "racy"
+index entries: while a file's mtime is too close to the moment it was loaded
+to be trusted, its content hash is compared as well. If a changed file fails
+to parse, the last good value keeps being served and a `RuntimeWarning` is
+issued.
+
+`config_generation()` increases whenever any cached file is (re)loaded and is
+recorded in run metadata, so results can be tied to the config that produced
+them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+Parser = Callable[[str], Any]
+Signature = Tuple[int, int, int]
+
+# Filesystem timestamps can be this coarse; newer files are also hash-checked.
+RACY_WINDOW_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class CachedConfig:
+    """One parsed file as currently served."""
+
+    path: Path
+    value: Any
+    signature: Signature
+    digest: str
+    loaded_at: float
+    generation: int
+
+
+def _signature(stat: os.stat_result) -> Signature:
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class ConfigCache:
+    """Parsed-file cache keyed by (path, parser)."""
+
+    def __init__(self, *, racy_window: float = RACY_WINDOW_SECONDS):
+        self.racy_window = racy_window
+        self._entries: Dict[Tuple[str, Parser], CachedConfig] = {}
+        self._failed: Dict[Tuple[str, Parser], Tuple[Signature, str]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def load(self, path: Path, parser: Callable[[str], T]) -> T:
+        """Return `parser(text)` for `path`, re-parsing only when the file changed.
+
+        Raises `FileNotFoundError` if the file is missing, and propagates
+        parser errors on the first load of a file.
+        """
+        path = Path(path)
+        key = (str(path.resolve()), parser)
+        stat = path.stat()
+        signature = _signature(stat)
+        entry = self._entries.get(key)
+        if entry is not None and entry.signature == signature and not self._is_racy(entry):
+            return entry.value
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if entry is not None and entry.digest == digest:
+            self._store(key, entry, signature=signature)
+            return entry.value
+        failed = self._failed.get(key)
+        if entry is not None and failed == (signature, digest):
+            return entry.value
+
+        try:
+            value = parser(data.decode("utf-8"))
+        except Exception as exc:
+            if entry is None:
+                raise
+            # Keep serving the last good config until the file is fixed.
+            self._failed[key] = (signature, digest)
+            warnings.warn(
+                f"Ignoring invalid config change in {path}: {exc}", RuntimeWarning, stacklevel=2
+            )
+            return entry.value
+
+        with self._lock:
+            self._generation += 1
+            self._entries[key] = CachedConfig(
+                path=path,
+                value=value,
+                signature=signature,
+                digest=digest,
+                loaded_at=time.time(),
+                generation=self._generation,
+            )
+            self._failed.pop(key, None)
+        return value
+
+    def _is_racy(self, entry: CachedConfig) -> bool:
+        return entry.signature[0] / 1e9 >= entry.loaded_at - self.racy_window
+
+    def _store(self, key: Tuple[str, Parser], entry: CachedConfig, *, signature: Signature) -> None:
+        # Same content under a new stat signature (e.g. `touch`): no new generation.
+        with self._lock:
+            self._entries[key] = CachedConfig(
+                path=entry.path,
+                value=entry.value,
+                signature=signature,
+                digest=entry.digest,
+                loaded_at=time.time(),
+                generation=entry.generation,
+            )
+
+    def entry(self, path: Path, parser: Parser) -> Optional[CachedConfig]:
+        return self._entries.get((str(Path(path).resolve()), parser))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._failed.clear()
+
+
+CONFIG_CACHE = ConfigCache()
+
+
+def config_generation() -> int:
+    """Current generation of the process-wide config cache."""
+    return CONFIG_CACHE.generation
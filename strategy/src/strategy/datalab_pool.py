@@ -0,0 +1,461 @@
+"""Process-wide pool of long-lived Datalab clients with per-key concurrency caps.
+
+Building a `DatalabClient` per document opens a new HTTP session (and TLS
+handshake) for every PDF, and the SDK's sync client even closes its session
+after every call. The pool's default clients therefore hand their converts to
+a `DatalabLoop`: a background event loop holding one long-lived
+`AsyncDatalabClient` per API key, so every sync convert for a key shares one
+session and its open connections. The pool lends each client to one caller
+at a time and caps how many converts run at once for each key. Callers over
+the cap wait in a first-come, first-served queue instead of racing for a
+slot, so a burst of uploads cannot starve an earlier one. `stats()` reports in-flight and
+queued requests, wait time and utilization per key.
+
+`AsyncDatalabClientPool` is the event-loop counterpart used by
+`execute_async`. Its converts hold no thread while they wait on Datalab, so
+its cap is much higher.
+
+Sizing comes from the environment unless passed explicitly:
+
+- `TAXMAN_DATALAB_MAX_IN_FLIGHT`: concurrent converts per API key (default: 4)
+- `TAXMAN_DATALAB_ASYNC_MAX_IN_FLIGHT`: the same for the async pool (default: 256)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional
+
+from .base import StrategyError
+from .pool import env_int
+
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_ASYNC_MAX_IN_FLIGHT = 256
+
+ClientFactory = Callable[[str], Any]
+
+
+def datalab_client(api_key: str) -> "LoopDatalabClient":
+    """Build a sync client backed by the process-wide `DatalabLoop`."""
+    try:
+        import datalab_sdk  # type: ignore  # noqa: F401
+    except ImportError as exc:  # pragma: no cover - dependency guard
+        raise StrategyError(
+            "datalab-python-sdk is required for ParsePdfToDatalabMarkdown"
+        ) from exc
+    return get_datalab_loop().client(api_key)
+
+
+def async_datalab_client(api_key: str) -> Any:
+    """Build an `AsyncDatalabClient`; it must be used on a single event loop."""
+    try:
+        from datalab_sdk import AsyncDatalabClient  # type: ignore
+    except ImportError as exc:  # pragma: no cover - dependency guard
+        raise StrategyError(
+            "datalab-python-sdk is required for ParsePdfToDatalabMarkdown"
+        ) from exc
+    return AsyncDatalabClient(api_key=api_key)
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Short, non-reversible label for an API key in stats and metrics."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+class DatalabLoop:
+    """An event loop on a daemon thread that owns one async client per API key.
+
+    The SDK's `DatalabClient` runs each call under `async with` its async
+    client, which closes the aiohttp session, and with it every pooled
+    connection, as soon as the call returns. Sync callers submit their
+    converts here instead, where each key's client and connector stay open
+    until `close()`.
+    """
+
+    def __init__(self, client_factory: ClientFactory = async_datalab_client):
+        self.client_factory = client_factory
+        self._clients: Dict[str, Any] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _running_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="datalab-loop", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    async def _call(self, api_key: str, method: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        # Only the loop's thread touches `_clients`, so it needs no lock.
+        client = self._clients.get(api_key)
+        if client is None:
+            client = self._clients[api_key] = self.client_factory(api_key)
+        return await getattr(client, method)(*args, **kwargs)
+
+    def run(self, api_key: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Await `method` of the key's client on the loop and return its result."""
+        coroutine = self._call(api_key, method, args, kwargs)
+        return asyncio.run_coroutine_threadsafe(coroutine, self._running_loop()).result()
+
+    def client(self, api_key: str) -> "LoopDatalabClient":
+        """A sync client for `api_key` whose converts run on this loop."""
+        return LoopDatalabClient(self, api_key)
+
+    async def _aclose(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            close = getattr(client, "close", None)
+            if close is not None:
+                await close()
+
+    def close(self) -> None:
+        """Close the clients and stop the loop; the next call starts a new one."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class LoopDatalabClient:
+    """Sync stand-in for the SDK's `DatalabClient` that converts on a `DatalabLoop`.
+
+    It holds no connection of its own: every instance for a key shares that
+    key's session, so the pool may lend several at once.
+    """
+
+    def __init__(self, loop: DatalabLoop, api_key: str):
+        self.loop = loop
+        self.api_key = api_key
+
+    def convert(self, *args: Any, **kwargs: Any) -> Any:
+        return self.loop.run(self.api_key, "convert", *args, **kwargs)
+
+
+@dataclass
+class ClientPoolStats:
+    """Point-in-time counters for one API key's slot in a `DatalabClientPool`."""
+
+    max_in_flight: int
+    in_flight: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    clients: int = 0
+    leases: int = 0
+    failures: int = 0
+    wait_seconds: float = 0.0
+    busy_seconds: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Share of the concurrency cap in use right now."""
+        return self.in_flight / self.max_in_flight if self.max_in_flight else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["utilization"] = round(self.utilization, 4)
+        return data
+
+
+class _KeySlot:
+    """Idle clients, FIFO waiters and counters for one API key."""
+
+    def __init__(self, max_in_flight: int):
+        self.idle: List[Any] = []
+        self.waiters: Deque[object] = deque()
+        self.stats = ClientPoolStats(max_in_flight=max_in_flight)
+
+
+class DatalabClientPool:
+    """Lend long-lived clients per API key, at most `max_in_flight` at a time."""
+
+    def __init__(
+        self,
+        client_factory: ClientFactory = datalab_client,
+        *,
+        max_in_flight: Optional[int] = None,
+    ):
+        self.client_factory = client_factory
+        self.max_in_flight = (
+            max_in_flight or env_int("TAXMAN_DATALAB_MAX_IN_FLIGHT") or DEFAULT_MAX_IN_FLIGHT
+        )
+        self._slots: Dict[str, _KeySlot] = {}
+        self._condition = threading.Condition()
+
+    def _slot(self, api_key: str) -> _KeySlot:
+        slot = self._slots.get(api_key)
+        if slot is None:
+            slot = _KeySlot(self.max_in_flight)
+            self._slots[api_key] = slot
+        return slot
+
+    def _acquire(self, api_key: str) -> _KeySlot:
+        started = time.perf_counter()
+        with self._condition:
+            slot = self._slot(api_key)
+            stats = slot.stats
+            if slot.waiters or stats.in_flight >= stats.max_in_flight:
+                ticket = object()
+                slot.waiters.append(ticket)
+                stats.queued += 1
+                stats.max_queued = max(stats.max_queued, stats.queued)
+                # Only the head of the queue may take a freed slot.
+                while slot.waiters[0] is not ticket or stats.in_flight >= stats.max_in_flight:
+                    self._condition.wait()
+                slot.waiters.popleft()
+                stats.queued -= 1
+                self._condition.notify_all()
+            stats.in_flight += 1
+            stats.leases += 1
+            stats.wait_seconds += time.perf_counter() - started
+        return slot
+
+    def _release(self, slot: _KeySlot, client: Any, busy: float, *, failed: bool) -> None:
+        with self._condition:
+            if client is not None:
+                slot.idle.append(client)
+            slot.stats.in_flight -= 1
+            slot.stats.busy_seconds += busy
+            if failed:
+                slot.stats.failures += 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def lease(self, api_key: str) -> Iterator[Any]:
+        """Borrow a client for `api_key`, waiting in line while the key is at its cap.
+
+        The client goes back to the idle list afterwards. If the body raises,
+        the client is discarded so a broken connection is not reused.
+        """
+        slot = self._acquire(api_key)
+        client = None
+        failed = True
+        started = time.perf_counter()
+        try:
+            with self._condition:
+                client = slot.idle.pop() if slot.idle else None
+            if client is None:
+                client = self.client_factory(api_key)
+                with self._condition:
+                    slot.stats.clients += 1
+            yield client
+            failed = False
+        finally:
+            if failed and client is not None:
+                _close(client)
+                with self._condition:
+                    slot.stats.clients -= 1
+                client = None
+            self._release(slot, client, time.perf_counter() - started, failed=failed)
+
+    def stats(self) -> Dict[str, ClientPoolStats]:
+        """Counters per API key fingerprint."""
+        with self._condition:
+            return {
+                key_fingerprint(api_key): ClientPoolStats(**asdict(slot.stats))
+                for api_key, slot in self._slots.items()
+            }
+
+    def render_prometheus(self) -> str:
+        """Render per-key utilization and queueing in the Prometheus text format."""
+        return _render_pool_stats("taxman_datalab_pool", self.stats())
+
+    def close(self) -> None:
+        """Close and drop the idle clients."""
+        with self._condition:
+            idle = [client for slot in self._slots.values() for client in slot.idle]
+            for slot in self._slots.values():
+                slot.stats.clients -= len(slot.idle)
+                slot.idle.clear()
+        for client in idle:
+            _close(client)
+
+
+class _AsyncKeySlot:
+    """The shared client and FIFO semaphore for one API key on one event loop."""
+
+    def __init__(self, max_in_flight: int):
+        self.client: Any = None
+        self.semaphore = asyncio.Semaphore(max_in_flight)
+
+
+class AsyncDatalabClientPool:
+    """One long-lived async client per API key, shared by up to `max_in_flight` converts.
+
+    An async client's HTTP session already multiplexes concurrent requests,
+    so every caller for a key shares one client. The cap bounds how many
+    converts that client runs at once, and waiters are served in arrival
+    order. Clients and semaphores belong to an event loop, so each loop that
+    uses the pool gets its own. The stats are per key across loops.
+    """
+
+    def __init__(
+        self,
+        client_factory: ClientFactory = async_datalab_client,
+        *,
+        max_in_flight: Optional[int] = None,
+    ):
+        self.client_factory = client_factory
+        self.max_in_flight = (
+            max_in_flight
+            or env_int("TAXMAN_DATALAB_ASYNC_MAX_IN_FLIGHT")
+            or DEFAULT_ASYNC_MAX_IN_FLIGHT
+        )
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _AsyncKeySlot]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats: Dict[str, ClientPoolStats] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, api_key: str) -> _AsyncKeySlot:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._loops.setdefault(loop, {})
+            slot = slots.get(api_key)
+            if slot is None:
+                slot = _AsyncKeySlot(self.max_in_flight)
+                slots[api_key] = slot
+            self._stats.setdefault(api_key, ClientPoolStats(max_in_flight=self.max_in_flight))
+        return slot
+
+    def _update(self, api_key: str, **changes: float) -> None:
+        with self._lock:
+            stats = self._stats[api_key]
+            for name, amount in changes.items():
+                setattr(stats, name, getattr(stats, name) + amount)
+            stats.max_queued = max(stats.max_queued, stats.queued)
+
+    @asynccontextmanager
+    async def lease(self, api_key: str) -> AsyncIterator[Any]:
+        """Borrow the loop's client for `api_key`, waiting in line while the key is at its cap."""
+        slot = self._slot(api_key)
+        started = time.perf_counter()
+        queued = slot.semaphore.locked()
+        if queued:
+            self._update(api_key, queued=1)
+        try:
+            await slot.semaphore.acquire()
+        finally:
+            if queued:
+                self._update(api_key, queued=-1)
+        busy_from = time.perf_counter()
+        self._update(api_key, in_flight=1, leases=1, wait_seconds=busy_from - started)
+        failed = True
+        try:
+            if slot.client is None:
+                slot.client = self.client_factory(api_key)
+                self._update(api_key, clients=1)
+            yield slot.client
+            failed = False
+        finally:
+            self._update(
+                api_key,
+                in_flight=-1,
+                failures=int(failed),
+                busy_seconds=time.perf_counter() - busy_from,
+            )
+            slot.semaphore.release()
+
+    def stats(self) -> Dict[str, ClientPoolStats]:
+        """Counters per API key fingerprint."""
+        with self._lock:
+            return {
+                key_fingerprint(api_key): ClientPoolStats(**asdict(stats))
+                for api_key, stats in self._stats.items()
+            }
+
+    def render_prometheus(self) -> str:
+        """Render per-key utilization and queueing in the Prometheus text format."""
+        return _render_pool_stats("taxman_datalab_async_pool", self.stats())
+
+    async def aclose(self) -> None:
+        """Close the clients opened on the running event loop."""
+        with self._lock:
+            slots = self._loops.pop(asyncio.get_running_loop(), {})
+            for api_key, slot in slots.items():
+                if slot.client is not None:
+                    self._stats[api_key].clients -= 1
+        for slot in slots.values():
+            close = getattr(slot.client, "close", None)
+            if close is not None:
+                await close()
+
+
+def _render_pool_stats(prefix: str, stats: Dict[str, ClientPoolStats]) -> str:
+    series = (
+        ("in_flight", "gauge", "Convert requests currently running.", "in_flight"),
+        ("queued", "gauge", "Convert requests waiting for a slot.", "queued"),
+        ("utilization", "gauge", "Share of the concurrency cap in use.", "utilization"),
+        ("clients", "gauge", "Long-lived clients currently pooled.", "clients"),
+        ("leases_total", "counter", "Convert requests served.", "leases"),
+        ("failures_total", "counter", "Convert requests that raised.", "failures"),
+        ("wait_seconds_total", "counter", "Time spent queued for a slot.", "wait_seconds"),
+        ("busy_seconds_total", "counter", "Time clients spent on requests.", "busy_seconds"),
+    )
+    lines = []
+    for name, kind, description, field_name in series:
+        lines.append(f"# HELP {prefix}_{name} {description}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for fingerprint, entry in sorted(stats.items()):
+            value = entry.as_dict()[field_name]
+            rendered = f"{value:.6f}" if isinstance(value, float) else str(value)
+            lines.append(f'{prefix}_{name}{{key="{fingerprint}"}} {rendered}')
+    return "\n".join(lines) + "\n"
+
+
+def _close(client: Any) -> None:
+    close = getattr(client, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:  # pragma: no cover - best-effort cleanup
+            pass
+
+
+_DATALAB_POOL: Optional[DatalabClientPool] = None
+_DATALAB_LOOP: Optional[DatalabLoop] = None
+_DATALAB_POOL_LOCK = threading.Lock()
+
+
+def get_datalab_loop() -> DatalabLoop:
+    """Return the process-wide loop behind the sync clients, creating it on first use."""
+    global _DATALAB_LOOP
+    with _DATALAB_POOL_LOCK:
+        if _DATALAB_LOOP is None:
+            _DATALAB_LOOP = DatalabLoop()
+        return _DATALAB_LOOP
+
+
+def get_datalab_pool() -> DatalabClientPool:
+    """Return the process-wide pool of SDK clients, creating it on first use."""
+    global _DATALAB_POOL
+    with _DATALAB_POOL_LOCK:
+        if _DATALAB_POOL is None:
+            _DATALAB_POOL = DatalabClientPool()
+        return _DATALAB_POOL
+
+
+_ASYNC_DATALAB_POOL: Optional[AsyncDatalabClientPool] = None
+
+
+def get_async_datalab_pool() -> AsyncDatalabClientPool:
+    """Return the process-wide pool of async SDK clients, creating it on first use."""
+    global _ASYNC_DATALAB_POOL
+    with _DATALAB_POOL_LOCK:
+        if _ASYNC_DATALAB_POOL is None:
+            _ASYNC_DATALAB_POOL = AsyncDatalabClientPool()
+        return _ASYNC_DATALAB_POOL
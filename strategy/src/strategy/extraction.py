@@ -5,14 +5,26 @@ from pathlib import Path
 from typing import Dict, Iterable, Mapping, Optional, Sequence
 
 from strategy.models.k1.pydantic_model import map_to_generic_lines
+from strategy.k1.document_index import DocumentIndex
 from strategy.k1.regex_extractor import (
     DOC1_FIELD_TEMPLATE,
     ParsedK1RegexExtractor,
+    RegexExtractionEngine,
+    get_extraction_engine,
     load_field_strategy_config,
 )
+from strategy.k1.versions import STRATEGY_VERSIONS
 
 from .base import BaseStrategy, StrategyError, StrategyResult
 
+# Name of the shared `DocumentIndex` in `WorkflowContext.parsed_artifact`.
+DOCUMENT_INDEX_ARTIFACT = "k1_document_index"
+
+
+def _document_index(context) -> DocumentIndex:
+    """The run's parsed document, built by whichever activity needs it first."""
+    return context.parsed_artifact(DOCUMENT_INDEX_ARTIFACT, DocumentIndex)
+
 
 @dataclass
 class NumericExtractionResult:
@@ -31,7 +43,8 @@ class ExtractNumericValues(BaseStrategy[NumericExtractionResult]):
         if not context.parsed_markdown:
             raise StrategyError("parsed_markdown is required before numeric extraction")
 
-        extractor = ParsedK1RegexExtractor(context.parsed_markdown)
+        index = _document_index(context)
+        extractor = ParsedK1RegexExtractor(context.parsed_markdown, index=index)
         numeric_fields: Dict[str, str] = {}
         for key, value in extractor.base_values.items():
             if value and value != "0":
@@ -45,48 +58,77 @@ class ExtractNumericValues(BaseStrategy[NumericExtractionResult]):
                 contexts=dict(extractor.table_contexts),
             ),
             context_updates={"numeric_values": numeric_fields},
-            artifacts={"table_contexts": extractor.table_contexts},
+            artifacts={
+                "table_contexts": extractor.table_contexts,
+                # Every number in the document, keyed by token id, for reference.
+                "numeric_tokens": index.numeric_tokens.as_dict(),
+            },
         )
 
 
 class ExtractRegexK1(BaseStrategy[Dict[str, str]]):
-    """Run the regex-based extractor for a given strategy config version."""
+    """Run the regex-based extractor for a given strategy config version.
+
+    `version` selects a registered strategy version whose engine is compiled
+    once per process, and defaults to the manifest's `default`; unknown
+    versions raise `UnknownStrategyVersionError` here rather than at
+    execution. An explicit `strategy_config_path` bypasses the registry and
+    is read on every run.
+    """
 
     def __init__(
         self,
         *,
-        version: str = "v1.0.0",
+        version: Optional[str] = None,
         strategy_config_path: Optional[Path] = None,
         field_defaults: Optional[Mapping[str, str]] = None,
+        candidate_matrix: bool = False,
     ):
+        version = version or STRATEGY_VERSIONS.default_version
         super().__init__(name="ExtractRegexK1", version=version, activity="extract_fields")
         self.strategy_config_path = strategy_config_path
         self.field_defaults = field_defaults or DOC1_FIELD_TEMPLATE
+        # Also record every registered strategy's value per field (diagnostics).
+        self.candidate_matrix = candidate_matrix
+        if strategy_config_path is None:
+            STRATEGY_VERSIONS.get(version)
 
     def _load_config(self) -> Mapping[str, str]:
         if self.strategy_config_path:
             return load_field_strategy_config(path=self.strategy_config_path)
-        return load_field_strategy_config()
+        return STRATEGY_VERSIONS.get(self.version).strategy_config
+
+    def _engine(self) -> RegexExtractionEngine:
+        if self.strategy_config_path:
+            return get_extraction_engine(self._load_config())
+        return STRATEGY_VERSIONS.engine(self.version)
 
     def execute(self, context):
         if not context.parsed_markdown:
             raise StrategyError("parsed_markdown is required before regex extraction")
 
-        extractor = ParsedK1RegexExtractor(
+        engine = self._engine()
+        extractor = engine.document(
             context.parsed_markdown,
             field_defaults=self.field_defaults,
-            strategy_config=self._load_config(),
+            index=_document_index(context),
         )
         field_values = extractor.extract()
         generic_lines = map_to_generic_lines(field_values)
+        artifacts = {
+            "generic_lines": generic_lines.model_dump(),
+            "used_strategies": extractor.used_strategies,
+            "contexts": extractor.contexts,
+            "prefilter": extractor.prefilter_stats,
+            "slowest_strategies": extractor.slowest_strategies(),
+            "strategy_metrics": extractor.strategy_metrics(),
+        }
+        if self.candidate_matrix:
+            artifacts["candidate_matrix"] = extractor.candidate_matrix().as_dict()
 
         return StrategyResult(
             output=field_values,
-            artifacts={
-                "generic_lines": generic_lines.model_dump(),
-                "used_strategies": extractor.used_strategies,
-                "contexts": extractor.contexts,
-            },
+            artifacts=artifacts,
             context_updates={
                 "field_values": field_values,
                 "metadata": {**context.metadata, "generic_lines": generic_lines},
@@ -105,12 +147,24 @@ class InferExtractionCompleteness(BaseStrategy[Dict[str, Sequence[str]]]):
         ]
 
     def execute(self, context):
-        if not context.field_values:
-            raise StrategyError("field_values is required before inference")
+        field_values = context.field_values
+        artifacts: Dict[str, object] = {"required_fields": self.required_fields}
+        if not field_values:
+            if not context.parsed_markdown:
+                raise StrategyError("field_values is required before inference")
+            # No full extraction ran; extract just the fields being checked.
+            extractor = get_extraction_engine().document(
+                context.parsed_markdown, index=_document_index(context)
+            )
+            try:
+                field_values = extractor.extract(fields=self.required_fields)
+            except ValueError as exc:
+                raise StrategyError(str(exc)) from exc
+            artifacts["extracted_fields"] = field_values
 
         missing = []
         for required_field in self.required_fields:
-            value = context.field_values.get(required_field, "")
+            value = field_values.get(required_field, "")
             if value in ("", "0", None):
                 missing.append(required_field)
 
@@ -121,5 +175,5 @@ class InferExtractionCompleteness(BaseStrategy[Dict[str, Sequence[str]]]):
         return StrategyResult(
             output=warnings,
             context_updates={"inference": warnings},
-            artifacts={"required_fields": self.required_fields},
+            artifacts=artifacts,
         )
@@ -1,19 +1,58 @@
 """K-1 extraction utilities used by strategy workflows."""
 
+from .batch import BatchResult, BatchStats, extract_batch, iter_extract_batch
+from .candidates import Candidate, CandidateMatrix
+from .document_index import DocumentIndex
+from .numeric_index import NumericToken, NumericTokenIndex
 from .regex_extractor import (
     DOC1_FIELD_TEMPLATE,
     FIELD_KEYS,
     ParsedK1RegexExtractor,
+    RegexExtractionEngine,
     extract_fields_from_file,
+    get_extraction_engine,
     load_document_values,
+    cached_field_strategy_config,
     load_field_strategy_config,
 )
+from .tables import MarkdownTable, TableIndex, TableRow
+from .tuner import TuningReport, load_tuning_samples, tune_field_strategies
+from .versions import (
+    STRATEGY_VERSIONS,
+    StrategyRegistry,
+    StrategyVersion,
+    UnknownStrategyVersionError,
+    get_strategy_engine,
+)
 
 __all__ = [
+    "BatchResult",
+    "BatchStats",
+    "Candidate",
+    "CandidateMatrix",
     "DOC1_FIELD_TEMPLATE",
+    "DocumentIndex",
     "FIELD_KEYS",
+    "MarkdownTable",
+    "NumericToken",
+    "NumericTokenIndex",
     "ParsedK1RegexExtractor",
+    "RegexExtractionEngine",
+    "STRATEGY_VERSIONS",
+    "StrategyRegistry",
+    "StrategyVersion",
+    "TableIndex",
+    "TableRow",
+    "TuningReport",
+    "UnknownStrategyVersionError",
+    "extract_batch",
     "extract_fields_from_file",
+    "get_extraction_engine",
+    "get_strategy_engine",
+    "iter_extract_batch",
     "load_document_values",
+    "cached_field_strategy_config",
     "load_field_strategy_config",
+    "load_tuning_samples",
+    "tune_field_strategies",
 ]
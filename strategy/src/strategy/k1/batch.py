@@ -0,0 +1,260 @@
+"""Extract K-1 fields from many markdown documents across a process pool."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from ..pool import WorkerPool, get_cpu_pool
+from .regex_extractor import get_extraction_engine, load_field_strategy_config
+
+
+DEFAULT_CHUNK_SIZE = 16
+# Paths are read inside the worker; plain strings are treated as markdown text.
+BatchDocument = Union[Path, str, Tuple[str, str]]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome for one document in a batch."""
+
+    source: str
+    values: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchStats:
+    """Running throughput counters, updated as results stream back."""
+
+    documents: int = 0
+    failures: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    finished: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return max(end - self.started, 0.0)
+
+    @property
+    def docs_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.documents / elapsed if elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Extracted {self.documents} documents ({self.failures} failed) "
+            f"in {self.elapsed:.2f}s: {self.docs_per_second:.1f} docs/sec"
+        )
+
+
+def _normalize_document(position: int, document: BatchDocument) -> Tuple[str, Optional[Path], Optional[str]]:
+    if isinstance(document, Path):
+        return str(document), document, None
+    if isinstance(document, tuple):
+        name, text = document
+        return str(name), None, text
+    if isinstance(document, str):
+        return f"document-{position}", None, document
+    raise TypeError(f"Unsupported batch document: {type(document).__name__}")
+
+
+def _extract_chunk(
+    chunk: Sequence[Tuple[str, Optional[Path], Optional[str]]],
+    strategy_config: Mapping[str, str],
+    field_defaults: Optional[Mapping[str, str]],
+    fields: Optional[Sequence[str]],
+) -> List[BatchResult]:
+    # Runs in the worker: the engine is built once per process and reused.
+    engine = get_extraction_engine(strategy_config)
+    results: List[BatchResult] = []
+    for source, path, text in chunk:
+        try:
+            if path is not None:
+                text = path.read_text(encoding="utf-8")
+            extractor = engine.document(text or "", field_defaults=field_defaults)
+            results.append(BatchResult(source=source, values=extractor.extract(fields)))
+        except (OSError, UnicodeDecodeError, ValueError) as exc:
+            results.append(BatchResult(source=source, error=str(exc)))
+    return results
+
+
+def _chunks(
+    documents: Iterable[BatchDocument], size: int
+) -> Iterator[List[Tuple[str, Optional[Path], Optional[str]]]]:
+    normalized = (
+        _normalize_document(position, document)
+        for position, document in enumerate(documents)
+    )
+    while True:
+        chunk = list(islice(normalized, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_extract_batch(
+    documents: Iterable[BatchDocument],
+    *,
+    strategy_config: Optional[Mapping[str, str]] = None,
+    field_defaults: Optional[Mapping[str, str]] = None,
+    fields: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: Optional[BatchStats] = None,
+) -> Iterator[BatchResult]:
+    """Yield a `BatchResult` per document as soon as its chunk finishes.
+
+    Documents are dispatched in chunks of `chunk_size`, with at most two
+    chunks per worker in flight so very large inputs are consumed lazily.
+    Results arrive in completion order, not input order. By default the shared
+    CPU pool is used; `workers=N` runs on a dedicated pool of N processes and
+    `workers=1` runs inline. Pass a `BatchStats` to observe throughput.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    config = dict(strategy_config) if strategy_config else load_field_strategy_config()
+    defaults = dict(field_defaults) if field_defaults else None
+    selected = list(fields) if fields is not None else None
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    stats = stats if stats is not None else BatchStats()
+
+    def _record(results: List[BatchResult]) -> Iterator[BatchResult]:
+        for result in results:
+            stats.documents += 1
+            if not result.ok:
+                stats.failures += 1
+            yield result
+
+    chunks = _chunks(documents, chunk_size)
+    try:
+        if workers == 1:
+            for chunk in chunks:
+                yield from _record(_extract_chunk(chunk, config, defaults, selected))
+            return
+
+        pool = get_cpu_pool() if workers is None else WorkerPool(workers)
+        with nullcontext(pool) if workers is None else pool:
+            pending: set[Future] = set()
+            queue = deque(islice(chunks, pool.max_workers * 2))
+            while queue or pending:
+                while queue:
+                    pending.add(
+                        pool.submit(
+                            _extract_chunk, queue.popleft(), config, defaults, selected
+                        )
+                    )
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                queue.extend(islice(chunks, len(done)))
+                for future in done:
+                    yield from _record(future.result())
+    finally:
+        stats.finished = time.perf_counter()
+
+
+def extract_batch(
+    documents: Iterable[BatchDocument], **kwargs
+) -> Tuple[List[BatchResult], BatchStats]:
+    """Collect `iter_extract_batch` results into a list alongside its stats."""
+    stats = BatchStats()
+    results = list(iter_extract_batch(documents, stats=stats, **kwargs))
+    return results, stats
+
+
+def _expand_paths(paths: Iterable[Path]) -> Iterator[Path]:
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(path.rglob("*.md"))
+        else:
+            yield path
+
+
+def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run the K-1 regex extractor over many parsed markdown documents."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="Markdown files or directories (searched recursively for *.md).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: the shared CPU pool; 1 runs inline).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Documents per dispatched task (default: {DEFAULT_CHUNK_SIZE}).",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=None,
+        help="Field strategy config YAML (default: regex_field_config.yaml).",
+    )
+    parser.add_argument(
+        "--fields",
+        default=None,
+        help="Comma-separated subset of fields to extract.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Write JSON lines here instead of stdout.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    strategy_config = (
+        load_field_strategy_config(path=args.config) if args.config else None
+    )
+    fields = [name.strip() for name in args.fields.split(",")] if args.fields else None
+
+    stats = BatchStats()
+    output = args.output.open("w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for result in iter_extract_batch(
+            _expand_paths(args.paths),
+            strategy_config=strategy_config,
+            fields=fields,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            stats=stats,
+        ):
+            record = {"source": result.source, "values": result.values}
+            if result.error is not None:
+                record["error"] = result.error
+            output.write(json.dumps(record) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(stats.summary(), file=sys.stderr)
+    return 1 if stats.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
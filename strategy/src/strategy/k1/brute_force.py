@@ -0,0 +1,196 @@
+"""Time-budgeted search over generated brute-force patterns.
+
+The pattern set for a field is compiled once per process and evaluated in
+priority order against the document snippets that mention the field. The
+search stops at the first confident hit, or when its time budget runs out.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+from .budget import ISOLATION_GRACE_SECONDS, StrategyTimeout, time_limit
+
+
+BRUTE_FORCE_FIELD_BUDGET_SECONDS = 0.25
+BRUTE_FORCE_DOCUMENT_BUDGET_SECONDS = 2.0
+# Searches smaller than this (patterns x snippet characters) are not worth a
+# round trip to the process pool.
+BRUTE_FORCE_PARALLEL_WORKLOAD = 5_000_000
+_NUMERIC_VALUE = re.compile(r"[0-9$,.()%\- ]*\d[0-9$,.()%\- ]*")
+# Text hits need a few letters so markup fragments such as `br` do not count.
+_TEXT_VALUE = re.compile(r"(?:[^A-Za-z]*[A-Za-z]){3}")
+
+PatternSpec = Tuple[str, bool]
+CompiledPattern = Tuple[int, "re.Pattern[str]", str, bool]
+
+
+@dataclass(frozen=True)
+class BruteForceMatch:
+    """The generated pattern that produced a confident value."""
+
+    value: str
+    pattern: str
+    numeric: bool
+    pattern_index: int
+    snippet: str
+    # Where the value sits within `snippet`.
+    span: Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class BruteForceOutcome:
+    """Result of one field's search, including why it stopped."""
+
+    match: Optional[BruteForceMatch]
+    elapsed: float
+    patterns_tried: int
+    timed_out: bool = False
+
+
+@lru_cache(maxsize=256)
+def compile_pattern_set(patterns: Tuple[PatternSpec, ...]) -> Tuple[CompiledPattern, ...]:
+    """Compile a generated pattern set once; invalid patterns are dropped."""
+    compiled: list[CompiledPattern] = []
+    for position, (pattern, numeric) in enumerate(patterns):
+        try:
+            compiled.append((position, re.compile(pattern), pattern, numeric))
+        except re.error:
+            continue
+    return tuple(compiled)
+
+
+def _confident_value(raw: str, numeric: bool) -> Optional[str]:
+    value = raw.strip().rstrip("|").strip()
+    if not value:
+        return None
+    if numeric:
+        return value if _NUMERIC_VALUE.fullmatch(value) else None
+    return value if _TEXT_VALUE.match(value) else None
+
+
+def search_patterns(
+    patterns: Tuple[PatternSpec, ...],
+    snippets: Sequence[str],
+    budget_seconds: float,
+    *,
+    offset: int = 0,
+) -> BruteForceOutcome:
+    """Try patterns in order over every snippet and stop at the first confident hit.
+
+    `offset` is added to reported pattern indexes so slices searched in
+    different workers can be ranked against each other.
+    """
+    # Compiling is a one-off per pattern set and does not count against the budget.
+    compiled_patterns = compile_pattern_set(patterns)
+    started = time.perf_counter()
+    deadline = started + max(budget_seconds, 0.0)
+    tried = 0
+    try:
+        # The deadline check only runs between patterns; the timer also stops
+        # a single pattern that backtracks catastrophically.
+        with time_limit(budget_seconds):
+            for position, compiled, pattern, numeric in compiled_patterns:
+                if time.perf_counter() >= deadline:
+                    break
+                tried += 1
+                for snippet in snippets:
+                    found = compiled.search(snippet)
+                    if not found or found.lastindex is None:
+                        continue
+                    value = _confident_value(found.group(1), numeric)
+                    if value is None:
+                        continue
+                    return BruteForceOutcome(
+                        match=BruteForceMatch(
+                            value=value,
+                            pattern=pattern,
+                            numeric=numeric,
+                            pattern_index=offset + position,
+                            snippet=snippet,
+                            span=found.span(1),
+                        ),
+                        elapsed=time.perf_counter() - started,
+                        patterns_tried=tried,
+                    )
+            else:
+                return BruteForceOutcome(
+                    match=None, elapsed=time.perf_counter() - started, patterns_tried=tried
+                )
+    except StrategyTimeout:
+        pass
+    return BruteForceOutcome(
+        match=None,
+        elapsed=time.perf_counter() - started,
+        patterns_tried=tried,
+        timed_out=True,
+    )
+
+
+def search_patterns_parallel(
+    executor: Executor,
+    patterns: Tuple[PatternSpec, ...],
+    snippets: Sequence[str],
+    budget_seconds: float,
+    *,
+    slices: int,
+    grace_seconds: float = ISOLATION_GRACE_SECONDS,
+) -> BruteForceOutcome:
+    """Split the pattern list across the pool and keep the highest-priority hit.
+
+    Once a slice reports a hit, slices that rank after it are cancelled or
+    ignored; earlier slices are still awaited so the winner is the same one
+    a serial search would pick. Slices still running `grace_seconds` after
+    the budget are abandoned and the search reports a timeout.
+    """
+    started = time.perf_counter()
+    give_up = started + max(budget_seconds, 0.0) + grace_seconds
+    size = max(1, -(-len(patterns) // max(1, slices)))
+    futures: dict[Future, int] = {
+        executor.submit(
+            search_patterns,
+            patterns[start : start + size],
+            tuple(snippets),
+            budget_seconds,
+            offset=start,
+        ): start
+        for start in range(0, len(patterns), size)
+    }
+    best: Optional[BruteForceMatch] = None
+    tried = 0
+    timed_out = False
+    pending = set(futures)
+    while pending:
+        done, pending = wait(
+            pending, timeout=max(0.0, give_up - time.perf_counter()), return_when=FIRST_COMPLETED
+        )
+        if not done:
+            for future in pending:
+                future.cancel()
+            timed_out = True
+            break
+        for future in done:
+            if future.cancelled():
+                continue
+            outcome = future.result()
+            tried += outcome.patterns_tried
+            timed_out = timed_out or outcome.timed_out
+            if outcome.match and (
+                best is None or outcome.match.pattern_index < best.pattern_index
+            ):
+                best = outcome.match
+        if best is not None:
+            for future in list(pending):
+                if futures[future] > best.pattern_index and future.cancel():
+                    pending.discard(future)
+    return BruteForceOutcome(
+        match=best,
+        elapsed=time.perf_counter() - started,
+        patterns_tried=tried,
+        timed_out=timed_out and best is None,
+    )
@@ -0,0 +1,138 @@
+"""Time budgets for strategy execution and a process-wide slow-pattern log.
+
+Python's regex engine checks for signals while matching, so on the main
+thread of a process (CLI runs, batch and pool workers) a `SIGALRM` timer can
+abort a catastrophically backtracking pattern. Other threads (e.g. request
+threads) cannot take the signal; there the extraction engine runs the whole
+document on a CPU `WorkerPool` worker, whose main thread enforces the
+budgets from the moment it picks the job up.
+"""
+
+from __future__ import annotations
+
+import signal
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+
+STRATEGY_BUDGET_SECONDS = 0.5
+DOCUMENT_BUDGET_SECONDS = 5.0
+# Documents shorter than this are extracted on the calling thread.
+ISOLATED_DOCUMENT_MIN_CHARS = 2048
+# How long past the budget to wait for a worker (queueing and IPC).
+ISOLATION_GRACE_SECONDS = 1.0
+
+
+class StrategyTimeout(Exception):
+    """Raised inside a strategy whose time budget expired."""
+
+
+def interruptible_here() -> bool:
+    """Whether `time_limit` can interrupt code running on this thread."""
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+def _can_interrupt() -> bool:
+    return (
+        interruptible_here()
+        # Never clobber a timer someone else (or an outer budget) installed.
+        and signal.getitimer(signal.ITIMER_REAL)[0] == 0
+    )
+
+
+@contextmanager
+def time_limit(seconds: float) -> Iterator[bool]:
+    """Abort the body with `StrategyTimeout` after `seconds`, where possible.
+
+    Yields whether the limit is actually enforced; when it is not, the
+    caller should still measure elapsed time itself.
+    """
+    if seconds <= 0 or not _can_interrupt():
+        yield False
+        return
+
+    def _expire(_signum, _frame):
+        raise StrategyTimeout(f"strategy exceeded {seconds:.3f}s budget")
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield True
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+@dataclass
+class PatternTiming:
+    """Aggregated timings for one (field, strategy, pattern) combination."""
+
+    field: str
+    strategy: str
+    pattern: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    over_budget: int = 0
+    aborted: int = 0
+
+
+class SlowPatternLog:
+    """Thread-safe record of strategy timings, queried for the slowest patterns."""
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str, str], PatternTiming] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        field: str,
+        strategy: str,
+        pattern: str,
+        elapsed: float,
+        *,
+        over_budget: bool = False,
+        aborted: bool = False,
+    ) -> None:
+        key = (field, strategy, pattern)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = PatternTiming(field=field, strategy=strategy, pattern=pattern)
+                self._entries[key] = entry
+            entry.calls += 1
+            entry.total_seconds += elapsed
+            entry.max_seconds = max(entry.max_seconds, elapsed)
+            entry.over_budget += int(over_budget)
+            entry.aborted += int(aborted)
+
+    def slowest(self, limit: int = 10) -> List[PatternTiming]:
+        with self._lock:
+            entries = [PatternTiming(**vars(entry)) for entry in self._entries.values()]
+        entries.sort(key=lambda entry: (-entry.max_seconds, -entry.total_seconds))
+        return entries[:limit]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+SLOW_PATTERNS = SlowPatternLog()
+
+
+def slow_pattern_report(limit: int = 10) -> str:
+    """Render the slowest recorded patterns as a plain-text table."""
+    rows = SLOW_PATTERNS.slowest(limit)
+    if not rows:
+        return "No strategy timings recorded."
+    lines = ["max_ms  avg_ms  calls  over  aborted  field:strategy  pattern"]
+    for row in rows:
+        average = row.total_seconds / row.calls if row.calls else 0.0
+        lines.append(
+            f"{row.max_seconds * 1000:6.1f}  {average * 1000:6.1f}  {row.calls:5d}  "
+            f"{row.over_budget:4d}  {row.aborted:7d}  {row.field}:{row.strategy}  "
+            f"{row.pattern[:80]}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,95 @@
+"""Field x strategy candidate matrix produced by one extraction pass.
+
+`RegexExtractionEngine.candidate_matrix` runs every registered strategy for
+each field against a single document and index. The matrix answers "what
+would config X have extracted?" for any config without re-extracting, and
+shows where strategies disagree.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """One strategy's result for one field.
+
+    `span` holds character offsets into the document: of the captured value
+    when a regex found it, otherwise of the table row or line it came from.
+    It is None when the value is the field default.
+    """
+
+    value: str
+    span: Optional[Tuple[int, int]]
+    outcome: str
+    elapsed: float
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "value": self.value,
+            "span": list(self.span) if self.span else None,
+            "outcome": self.outcome,
+            "elapsed": round(self.elapsed, 6),
+        }
+
+
+@dataclass(frozen=True)
+class CandidateMatrix:
+    """Every candidate value per field, plus the engine's selected strategy."""
+
+    strategies: Mapping[str, Tuple[str, ...]]
+    selected: Mapping[str, str]
+    cells: Mapping[Tuple[str, str], Candidate]
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(self.strategies)
+
+    def get(self, field_name: str, strategy_name: str) -> Candidate:
+        return self.cells[(field_name, strategy_name)]
+
+    def row(self, field_name: str) -> Dict[str, Candidate]:
+        return {
+            name: self.cells[(field_name, name)] for name in self.strategies[field_name]
+        }
+
+    def values(self, strategy_config: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
+        """Values an engine built from `strategy_config` would extract.
+
+        Without a config this is the selected strategy per field. As in the
+        engine, unknown strategy names fall back to the first registered
+        strategy that is not brute force.
+        """
+        result: Dict[str, str] = {}
+        for field_name, names in self.strategies.items():
+            if strategy_config is None:
+                chosen = self.selected[field_name]
+            else:
+                chosen = strategy_config.get(field_name, "")
+                if chosen not in names:
+                    chosen = next((name for name in names if name != "brute_force"), names[0])
+            result[field_name] = self.cells[(field_name, chosen)].value
+        return result
+
+    def disagreements(self) -> Dict[str, Dict[str, str]]:
+        """Fields whose candidates do not all agree, with each strategy's value."""
+        conflicts: Dict[str, Dict[str, str]] = {}
+        for field_name in self.strategies:
+            values = {name: candidate.value for name, candidate in self.row(field_name).items()}
+            if len(set(values.values())) > 1:
+                conflicts[field_name] = values
+        return conflicts
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "selected": dict(self.selected),
+            "fields": {
+                field_name: {
+                    name: candidate.as_dict()
+                    for name, candidate in self.row(field_name).items()
+                }
+                for field_name in self.strategies
+            },
+        }
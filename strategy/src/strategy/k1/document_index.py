@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterator, List, Optional, Pattern, Tuple
+
+from ..pdf_pages import PAGE_MARKER
+from .anchors import AnchorPrefilter
+from .numeric_index import NumericTokenIndex
+from .tables import TableIndex
+
+
+# Legacy row grammar, still used for rows too short to read from pipe offsets.
+MAIN_TABLE_ROW = re.compile(
+    r"^\|\s*(?P<code>[0-9A-Za-z]+)\s*\|(?P<desc>.*?)\|\s*(?P<value>[^|]*?)\|",
+    re.MULTILINE,
+)
+MAIN_TABLE_CODE = re.compile(r"\s*[0-9A-Za-z]+\s*")
+# Same separators as str.splitlines so line numbers agree with the old scans.
+LINE_BREAK = re.compile(r"\r\n|[\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+SECTION_HEADER = re.compile(
+    r"(?P<total>^TOTAL\s+TO\s+SCHEDULE\s+K-1\b)"
+    r"|(?P<line>^LINE\s+(?P<line_id>\d+[A-Z]*)\b)"
+    r"|(?P<box>\bBOX\s+(?P<box_id>\d+),?\s*CODE\s+(?P<code_id>[A-Z]+)\b)",
+    re.IGNORECASE,
+)
+HEADER_DECORATION = "|*#_ \t"
+
+
+@dataclass(frozen=True)
+class MainTableRow:
+    """One `| code | description | value |` row from the K-1 face table."""
+
+    code: str
+    desc: str
+    value: str
+    context: str
+    start: int
+
+
+@dataclass(frozen=True)
+class SectionAnchor:
+    """A statement header such as `LINE 11ZZ` or `BOX 18, CODE B`."""
+
+    label: str
+    kind: str
+    start: int
+    line_no: int
+
+
+@dataclass(frozen=True)
+class SectionSpan:
+    """Character window covered by one statement section."""
+
+    label: str
+    kind: str
+    start: int
+    end: int
+
+
+class DocumentIndex:
+    """Single-pass views over one markdown document shared by every strategy.
+
+    Each view is computed on first use and then reused, so strategies never
+    re-split, re-case or re-scan the document themselves.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._cells: Dict[int, List[str]] = {}
+        self._anchor_scans: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+
+    @cached_property
+    def line_spans(self) -> Tuple[Tuple[int, int], ...]:
+        spans: List[Tuple[int, int]] = []
+        position = 0
+        for match in LINE_BREAK.finditer(self.text):
+            spans.append((position, match.start()))
+            position = match.end()
+        if position < len(self.text):
+            spans.append((position, len(self.text)))
+        return tuple(spans)
+
+    @cached_property
+    def line_starts(self) -> Tuple[int, ...]:
+        return tuple(start for start, _ in self.line_spans)
+
+    @cached_property
+    def lines(self) -> Tuple[str, ...]:
+        return tuple(self.text[start:end] for start, end in self.line_spans)
+
+    @cached_property
+    def lower_text(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def upper_text(self) -> str:
+        return self.text.upper()
+
+    @cached_property
+    def lower_lines(self) -> Tuple[str, ...]:
+        return tuple(line.lower() for line in self.lines)
+
+    def line_number_at(self, offset: int) -> int:
+        """Return the zero-based line containing a character offset."""
+        return max(0, bisect_right(self.line_starts, offset) - 1)
+
+    def line_offsets(self, line_no: int) -> Tuple[int, int]:
+        return self.line_spans[line_no]
+
+    def lines_containing(self, needle: str) -> Iterator[Tuple[int, str]]:
+        """Yield (line_no, line) for each line whose lower-case form contains `needle`."""
+        normalized = needle.lower()
+        if not normalized:
+            return
+        if len(self.lower_text) != len(self.text):
+            # Case folding changed offsets; fall back to a per-line scan.
+            for line_no, lowered in enumerate(self.lower_lines):
+                if normalized in lowered:
+                    yield line_no, self.lines[line_no]
+            return
+        last_line = -1
+        position = self.lower_text.find(normalized)
+        while position != -1:
+            line_no = self.line_number_at(position)
+            if line_no != last_line:
+                last_line = line_no
+                yield line_no, self.lines[line_no]
+            _, line_end = self.line_spans[line_no]
+            position = self.lower_text.find(normalized, max(position + 1, line_end))
+
+    def cells(self, line_no: int) -> List[str]:
+        """Return the stripped cells between the outer pipes of a table line."""
+        cached = self._cells.get(line_no)
+        if cached is None:
+            row = self.tables.lines.get(line_no)
+            if row is not None:
+                cached = list(row.cells)
+            else:
+                line = self.lines[line_no]
+                cached = [cell.strip() for cell in line.split("|")[1:-1]]
+            self._cells[line_no] = cached
+        return cached
+
+    def anchors_present(self, prefilter: AnchorPrefilter) -> FrozenSet[str]:
+        """Anchors of `prefilter` found in the text, scanned once per anchor set."""
+        found = self._anchor_scans.get(prefilter.anchors)
+        if found is None:
+            found = prefilter.scan(self.text)
+            self._anchor_scans[prefilter.anchors] = found
+        return found
+
+    @cached_property
+    def tables(self) -> TableIndex:
+        return TableIndex(zip(self.line_starts, self.lines))
+
+    @cached_property
+    def table_lines(self) -> Tuple[int, ...]:
+        return tuple(sorted(self.tables.lines))
+
+    @cached_property
+    def numeric_tokens(self) -> NumericTokenIndex:
+        return NumericTokenIndex(self.text)
+
+    @cached_property
+    def page_starts(self) -> Tuple[Tuple[int, int], ...]:
+        """`(offset, page)` where each page begins, just after its `{n}------` separator."""
+        return tuple(
+            (self.line_spans[line_no][1], int(marker.group(1)))
+            for line_no, line in enumerate(self.lines)
+            if "{" in line and (marker := PAGE_MARKER.match(line.strip()))
+        )
+
+    def page_at(self, offset: int) -> Optional[int]:
+        """The page holding a character offset; None before the first separator."""
+        position = bisect_right(self.page_starts, (offset, float("inf"))) - 1
+        return self.page_starts[position][1] if position >= 0 else None
+
+    def page_span(self, page: int) -> Optional[Tuple[int, int]]:
+        """Character window of a page, e.g. for `numeric_tokens.within(*span)`."""
+        for position, (start, number) in enumerate(self.page_starts):
+            if number == page:
+                following = self.page_starts[position + 1 : position + 2]
+                return start, following[0][0] if following else len(self.text)
+        return None
+
+    @cached_property
+    def main_table_rows(self) -> Tuple[MainTableRow, ...]:
+        """`| code | description | value |` rows, as `MAIN_TABLE_ROW.finditer` finds them.
+
+        Rows with at least three cells are read from the tokenizer's split
+        parts. Shorter rows are matched with `MAIN_TABLE_ROW` anchored at the
+        line: its value can run on to a pipe on a later line and swallow that
+        row, and extraction results depend on that behaviour.
+        """
+        text = self.text
+        rows: List[MainTableRow] = []
+        resume = 0
+        for row in self.tables.lines.values():
+            start = row.start
+            if start < resume or text[start] != "|" or (start and text[start - 1] != "\n"):
+                continue
+            parts = row.parts
+            if len(parts) >= 5:
+                _, code, desc, value = parts[:4]
+                if not MAIN_TABLE_CODE.fullmatch(code):
+                    continue
+                end = start + len(code) + len(desc) + len(value) + 4
+                rows.append(
+                    MainTableRow(
+                        code=code.strip().upper(),
+                        desc=desc,
+                        value=value.lstrip(),
+                        context=text[start:end].strip(),
+                        start=start,
+                    )
+                )
+                resume = end
+                continue
+            match = MAIN_TABLE_ROW.match(text, start)
+            if match:
+                rows.append(
+                    MainTableRow(
+                        code=match.group("code").strip().upper(),
+                        desc=match.group("desc"),
+                        value=match.group("value"),
+                        context=match.group(0).strip(),
+                        start=start,
+                    )
+                )
+                resume = match.end()
+        return tuple(rows)
+
+    @cached_property
+    def main_table_by_start(self) -> Dict[int, MainTableRow]:
+        """`main_table_rows` keyed by line offset, to resolve `TableIndex` rows."""
+        return {row.start: row for row in self.main_table_rows}
+
+    @cached_property
+    def section_anchors(self) -> Tuple[SectionAnchor, ...]:
+        anchors: List[SectionAnchor] = []
+        for line_no, line in enumerate(self.lines):
+            stripped = line.lstrip(HEADER_DECORATION)
+            match = SECTION_HEADER.search(stripped)
+            if not match:
+                continue
+            if match.group("total"):
+                label, kind = "TOTAL TO SCHEDULE K-1", "total"
+            elif match.group("line"):
+                label, kind = f"LINE {match.group('line_id').upper()}", "line"
+            else:
+                label = (
+                    f"BOX {match.group('box_id')}, CODE {match.group('code_id').upper()}"
+                )
+                kind = "box"
+            anchors.append(
+                SectionAnchor(
+                    label=label,
+                    kind=kind,
+                    start=self.line_spans[line_no][0],
+                    line_no=line_no,
+                )
+            )
+        return tuple(anchors)
+
+    @cached_property
+    def section_spans(self) -> Tuple[SectionSpan, ...]:
+        """Resolve each LINE/BOX anchor into the window its rows live in.
+
+        A LINE section runs until the next LINE header. A BOX section runs
+        until the next BOX header or through its `TOTAL TO SCHEDULE K-1` row,
+        whichever comes first. Total rows get a one-line span of their own.
+        """
+        anchors = self.section_anchors
+        spans: List[SectionSpan] = []
+        for position, anchor in enumerate(anchors):
+            end = len(self.text)
+            if anchor.kind == "total":
+                end = self.line_spans[anchor.line_no][1]
+            else:
+                for following in anchors[position + 1 :]:
+                    if following.kind == anchor.kind:
+                        end = following.start
+                        break
+                    if anchor.kind == "box" and following.kind == "total":
+                        end = self.line_spans[following.line_no][1]
+                        break
+            spans.append(
+                SectionSpan(
+                    label=anchor.label, kind=anchor.kind, start=anchor.start, end=end
+                )
+            )
+        return tuple(spans)
+
+    @cached_property
+    def section_map(self) -> Dict[str, Tuple[SectionSpan, ...]]:
+        grouped: Dict[str, List[SectionSpan]] = {}
+        for span in self.section_spans:
+            grouped.setdefault(span.label, []).append(span)
+        return {label: tuple(spans) for label, spans in grouped.items()}
+
+    def sections_matching(self, label_pattern: Pattern[str]) -> Tuple[SectionSpan, ...]:
+        """Return every section whose normalized label fully matches the pattern."""
+        return tuple(
+            span
+            for label, spans in self.section_map.items()
+            if label_pattern.fullmatch(label)
+            for span in spans
+        )
@@ -0,0 +1,162 @@
+"""Per-strategy extraction metrics and their process-wide aggregates.
+
+Every field the engine runs yields a `StrategyRun`: wall time, outcome,
+fallback depth (how many candidate strategies failed before a value came
+back) and the number of regex searches the strategy issued. Runs are kept on
+the extractor for the `ExtractRegexK1` artifacts and folded into
+`EXTRACTION_METRICS`, which renders Prometheus text for scraping. Aggregates
+are per process; batch workers keep their own.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+# Outcomes a field run can end with.
+MATCH = "match"
+NO_MATCH = "no_match"
+PREFILTER_MISS = "prefilter_miss"
+SKIPPED = "skipped"
+ABORTED = "aborted"
+OUTCOMES = (MATCH, NO_MATCH, PREFILTER_MISS, SKIPPED, ABORTED)
+
+
+@dataclass
+class StrategyRun:
+    """What happened when one field's strategy ran against one document."""
+
+    field: str
+    strategy: str
+    elapsed: float = 0.0
+    outcome: str = NO_MATCH
+    fallback_depth: int = 0
+    regex_calls: int = 0
+
+    def as_dict(self) -> Dict[str, object]:
+        data = asdict(self)
+        data["elapsed"] = round(self.elapsed, 6)
+        return data
+
+
+@dataclass
+class StrategyAggregate:
+    """Running totals for one (field, strategy) pair."""
+
+    runs: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    regex_calls: int = 0
+    fallback_steps: int = 0
+    outcomes: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, run: StrategyRun) -> None:
+        self.runs += 1
+        self.total_seconds += run.elapsed
+        self.max_seconds = max(self.max_seconds, run.elapsed)
+        self.regex_calls += run.regex_calls
+        self.fallback_steps += run.fallback_depth
+        self.outcomes[run.outcome] = self.outcomes.get(run.outcome, 0) + 1
+
+    @property
+    def hit_rate(self) -> float:
+        return self.outcomes.get(MATCH, 0) / self.runs if self.runs else 0.0
+
+
+class ExtractionMetrics:
+    """Thread-safe process-wide aggregation of `StrategyRun`s."""
+
+    def __init__(self):
+        self._strategies: Dict[Tuple[str, str], StrategyAggregate] = {}
+        self._documents = 0
+        self._document_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record_document(self, runs: Iterable[StrategyRun], elapsed: float) -> None:
+        with self._lock:
+            self._documents += 1
+            self._document_seconds += elapsed
+            for run in runs:
+                key = (run.field, run.strategy)
+                aggregate = self._strategies.get(key)
+                if aggregate is None:
+                    aggregate = StrategyAggregate()
+                    self._strategies[key] = aggregate
+                aggregate.add(run)
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return a JSON-friendly copy of the current aggregates."""
+        with self._lock:
+            strategies = [
+                {
+                    "field": field_name,
+                    "strategy": strategy_name,
+                    **asdict(aggregate),
+                    "hit_rate": round(aggregate.hit_rate, 4),
+                }
+                for (field_name, strategy_name), aggregate in self._strategies.items()
+            ]
+            documents, document_seconds = self._documents, self._document_seconds
+        strategies.sort(key=lambda entry: -entry["total_seconds"])
+        return {
+            "documents": documents,
+            "document_seconds": document_seconds,
+            "strategies": strategies,
+        }
+
+    def top_fields(self, limit: int = 10) -> List[Dict[str, object]]:
+        """Fields ranked by cumulative wall time, the usual latency suspects."""
+        return self.snapshot()["strategies"][:limit]  # type: ignore[index]
+
+    def render_prometheus(self) -> str:
+        """Render the aggregates in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP taxman_extraction_documents_total Documents run through the regex engine.",
+            "# TYPE taxman_extraction_documents_total counter",
+            f"taxman_extraction_documents_total {snapshot['documents']}",
+            "# HELP taxman_extraction_document_seconds_total Wall time spent extracting documents.",
+            "# TYPE taxman_extraction_document_seconds_total counter",
+            f"taxman_extraction_document_seconds_total {snapshot['document_seconds']:.6f}",
+        ]
+        series = (
+            ("strategy_seconds_total", "counter", "Wall time per field strategy.", "total_seconds"),
+            ("strategy_max_seconds", "gauge", "Slowest single run per field strategy.", "max_seconds"),
+            ("regex_calls_total", "counter", "Regex searches issued per field strategy.", "regex_calls"),
+            ("fallback_steps_total", "counter", "Failed fallback candidates per field strategy.", "fallback_steps"),
+        )
+        entries = snapshot["strategies"]
+        for name, kind, description, key in series:
+            lines.append(f"# HELP taxman_extraction_{name} {description}")
+            lines.append(f"# TYPE taxman_extraction_{name} {kind}")
+            for entry in entries:  # type: ignore[union-attr]
+                value = entry[key]
+                rendered = f"{value:.6f}" if isinstance(value, float) else str(value)
+                lines.append(f"taxman_extraction_{name}{{{_labels(entry)}}} {rendered}")
+        lines.append("# HELP taxman_extraction_strategy_runs_total Field strategy runs by outcome.")
+        lines.append("# TYPE taxman_extraction_strategy_runs_total counter")
+        for entry in entries:  # type: ignore[union-attr]
+            for outcome, count in sorted(entry["outcomes"].items()):
+                lines.append(
+                    f"taxman_extraction_strategy_runs_total"
+                    f'{{{_labels(entry)},outcome="{outcome}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._strategies.clear()
+            self._documents = 0
+            self._document_seconds = 0.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(entry: Dict[str, object]) -> str:
+    return f'field="{_escape(str(entry["field"]))}",strategy="{_escape(str(entry["strategy"]))}"'
+
+
+EXTRACTION_METRICS = ExtractionMetrics()
@@ -0,0 +1,241 @@
+"""Process-safe store for generated brute-force patterns.
+
+Patterns live in a SQLite database (WAL mode), one row per field and
+generator fingerprint. SQLite provides the cross-process locking and atomic
+writes, so API workers and the precompute command can share one file. Rows
+are read lazily per field and memoized in-process; rows written by a
+different generator are ignored and pruned by the precompute command.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..pool import WorkerPool, get_cpu_pool
+
+PatternList = List[Tuple[str, bool]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS brute_force_patterns (
+    field TEXT NOT NULL,
+    generator TEXT NOT NULL,
+    patterns TEXT NOT NULL,
+    PRIMARY KEY (field, generator)
+)
+"""
+_BUSY_TIMEOUT_SECONDS = 10.0
+
+
+class BruteForcePatternStore:
+    """SQLite-backed pattern cache keyed by field and generator fingerprint.
+
+    A connection is opened per operation so the store is safe to use from
+    threads and forked workers. Storage errors (read-only data dir, locked
+    file past the busy timeout) degrade to cache misses.
+    """
+
+    def __init__(self, path: Path, generator: str):
+        self.path = Path(path)
+        self.generator = generator
+        self._memo: Dict[str, Optional[PatternList]] = {}
+        self._lock = threading.Lock()
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT_SECONDS)
+        if not self._ready:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            connection.commit()
+            self._ready = True
+        return connection
+
+    def get(self, field_name: str) -> Optional[PatternList]:
+        with self._lock:
+            if field_name in self._memo:
+                return self._memo[field_name]
+        if not self.path.exists():
+            return None
+        try:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    "SELECT patterns FROM brute_force_patterns WHERE field = ? AND generator = ?",
+                    (field_name, self.generator),
+                ).fetchone()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return None
+        patterns = _decode(row[0]) if row else None
+        if patterns is not None:
+            with self._lock:
+                self._memo[field_name] = patterns
+        return patterns
+
+    def put(self, field_name: str, patterns: Sequence[Tuple[str, bool]]) -> None:
+        self.put_many({field_name: patterns})
+
+    def put_many(self, entries: Dict[str, Sequence[Tuple[str, bool]]]) -> None:
+        """Write several fields in one transaction."""
+        rows = [
+            (field_name, self.generator, _encode(patterns))
+            for field_name, patterns in entries.items()
+        ]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO brute_force_patterns"
+                        " (field, generator, patterns) VALUES (?, ?, ?)",
+                        rows,
+                    )
+            finally:
+                connection.close()
+        except (OSError, sqlite3.Error):
+            return
+        with self._lock:
+            for field_name, patterns in entries.items():
+                if patterns:
+                    self._memo[field_name] = [(p, bool(n)) for p, n in patterns]
+
+    def fields(self) -> List[str]:
+        if not self.path.exists():
+            return []
+        try:
+            connection = self._connect()
+            try:
+                rows = connection.execute(
+                    "SELECT field FROM brute_force_patterns WHERE generator = ? ORDER BY field",
+                    (self.generator,),
+                ).fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return []
+        return [row[0] for row in rows]
+
+    def prune(self) -> int:
+        """Delete rows written by other generator versions; return how many."""
+        if not self.path.exists():
+            return 0
+        connection = self._connect()
+        try:
+            with connection:
+                cursor = connection.execute(
+                    "DELETE FROM brute_force_patterns WHERE generator != ?",
+                    (self.generator,),
+                )
+            return cursor.rowcount
+        finally:
+            connection.close()
+
+
+def _encode(patterns: Iterable[Tuple[str, bool]]) -> str:
+    return json.dumps([[pattern, bool(numeric)] for pattern, numeric in patterns])
+
+
+def _decode(payload: str) -> Optional[PatternList]:
+    try:
+        entries = json.loads(payload)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(entries, list):
+        return None
+    patterns = [
+        (entry[0], bool(entry[1]))
+        for entry in entries
+        if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], str)
+    ]
+    return patterns or None
+
+
+def _build_patterns(field_name: str) -> Tuple[str, PatternList]:
+    from .regex_extractor import _build_brute_force_patterns_for_field
+
+    return field_name, _build_brute_force_patterns_for_field(field_name)
+
+
+def precompute_brute_force_cache(
+    fields: Optional[Iterable[str]] = None,
+    *,
+    workers: Optional[int] = None,
+    store: Optional[BruteForcePatternStore] = None,
+    force: bool = False,
+) -> Dict[str, int]:
+    """Generate patterns for every field in parallel and persist them.
+
+    Fields already cached for the current generator are skipped unless
+    `force` is set. Returns the number of patterns written per field.
+    """
+    from .regex_extractor import FIELD_KEYS, get_brute_force_store
+
+    store = store or get_brute_force_store()
+    store.prune()
+    targets = list(dict.fromkeys(fields if fields is not None else FIELD_KEYS))
+    if not force:
+        cached = set(store.fields())
+        targets = [field_name for field_name in targets if field_name not in cached]
+    if not targets:
+        return {}
+
+    if workers == 1:
+        built = [_build_patterns(field_name) for field_name in targets]
+    else:
+        pool = get_cpu_pool() if workers is None else WorkerPool(workers)
+        with nullcontext(pool) if workers is None else pool:
+            futures = [pool.submit(_build_patterns, field_name) for field_name in targets]
+            built = [future.result() for future in futures]
+    store.put_many(dict(built))
+    return {field_name: len(patterns) for field_name, patterns in built}
+
+
+def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Precompute the brute-force regex pattern cache for all K-1 fields."
+    )
+    parser.add_argument(
+        "--fields",
+        default=None,
+        help="Comma-separated subset of fields (default: every FIELD_KEYS entry).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: the shared CPU pool).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate fields that are already cached.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    from .regex_extractor import get_brute_force_store
+
+    args = _parse_args(argv)
+    fields = [name.strip() for name in args.fields.split(",")] if args.fields else None
+    written = precompute_brute_force_cache(fields, workers=args.workers, force=args.force)
+    store = get_brute_force_store()
+    print(
+        f"Cached {len(written)} fields ({sum(written.values())} patterns) "
+        f"in {store.path} for generator {store.generator[:12]}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
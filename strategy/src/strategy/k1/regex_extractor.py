@@ -1,125 +1,155 @@
 from __future__ import annotations
 
-import atexit
 import csv
-import json
-import os
+import hashlib
+import inspect
+import pickle
 import re
-from concurrent.futures import ProcessPoolExecutor
+import threading
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict, Mapping, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
 
 import yaml
 
+from ..config_cache import CONFIG_CACHE
+from ..pool import WorkerPool, get_cpu_pool
+from .anchors import AnchorPrefilter, literal_anchor, normalize_anchor
+from .budget import (
+    DOCUMENT_BUDGET_SECONDS,
+    ISOLATED_DOCUMENT_MIN_CHARS,
+    SLOW_PATTERNS,
+    STRATEGY_BUDGET_SECONDS,
+    StrategyTimeout,
+    interruptible_here,
+    time_limit,
+)
+from .brute_force import (
+    BRUTE_FORCE_DOCUMENT_BUDGET_SECONDS,
+    BRUTE_FORCE_FIELD_BUDGET_SECONDS,
+    BRUTE_FORCE_PARALLEL_WORKLOAD,
+    BruteForceOutcome,
+    search_patterns,
+    search_patterns_parallel,
+)
+from .candidates import Candidate, CandidateMatrix
+from .document_index import MAIN_TABLE_ROW, DocumentIndex, MainTableRow
+from .metrics import (
+    ABORTED,
+    EXTRACTION_METRICS,
+    MATCH,
+    NO_MATCH,
+    PREFILTER_MISS,
+    SKIPPED,
+    StrategyRun,
+)
+from .pattern_cache import BruteForcePatternStore
+
 
 BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 DEFAULT_EVAL_CSV = DATA_DIR / "eval_set.csv"
-MAIN_TABLE_ROW = re.compile(
-    r"^\|\s*(?P<code>[0-9A-Za-z]+)\s*\|(?P<desc>.*?)\|\s*(?P<value>[^|]*?)\|",
-    re.MULTILINE,
+NUMERIC_TOKEN = re.compile(r"([\d,.\-()]+)")
+SIGNED_DIGITS = re.compile(r"([\d\-]+)")
+HTML_BREAK = re.compile(r"<br\s*/?>", re.IGNORECASE)
+CURRENT_YEAR_SUMMARY_MARKER = re.compile(
+    r"SCHEDULE\s+K-1\s+CURRENT\s+YEAR\s+NET\s+INCOME", re.IGNORECASE
 )
+EXTRACTION_REGEX_FLAGS = re.IGNORECASE | re.DOTALL
 
 FieldStrategy = Callable[["ParsedK1RegexExtractor"], str]
 FIELD_STRATEGIES: Dict[str, Dict[str, FieldStrategy]] = {}
 REGEX_FIELD_CONFIG_PATH = DATA_DIR / "regex_field_config.yaml"
 BRUTE_FORCE_PATTERN_LIMIT = 1_000
-BRUTE_FORCE_CACHE_VERSION = 1
-BRUTE_FORCE_CACHE_PATH = DATA_DIR / "regex_bruteforce_cache.json"
-_BRUTE_FORCE_PATTERN_CACHE: Dict[str, list[dict]] = {}
-_BRUTE_FORCE_EXECUTOR: ProcessPoolExecutor | None = None
-
-
-def _load_brute_force_pattern_cache() -> Dict[str, list[dict]]:
-    if not BRUTE_FORCE_CACHE_PATH.exists():
-        return {}
-    try:
-        data = json.loads(BRUTE_FORCE_CACHE_PATH.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return {}
-    if data.get("version") != BRUTE_FORCE_CACHE_VERSION:
-        return {}
-    patterns = data.get("patterns")
-    if not isinstance(patterns, dict):
-        return {}
-    sanitized: Dict[str, list[dict]] = {}
-    for field, entries in patterns.items():
-        if not isinstance(entries, list):
-            continue
-        cleaned: list[dict] = []
-        for entry in entries:
-            if not isinstance(entry, Mapping):
-                continue
-            pattern = entry.get("pattern")
-            numeric = bool(entry.get("numeric"))
-            if isinstance(pattern, str):
-                cleaned.append({"pattern": pattern, "numeric": numeric})
-        if cleaned:
-            sanitized[field] = cleaned[:BRUTE_FORCE_PATTERN_LIMIT]
-    return sanitized
-
+BRUTE_FORCE_CACHE_PATH = DATA_DIR / "regex_bruteforce_cache.sqlite3"
+_BRUTE_FORCE_STORE: BruteForcePatternStore | None = None
+_BRUTE_FORCE_STORE_LOCK = threading.Lock()
 
-_BRUTE_FORCE_PATTERN_CACHE = _load_brute_force_pattern_cache()
 
+@lru_cache(maxsize=1)
+def brute_force_generator_hash() -> str:
+    """Fingerprint of the pattern generator; cached patterns are keyed on it.
 
-def _save_brute_force_pattern_cache() -> None:
-    payload = {
-        "version": BRUTE_FORCE_CACHE_VERSION,
-        "patterns": _BRUTE_FORCE_PATTERN_CACHE,
-    }
-    BRUTE_FORCE_CACHE_PATH.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    Editing the generator (or the pattern limit) changes the hash, so stale
+    cache rows are ignored without a manual version bump.
+    """
+    digest = hashlib.sha256(str(BRUTE_FORCE_PATTERN_LIMIT).encode())
+    for function in (_tokenize_field_name, _build_brute_force_patterns_for_field):
+        try:
+            source = inspect.getsource(function).encode("utf-8")
+        except (OSError, TypeError):
+            source = function.__code__.co_code
+        digest.update(source)
+    return digest.hexdigest()
+
+
+def get_brute_force_store() -> BruteForcePatternStore:
+    """Return the shared store for `BRUTE_FORCE_CACHE_PATH`, opening it on first use."""
+    global _BRUTE_FORCE_STORE
+    with _BRUTE_FORCE_STORE_LOCK:
+        store = _BRUTE_FORCE_STORE
+        if store is None or store.path != BRUTE_FORCE_CACHE_PATH:
+            store = BruteForcePatternStore(
+                BRUTE_FORCE_CACHE_PATH, brute_force_generator_hash()
+            )
+            _BRUTE_FORCE_STORE = store
+        return store
 
 
 def _get_cached_brute_force_patterns(field_name: str):
-    entries = _BRUTE_FORCE_PATTERN_CACHE.get(field_name)
-    if not entries:
-        return None
-    return [(entry["pattern"], bool(entry.get("numeric"))) for entry in entries]
+    return get_brute_force_store().get(field_name)
 
 
 def _set_cached_brute_force_patterns(
     field_name: str, patterns: list[tuple[str, bool]]
 ) -> None:
-    serializable = [
-        {"pattern": pattern, "numeric": numeric}
-        for pattern, numeric in patterns[:BRUTE_FORCE_PATTERN_LIMIT]
-    ]
-    _BRUTE_FORCE_PATTERN_CACHE[field_name] = serializable
-    _save_brute_force_pattern_cache()
+    get_brute_force_store().put(field_name, patterns[:BRUTE_FORCE_PATTERN_LIMIT])
 
 
-def _ensure_brute_force_executor() -> ProcessPoolExecutor:
-    global _BRUTE_FORCE_EXECUTOR
-    if _BRUTE_FORCE_EXECUTOR is None:
-        workers = max(1, min(os.cpu_count() or 1, 4))
-        _BRUTE_FORCE_EXECUTOR = ProcessPoolExecutor(max_workers=workers)
+def _ensure_brute_force_executor() -> WorkerPool:
+    return get_cpu_pool()
 
-        def _shutdown():
-            if _BRUTE_FORCE_EXECUTOR:
-                _BRUTE_FORCE_EXECUTOR.shutdown(wait=False)
 
-        atexit.register(_shutdown)
-    return _BRUTE_FORCE_EXECUTOR
+def _isolation_executor() -> WorkerPool:
+    return get_cpu_pool()
 
 
-def load_field_strategy_config(path: Path = REGEX_FIELD_CONFIG_PATH) -> Dict[str, str]:
-    if not path.exists():
-        return {}
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+_EMPTY_STRATEGY_CONFIG: Mapping[str, str] = MappingProxyType({})
+
+
+def _parse_field_strategy_config(text: str) -> Mapping[str, str]:
+    data = yaml.safe_load(text) or {}
     if isinstance(data, Mapping) and "fields" in data:
         fields = data.get("fields") or {}
     else:
         fields = data
     if not isinstance(fields, Mapping):
-        return {}
-    return {
-        str(key): str(value)
-        for key, value in fields.items()
-        if isinstance(key, str) and isinstance(value, str)
-    }
+        return _EMPTY_STRATEGY_CONFIG
+    return MappingProxyType(
+        {
+            str(key): str(value)
+            for key, value in fields.items()
+            if isinstance(key, str) and isinstance(value, str)
+        }
+    )
+
+
+def cached_field_strategy_config(path: Path = REGEX_FIELD_CONFIG_PATH) -> Mapping[str, str]:
+    """Read-only field strategy config, re-parsed only when the file changes.
+
+    The same mapping object is returned until the file is edited, so callers
+    can detect a reload by identity.
+    """
+    if not path.exists():
+        return _EMPTY_STRATEGY_CONFIG
+    return CONFIG_CACHE.load(path, _parse_field_strategy_config)
+
+
+def load_field_strategy_config(path: Path = REGEX_FIELD_CONFIG_PATH) -> Dict[str, str]:
+    return dict(cached_field_strategy_config(path))
 
 
 def save_field_strategy_config(
@@ -129,6 +159,40 @@ def save_field_strategy_config(
     path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
 
 
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile an extraction pattern once per (pattern, flags) pair."""
+    return re.compile(pattern, EXTRACTION_REGEX_FLAGS | flags)
+
+
+def _deferred(compile_pattern: Callable[[], re.Pattern[str]]) -> Callable[[], re.Pattern[str]]:
+    """Compile a strategy's pattern on its first run instead of at import.
+
+    Hundreds of strategies are registered but a document only runs the
+    configured one per field, so compiling them all up front is wasted start-up
+    time.
+    """
+    compiled: Optional[re.Pattern[str]] = None
+
+    def get() -> re.Pattern[str]:
+        nonlocal compiled
+        if compiled is None:
+            compiled = compile_pattern()
+        return compiled
+
+    return get
+
+
+def _with_anchors(strategy: FieldStrategy, anchors: Iterable[Optional[str]]) -> FieldStrategy:
+    """Declare literals of which at least one must be present for `strategy` to match."""
+    normalized = tuple(
+        dict.fromkeys(normalize_anchor(anchor) for anchor in anchors if anchor)
+    )
+    if normalized:
+        strategy._anchors = normalized  # type: ignore[attr-defined]
+    return strategy
+
+
 def _clean_numeric(value: str) -> str:
     cleaned = (
         value.replace("$", "")
@@ -219,7 +283,9 @@ def _build_brute_force_patterns_for_field(field_name: str) -> list[tuple[str, bo
     ]
 
     patterns: list[tuple[str, bool]] = []
-    for phrase in phrase_candidates:
+    # Longest phrases first: they are the most specific, so they win ties and
+    # survive the pattern limit. Sorting also keeps the order stable across runs.
+    for phrase in sorted(phrase_candidates, key=lambda item: (-len(item), item)):
         if not phrase:
             continue
         escaped_phrase = re.escape(phrase)
@@ -255,33 +321,39 @@ def _regex_strategy(
     *,
     flags: int = 0,
     transform: Optional[Callable[[str], str]] = None,
+    anchors: Iterable[str] = (),
 ) -> FieldStrategy:
+    compiled = _deferred(lambda: _compile_pattern(pattern, flags))
+
     def strategy(extractor: "ParsedK1RegexExtractor") -> str:
-        value = extractor._extract_with_regex(
-            pattern, field_name=field_name, flags=flags
-        )
+        value = extractor._extract_with_regex(compiled(), field_name=field_name)
         return transform(value) if transform else value
 
     strategy._pattern = pattern  # type: ignore[attr-defined]
-    return strategy
+    return _with_anchors(strategy, anchors)
 
 
 def _numeric_regex_strategy(
-    pattern: str, field_name: str, *, flags: int = 0
+    pattern: str, field_name: str, *, flags: int = 0, anchors: Iterable[str] = ()
 ) -> FieldStrategy:
     return _regex_strategy(
         pattern,
         field_name,
         flags=flags,
         transform=_clean_numeric,
+        anchors=anchors,
     )
 
 
+def _statement_pattern(label: str) -> re.Pattern[str]:
+    return _compile_pattern(rf"{label}[^\n]*\|\s*([\d,.\-()]+)\s*\|")
+
+
 def _statement_strategy(label: str, field_name: str) -> FieldStrategy:
     def strategy(extractor: "ParsedK1RegexExtractor") -> str:
         return extractor._statement_total(label, field_name)
 
-    return strategy
+    return _with_anchors(strategy, [label])
 
 
 def _table_strategy(code: str, field_name: str) -> FieldStrategy:
@@ -300,13 +372,16 @@ def _table_regex_strategy(code: str, field_name: str) -> FieldStrategy:
 
 
 def _table_desc_or_value_strategy(code: str, field_name: str) -> FieldStrategy:
-    line_break_pattern = re.compile(r"(?:<br\s*/?>|\n)\s*([\d,.\-()]+)", re.IGNORECASE)
+    line_break_pattern = _deferred(
+        lambda: re.compile(r"(?:<br\s*/?>|\n)\s*([\d,.\-()]+)", re.IGNORECASE)
+    )
 
     def strategy(extractor: "ParsedK1RegexExtractor") -> str:
-        desc = extractor.table_descs.get(code.upper(), "")
-        if desc:
-            match = line_break_pattern.search(desc)
+        row = extractor._main_table_row(code)
+        if row is not None and row.desc:
+            match = extractor._regex_search(line_break_pattern(), row.desc)
             if match:
+                extractor._note_table_row(field_name, row)
                 extractor.contexts[field_name] = match.group(0).strip()
                 return _clean_numeric(match.group(1))
         return extractor._extract_table_value(code, field_name)
@@ -317,14 +392,36 @@ def _table_desc_or_value_strategy(code: str, field_name: str) -> FieldStrategy:
 def _section_row_numeric_strategy(
     section_pattern: str, row_pattern: str, field_name: str, *, flags: int = 0
 ) -> FieldStrategy:
-    combined_pattern = (
-        rf"{section_pattern}.*?"
-        rf"{row_pattern}.*?\|\s*(?:<b>)?\s*([()\d,.\-]+)\s*(?:</b>)?\s*\|"
-    )
-    return _numeric_regex_strategy(
-        combined_pattern,
-        field_name,
-        flags=flags | re.DOTALL | re.IGNORECASE,
+    row_suffix = r".*?\|\s*(?:<b>)?\s*([()\d,.\-]+)\s*(?:</b>)?\s*\|"
+    section_regex = _deferred(lambda: _compile_pattern(section_pattern, flags))
+    row_regex = _deferred(lambda: _compile_pattern(rf"{row_pattern}{row_suffix}", flags))
+    # Used only when the document has no recognizable section headers.
+    combined_pattern = rf"{section_pattern}.*?{row_pattern}{row_suffix}"
+    combined_regex = _deferred(lambda: _compile_pattern(combined_pattern, flags))
+
+    def strategy(extractor: "ParsedK1RegexExtractor") -> str:
+        sections = extractor.index.sections_matching(section_regex())
+        if not sections:
+            return _clean_numeric(
+                extractor._extract_with_regex(combined_regex(), field_name=field_name)
+            )
+        for section in sections:
+            try:
+                value = extractor._extract_with_regex(
+                    row_regex(),
+                    field_name=field_name,
+                    pos=section.start,
+                    endpos=section.end,
+                )
+            except ValueError:
+                continue
+            return _clean_numeric(value)
+        raise ValueError(f"{row_pattern} not found in {section_pattern} sections")
+
+    strategy._pattern = combined_pattern  # type: ignore[attr-defined]
+    # The row label is the more selective literal; both paths require it.
+    return _with_anchors(
+        strategy, [literal_anchor(row_pattern) or literal_anchor(section_pattern)]
     )
 
 
@@ -339,8 +436,9 @@ def _line13h_trading_strategy(field_name: str) -> FieldStrategy:
         try:
             return section_strategy(extractor)
         except ValueError:
+            extractor._note_fallback()
             fallback_value = extractor._extract_table_value("H", field_name)
-            if re.fullmatch(r"[\d,.\-()]+", fallback_value.strip()):
+            if NUMERIC_TOKEN.fullmatch(fallback_value.strip()):
                 return _clean_numeric(fallback_value)
             return extractor.base_values.get(field_name, "0")
 
@@ -351,7 +449,7 @@ def _table_first_line_strategy(code: str, field_name: str) -> FieldStrategy:
     def strategy(extractor: "ParsedK1RegexExtractor") -> str:
         raw = extractor._extract_table_value(code, field_name)
         if "<br" in raw.lower():
-            cleaned = re.split(r"<br\s*/?>", raw, flags=re.IGNORECASE)[0]
+            cleaned = HTML_BREAK.split(raw)[0]
         else:
             cleaned = raw
         cleaned = cleaned.strip()
@@ -363,7 +461,7 @@ def _table_first_line_strategy(code: str, field_name: str) -> FieldStrategy:
 def _table_numeric_text_strategy(code: str, field_name: str) -> FieldStrategy:
     def strategy(extractor: "ParsedK1RegexExtractor") -> str:
         raw = extractor._extract_table_value(code, field_name)
-        match = re.search(r"([\d\-]+)", raw)
+        match = extractor._regex_search(SIGNED_DIGITS, raw)
         if not match:
             raise ValueError(f"No numeric content found in row {code}")
         return match.group(1)
@@ -372,63 +470,66 @@ def _table_numeric_text_strategy(code: str, field_name: str) -> FieldStrategy:
 
 
 def _current_year_summary_strategy(label: str, field_name: str) -> FieldStrategy:
-    row_pattern = re.compile(
-        rf"^\|\s*{re.escape(label)}\s*\|\s*([\d,.\-()]+)\s*\|",
-        re.IGNORECASE | re.MULTILINE,
+    row_pattern = _deferred(
+        lambda: re.compile(
+            rf"^\|\s*{re.escape(label)}\s*\|\s*([\d,.\-()]+)\s*\|",
+            re.IGNORECASE | re.MULTILINE,
+        )
     )
 
     def strategy(extractor: "ParsedK1RegexExtractor") -> str:
-        marker = re.search(
-            r"SCHEDULE\s+K-1\s+CURRENT\s+YEAR\s+NET\s+INCOME", extractor.text, re.IGNORECASE
-        )
+        marker = extractor._regex_search(CURRENT_YEAR_SUMMARY_MARKER)
         if not marker:
             raise ValueError("Current year summary table not found.")
-        subset = extractor.text[marker.start() :]
-        match = row_pattern.search(subset)
+        match = extractor._regex_search(row_pattern(), pos=marker.start())
         if not match:
             raise ValueError(f"{label} not found in summary table")
         extractor.contexts[field_name] = match.group(0).strip()
+        extractor._note_span(field_name, match.span(1))
         return _clean_numeric(match.group(1))
 
-    return strategy
+    return _with_anchors(strategy, ["SCHEDULE K-1 CURRENT YEAR NET INCOME"])
 
 
 def _partnership_capital_row_strategy(field_name: str) -> FieldStrategy:
     def strategy(extractor: "ParsedK1RegexExtractor") -> str:
-        for line in extractor.text.splitlines():
-            if "ending capital account" not in line.lower():
-                continue
-            cells = [cell.strip() for cell in line.split("|")[1:-1]]
+        index = extractor.index
+        for line_no, line in index.lines_containing("ending capital account"):
+            cells = index.cells(line_no)
             for cell in reversed(cells):
-                match = re.search(r"([\d,.\-()]+)", cell)
+                match = extractor._regex_search(NUMERIC_TOKEN, cell)
                 if match:
                     extractor.contexts[field_name] = line.strip()
+                    extractor._note_span(field_name, index.line_offsets(line_no))
                     return _clean_numeric(match.group(1))
         raise ValueError("Ending capital account row not found.")
 
-    return strategy
+    return _with_anchors(strategy, ["ending capital account"])
 
 
 def _schedule_total_strategy(
     box: str, code: str, field_name: str
 ) -> FieldStrategy:
-    pattern = re.compile(
-        rf"TOTAL\s+TO\s+SCHEDULE\s+K-1,\s*BOX\s+{re.escape(box)}"
-        rf"[^|]*CODE\s+{re.escape(code)}"
-        rf"[^\|]*\|\s*[^\|]*\|\s*([\d,.\-()]+)\s*\|",
-        re.IGNORECASE,
+    pattern = _deferred(
+        lambda: re.compile(
+            rf"TOTAL\s+TO\s+SCHEDULE\s+K-1,\s*BOX\s+{re.escape(box)}"
+            rf"[^|]*CODE\s+{re.escape(code)}"
+            rf"[^\|]*\|\s*[^\|]*\|\s*([\d,.\-()]+)\s*\|",
+            re.IGNORECASE,
+        )
     )
 
     def strategy(extractor: "ParsedK1RegexExtractor") -> str:
-        match = pattern.search(extractor.text)
+        match = extractor._regex_search(pattern())
         if not match:
             raise ValueError(
                 f"Schedule total for Box {box} Code {code} not found."
             )
         extractor.contexts[field_name] = match.group(0).strip()
+        extractor._note_span(field_name, match.span(1))
         return _clean_numeric(match.group(1))
 
-    return strategy
+    return _with_anchors(strategy, ["TOTAL TO SCHEDULE K-1"])
 
 
 def _partnership_label_strategy(
@@ -437,16 +538,13 @@ def _partnership_label_strategy(
     normalized = label.lower()
 
     def strategy(extractor: "ParsedK1RegexExtractor") -> str:
-        for line in extractor.text.splitlines():
-            if normalized not in line.lower():
-                continue
-            cells = [cell.strip() for cell in line.split("|")[1:-1]]
+        index = extractor.index
+        for line_no, line in index.lines_containing(normalized):
+            cells = index.cells(line_no)
             candidate = ""
             for idx, cell in enumerate(cells):
                 if normalized in cell.lower():
-                    parts = re.split(
-                        r"<br\s*/?>", cell, maxsplit=1, flags=re.IGNORECASE
-                    )
+                    parts = HTML_BREAK.split(cell, maxsplit=1)
                     if len(parts) > 1 and parts[1].strip():
                         candidate = parts[1].strip()
                     elif idx + 1 < len(cells):
@@ -454,19 +552,18 @@ def _partnership_label_strategy(
                         candidate = next_cell.strip()
                     break
             if candidate:
-                candidate = re.split(
-                    r"<br\s*/?>", candidate, maxsplit=1, flags=re.IGNORECASE
-                )[0].strip()
+                candidate = HTML_BREAK.split(candidate, maxsplit=1)[0].strip()
                 if numeric:
-                    match = re.search(r"([\d\-]+)", candidate)
+                    match = extractor._regex_search(SIGNED_DIGITS, candidate)
                     if not match:
                         continue
                     candidate = match.group(1)
                 extractor.contexts[field_name] = line.strip()
+                extractor._note_span(field_name, index.line_offsets(line_no))
                 return candidate
         raise ValueError(f"Unable to locate value for {label}")
 
-    return strategy
+    return _with_anchors(strategy, [label])
 
 
 def _line_value_with_summary_strategy(
@@ -483,12 +580,14 @@ def _line_value_with_summary_strategy(
                 return value
         except ValueError:
             pass
+        extractor._note_fallback()
         try:
             value = lookup_strategy(extractor)
             if value and value != "0":
                 return value
         except ValueError:
             pass
+        extractor._note_fallback()
         return summary_strategy(extractor)
 
     return strategy
@@ -501,11 +600,15 @@ def _fallback_strategy(*strategies: FieldStrategy) -> FieldStrategy:
             try:
                 return candidate(extractor)
             except ValueError as exc:
+                extractor._note_fallback()
                 last_error = exc
         if last_error:
             raise last_error
         raise ValueError("No strategies provided.")
 
+    anchor_sets = [getattr(candidate, "_anchors", None) for candidate in strategies]
+    if strategies and all(anchor_sets):
+        _with_anchors(strategy, [anchor for group in anchor_sets for anchor in group])
     return strategy
 
 
@@ -513,13 +616,31 @@ def _brute_force_strategy(field_name: str) -> FieldStrategy:
     def strategy(extractor: "ParsedK1RegexExtractor") -> str:
         cached = extractor.brute_force_cache.get(field_name)
         if cached is not None:
+            extractor._note_span(field_name, extractor.brute_force_spans.get(field_name))
             return cached
 
-        # Brute force is a last-resort fallback and can be expensive. For the majority of
-        # fields we simply return the default placeholder value rather than spawning
-        # extra processes to hunt for a match. This keeps unit tests fast while
-        # preserving deterministic defaults.
-        value = extractor.base_values.get(field_name, "0")
+        outcome = extractor._search_brute_force(field_name)
+        extractor._count_regex(outcome.patterns_tried)
+        notes: Dict[str, object] = {
+            "elapsed": round(outcome.elapsed, 6),
+            "patterns_tried": outcome.patterns_tried,
+            "timed_out": outcome.timed_out,
+        }
+        if outcome.match is None:
+            value = extractor.base_values.get(field_name, "0")
+        else:
+            value = outcome.match.value
+            if outcome.match.numeric:
+                value = _clean_numeric(value)
+            extractor.contexts[field_name] = outcome.match.snippet.replace("\n", " ").strip()
+            # Snippets are slices of the document; map the value back onto it.
+            offset = extractor.text.find(outcome.match.snippet)
+            if offset >= 0:
+                start, end = outcome.match.span
+                extractor.brute_force_spans[field_name] = (offset + start, offset + end)
+                extractor._note_span(field_name, extractor.brute_force_spans[field_name])
+            notes["pattern"] = outcome.match.pattern
+        extractor.strategy_notes[field_name] = notes
         extractor.brute_force_cache[field_name] = value
         return value
 
@@ -557,110 +678,663 @@ FIELD_KEYS = load_field_keys()
 DOC1_FIELD_TEMPLATE = {key: "0" for key in FIELD_KEYS}
 
 
+@dataclass(frozen=True)
+class FieldPlan:
+    """Resolved strategy choice for one field."""
+
+    field_name: str
+    strategy_name: str
+    strategy: FieldStrategy
+    pattern: str = ""
+    anchors: Tuple[str, ...] = ()
+
+    @classmethod
+    def for_strategy(
+        cls, field_name: str, strategy_name: str, strategy: FieldStrategy
+    ) -> "FieldPlan":
+        return cls(
+            field_name=field_name,
+            strategy_name=strategy_name,
+            strategy=strategy,
+            pattern=getattr(strategy, "_pattern", ""),
+            anchors=getattr(strategy, "_anchors", ()),
+        )
+
+
+# Some layouts print a sign in front of this amount; the config never wants it.
+_PLUS_STRIPPED_FIELD = "line_20N_interest_expense_for_corporate_partners"
+
+
+def _normalize_output(value: object) -> str:
+    return _strip_html_breaks(value) if isinstance(value, str) else str(value)
+
+
+class RegexExtractionEngine:
+    """Reusable, immutable extraction plan for one strategy config.
+
+    The engine resolves the configured strategy for every field once and is
+    safe to share across threads; all per-document state lives on
+    `ParsedK1RegexExtractor`. Each strategy runs under `strategy_budget`
+    seconds and a document stops starting new strategies once
+    `document_budget` is spent; offenders are noted in `used_strategies`.
+    Every field run is recorded as a `StrategyRun` on the extractor and in the
+    process-wide `EXTRACTION_METRICS`.
+    """
+
+    def __init__(
+        self,
+        strategy_config: Optional[Mapping[str, str]] = None,
+        *,
+        field_strategies: Optional[Mapping[str, Mapping[str, FieldStrategy]]] = None,
+        strategy_budget: float = STRATEGY_BUDGET_SECONDS,
+        document_budget: float = DOCUMENT_BUDGET_SECONDS,
+    ):
+        self.strategy_config: Mapping[str, str] = MappingProxyType(
+            dict(strategy_config or {})
+        )
+        self.strategy_budget = strategy_budget
+        self.document_budget = document_budget
+        self.field_strategies: Mapping[str, Mapping[str, FieldStrategy]] = (
+            FIELD_STRATEGIES if field_strategies is None else field_strategies
+        )
+        self.plans: Tuple[FieldPlan, ...] = self._resolve_plans(self.field_strategies)
+        self.plans_by_field: Mapping[str, FieldPlan] = MappingProxyType(
+            {plan.field_name: plan for plan in self.plans}
+        )
+        self.prefilter = AnchorPrefilter(
+            anchor for plan in self.plans for anchor in plan.anchors
+        )
+        self._subset_prefilters: Dict[Tuple[str, ...], AnchorPrefilter] = {}
+        self._subset_lock = threading.Lock()
+        self._worker_spec: Optional[Tuple[Any, ...]] = None
+        self._worker_spec_checked = False
+
+    def _resolve_plans(
+        self, field_strategies: Mapping[str, Mapping[str, FieldStrategy]]
+    ) -> Tuple[FieldPlan, ...]:
+        plans: list[FieldPlan] = []
+        for field_name, strategies in field_strategies.items():
+            if not strategies:
+                continue
+            configured_name = self.strategy_config.get(field_name)
+            chosen_name = (
+                configured_name if configured_name in strategies else None
+            )
+            if not chosen_name:
+                # Brute force is opt-in: it is never picked as the default.
+                chosen_name = next(
+                    (name for name in strategies if name != "brute_force"), None
+                )
+                if chosen_name is None:
+                    continue
+            plans.append(
+                FieldPlan.for_strategy(field_name, chosen_name, strategies[chosen_name])
+            )
+        return tuple(plans)
+
+    def document(
+        self,
+        text: str,
+        field_defaults: Optional[Mapping[str, str]] = None,
+        *,
+        index: Optional[DocumentIndex] = None,
+    ) -> "ParsedK1RegexExtractor":
+        """Create the per-document state bound to this engine."""
+        return ParsedK1RegexExtractor(
+            text, field_defaults=field_defaults, engine=self, index=index
+        )
+
+    def _select(
+        self, fields: Iterable[str], known: Mapping[str, str]
+    ) -> Tuple[Tuple[FieldPlan, ...], Tuple[str, ...], AnchorPrefilter]:
+        requested = tuple(dict.fromkeys(fields))
+        unknown = [
+            name
+            for name in requested
+            if name not in self.plans_by_field and name not in known
+        ]
+        if unknown:
+            raise ValueError(f"Unknown extraction fields: {', '.join(unknown)}")
+        plans = tuple(
+            self.plans_by_field[name]
+            for name in requested
+            if name in self.plans_by_field
+        )
+        key = tuple(plan.field_name for plan in plans)
+        with self._subset_lock:
+            prefilter = self._subset_prefilters.get(key)
+            if prefilter is None:
+                prefilter = AnchorPrefilter(
+                    anchor for plan in plans for anchor in plan.anchors
+                )
+                self._subset_prefilters[key] = prefilter
+        return plans, requested, prefilter
+
+    def _run_budgeted(
+        self,
+        plan: FieldPlan,
+        extractor: "ParsedK1RegexExtractor",
+        used: Dict[str, object],
+        run: StrategyRun,
+    ) -> str:
+        aborted = False
+        default = extractor.base_values.get(plan.field_name, "0")
+        extractor.spans.pop(plan.field_name, None)
+        extractor._active_run = run
+        began = time.perf_counter()
+        try:
+            with time_limit(self.strategy_budget):
+                value = plan.strategy(extractor)
+            # Several strategies return the field default rather than raising
+            # when nothing is found; a hit is a value located in the document,
+            # even one that equals the default (a real "0" row).
+            run.outcome = MATCH if plan.field_name in extractor.spans else NO_MATCH
+        except ValueError:
+            value = default
+        except StrategyTimeout:
+            aborted = True
+            run.outcome = ABORTED
+            value = default
+        finally:
+            extractor._active_run = None
+        elapsed = time.perf_counter() - began
+        run.elapsed = elapsed
+        used.update(extractor.strategy_notes.get(plan.field_name, {}))
+        over_budget = elapsed > self.strategy_budget
+        SLOW_PATTERNS.record(
+            plan.field_name,
+            plan.strategy_name,
+            str(used.get("pattern", "")),
+            elapsed,
+            over_budget=over_budget,
+            aborted=aborted,
+        )
+        if aborted or over_budget:
+            used["budget"] = "aborted" if aborted else "exceeded"
+            used["elapsed"] = round(elapsed, 6)
+        return value
+
+    def run(
+        self,
+        extractor: "ParsedK1RegexExtractor",
+        fields: Optional[Iterable[str]] = None,
+    ) -> Dict[str, str]:
+        """Run the resolved strategies against one document.
+
+        With `fields`, only the plans for those fields run and only those keys
+        are returned; views such as the main table are built only if one of
+        the selected strategies reads them.
+
+        Off the main thread no timer can interrupt a runaway pattern, so a
+        document of `ISOLATED_DOCUMENT_MIN_CHARS` or more is extracted on a
+        CPU pool worker instead. The worker's budgets start when it picks the
+        job up, so time spent queued never changes the values extracted.
+        """
+        spec = self._isolation_spec(extractor)
+        if spec is not None:
+            return self._run_isolated(spec, extractor, fields)
+        data, runs, elapsed = self._run_plans(extractor, fields)
+        EXTRACTION_METRICS.record_document(runs, elapsed)
+        return data
+
+    def _isolation_spec(self, extractor: "ParsedK1RegexExtractor") -> Optional[Tuple[Any, ...]]:
+        """What a worker needs to rebuild this engine, when the document should go to one."""
+        if (
+            self.strategy_budget <= 0
+            or len(extractor.text) < ISOLATED_DOCUMENT_MIN_CHARS
+            or interruptible_here()
+        ):
+            return None
+        if not self._worker_spec_checked:
+            field_strategies = (
+                None
+                if self.field_strategies is FIELD_STRATEGIES
+                else {name: dict(named) for name, named in self.field_strategies.items()}
+            )
+            spec = (
+                tuple(sorted(self.strategy_config.items())),
+                field_strategies,
+                self.strategy_budget,
+                self.document_budget,
+            )
+            try:
+                pickle.dumps(spec)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                # Ad-hoc strategies (closures, lambdas) can only run in-process.
+                spec = None
+            self._worker_spec, self._worker_spec_checked = spec, True
+        return self._worker_spec
+
+    def _run_isolated(
+        self,
+        spec: Tuple[Any, ...],
+        extractor: "ParsedK1RegexExtractor",
+        fields: Optional[Iterable[str]],
+    ) -> Dict[str, str]:
+        selected = None if fields is None else tuple(fields)
+        future = _isolation_executor().submit(
+            _extract_in_worker, spec, extractor.text, extractor.base_values, selected
+        )
+        data, state, elapsed = future.result()
+        for name, values in state.items():
+            getattr(extractor, name).update(values)
+        runs = list(state["strategy_runs"].values())
+        # The worker's process-wide logs are not this process's; record here.
+        for run in runs:
+            if run.outcome in (PREFILTER_MISS, SKIPPED):
+                continue
+            SLOW_PATTERNS.record(
+                run.field,
+                run.strategy,
+                str(extractor.used_strategies.get(run.field, {}).get("pattern", "")),
+                run.elapsed,
+                over_budget=run.elapsed > self.strategy_budget,
+                aborted=run.outcome == ABORTED,
+            )
+        EXTRACTION_METRICS.record_document(runs, elapsed)
+        return data
+
+    def _run_plans(
+        self,
+        extractor: "ParsedK1RegexExtractor",
+        fields: Optional[Iterable[str]],
+    ) -> Tuple[Dict[str, str], list[StrategyRun], float]:
+        if fields is None:
+            plans, prefilter = self.plans, self.prefilter
+            data: Dict[str, str] = dict(extractor.base_values)
+        else:
+            plans, requested, prefilter = self._select(fields, extractor.base_values)
+            data = {name: extractor.base_values.get(name, "0") for name in requested}
+        started = time.perf_counter()
+        present = extractor.index.anchors_present(prefilter)
+        extractor.prefilter_stats = {"hits": 0, "misses": 0}
+
+        for plan in plans:
+            used = {"name": plan.strategy_name, "pattern": plan.pattern}
+            run = StrategyRun(field=plan.field_name, strategy=plan.strategy_name)
+            extractor.strategy_runs[plan.field_name] = run
+            if plan.anchors and present.isdisjoint(plan.anchors):
+                # None of the literals the strategy needs occur; it cannot match.
+                extractor.prefilter_stats["misses"] += 1
+                used["prefilter"] = "miss"
+                run.outcome = PREFILTER_MISS
+                value = extractor.base_values.get(plan.field_name, "0")
+            elif time.perf_counter() - started > self.document_budget:
+                used["budget"] = "skipped"
+                run.outcome = SKIPPED
+                value = extractor.base_values.get(plan.field_name, "0")
+            else:
+                if plan.anchors:
+                    extractor.prefilter_stats["hits"] += 1
+                    used["prefilter"] = "hit"
+                value = self._run_budgeted(plan, extractor, used, run)
+            data[plan.field_name] = _normalize_output(value)
+            extractor.used_strategies[plan.field_name] = used
+
+        if _PLUS_STRIPPED_FIELD in data:
+            data[_PLUS_STRIPPED_FIELD] = data[_PLUS_STRIPPED_FIELD].lstrip("+")
+        for key in data:
+            extractor.contexts.setdefault(key, "default")
+        runs = [extractor.strategy_runs[plan.field_name] for plan in plans]
+        return data, runs, time.perf_counter() - started
+
+    def run_plan(
+        self,
+        plan: FieldPlan,
+        extractor: "ParsedK1RegexExtractor",
+        present: Optional[frozenset[str]] = None,
+    ) -> Tuple[str, StrategyRun]:
+        """Run a single plan, configured or not, e.g. a candidate being tuned.
+
+        `present` is an anchor scan covering the plan; when none of the plan's
+        anchors occur, the field's default is returned without running it.
+        Returns the value exactly as `run` would report it, plus the run record.
+        """
+        run = StrategyRun(field=plan.field_name, strategy=plan.strategy_name)
+        if plan.anchors and present is not None and present.isdisjoint(plan.anchors):
+            run.outcome = PREFILTER_MISS
+            value = extractor.base_values.get(plan.field_name, "0")
+        else:
+            used = {"name": plan.strategy_name, "pattern": plan.pattern}
+            value = self._run_budgeted(plan, extractor, used, run)
+        normalized = _normalize_output(value)
+        if plan.field_name == _PLUS_STRIPPED_FIELD:
+            normalized = normalized.lstrip("+")
+        return normalized, run
+
+    def candidate_matrix(
+        self,
+        extractor: "ParsedK1RegexExtractor",
+        fields: Optional[Iterable[str]] = None,
+        *,
+        include_brute_force: bool = False,
+    ) -> CandidateMatrix:
+        """Run every registered strategy per field against one document.
+
+        All candidates share the extractor's index and main-table parse, and
+        one anchor scan covers them all. The extractor's contexts and spans
+        are left as they were.
+        """
+        names = (
+            list(dict.fromkeys(fields)) if fields is not None else list(self.field_strategies)
+        )
+        unknown = [name for name in names if name not in self.field_strategies]
+        if unknown:
+            raise ValueError(f"Unknown extraction fields: {', '.join(unknown)}")
+        plans = [
+            FieldPlan.for_strategy(field_name, strategy_name, strategy)
+            for field_name in names
+            for strategy_name, strategy in self.field_strategies[field_name].items()
+            if include_brute_force or strategy_name != "brute_force"
+        ]
+        present = extractor.index.anchors_present(
+            AnchorPrefilter(anchor for plan in plans for anchor in plan.anchors)
+        )
+        saved_contexts, saved_spans = dict(extractor.contexts), dict(extractor.spans)
+        strategies: Dict[str, Tuple[str, ...]] = {}
+        cells: Dict[Tuple[str, str], Candidate] = {}
+        try:
+            for plan in plans:
+                extractor.spans.pop(plan.field_name, None)
+                value, run = self.run_plan(plan, extractor, present)
+                strategies[plan.field_name] = strategies.get(plan.field_name, ()) + (
+                    plan.strategy_name,
+                )
+                cells[(plan.field_name, plan.strategy_name)] = Candidate(
+                    value=value,
+                    span=extractor.spans.get(plan.field_name) if run.outcome == MATCH else None,
+                    outcome=run.outcome,
+                    elapsed=run.elapsed,
+                )
+        finally:
+            extractor.contexts, extractor.spans = saved_contexts, saved_spans
+        selected = {}
+        for field_name, candidates in strategies.items():
+            plan = self.plans_by_field.get(field_name)
+            selected[field_name] = (
+                plan.strategy_name
+                if plan is not None and plan.strategy_name in candidates
+                else next((name for name in candidates if name != "brute_force"), candidates[0])
+            )
+        return CandidateMatrix(
+            strategies=MappingProxyType(strategies),
+            selected=MappingProxyType(selected),
+            cells=MappingProxyType(cells),
+        )
+
+
+_ENGINE_CACHE: Dict[Tuple[Tuple[str, str], ...], RegexExtractionEngine] = {}
+_ENGINE_LOCK = threading.Lock()
+
+
+def get_extraction_engine(
+    strategy_config: Optional[Mapping[str, str]] = None,
+) -> RegexExtractionEngine:
+    """Return the shared engine for a strategy config, building it on first use.
+
+    Passing no config uses `regex_field_config.yaml` through the config cache,
+    so edits to the file are picked up without a restart.
+    """
+    if not strategy_config:
+        strategy_config = cached_field_strategy_config()
+    key = tuple(sorted(strategy_config.items()))
+    with _ENGINE_LOCK:
+        engine = _ENGINE_CACHE.get(key)
+        if engine is None:
+            engine = RegexExtractionEngine(strategy_config)
+            _ENGINE_CACHE[key] = engine
+        return engine
+
+
+# Per-document state a worker hands back with the values (see `_extract_in_worker`).
+_ISOLATED_STATE = (
+    "contexts",
+    "spans",
+    "used_strategies",
+    "prefilter_stats",
+    "strategy_notes",
+    "strategy_runs",
+    "brute_force_spans",
+)
+_WORKER_ENGINES: Dict[Tuple[Any, ...], RegexExtractionEngine] = {}
+
+
+def _extract_in_worker(
+    spec: Tuple[Any, ...],
+    text: str,
+    field_defaults: Mapping[str, str],
+    fields: Optional[Tuple[str, ...]],
+) -> Tuple[Dict[str, str], Dict[str, Dict[str, Any]], float]:
+    # Runs on a pool worker's main thread, where every strategy timer can fire.
+    config, field_strategies, strategy_budget, document_budget = spec
+    engine = _WORKER_ENGINES.get(spec) if field_strategies is None else None
+    if engine is None:
+        engine = RegexExtractionEngine(
+            dict(config),
+            field_strategies=field_strategies,
+            strategy_budget=strategy_budget,
+            document_budget=document_budget,
+        )
+        if field_strategies is None:
+            _WORKER_ENGINES[spec] = engine
+    extractor = engine.document(text, field_defaults=field_defaults)
+    data, _runs, elapsed = engine._run_plans(extractor, fields)
+    return data, {name: getattr(extractor, name) for name in _ISOLATED_STATE}, elapsed
+
+
+def clear_extraction_engines() -> None:
+    """Drop cached engines so strategy or config changes are picked up."""
+    from .versions import STRATEGY_VERSIONS
+
+    with _ENGINE_LOCK:
+        _ENGINE_CACHE.clear()
+    STRATEGY_VERSIONS.clear()
+
+
 @dataclass
 class ParsedK1RegexExtractor:
+    """Per-document extraction state; strategy resolution lives on the engine."""
+
     text: str
     field_defaults: Optional[Mapping[str, str]] = None
     strategy_config: Optional[Mapping[str, str]] = None
+    engine: Optional[RegexExtractionEngine] = None
+    index: Optional[DocumentIndex] = None
 
     def __post_init__(self) -> None:
-        self.table_contexts: Dict[str, str] = {}
-        self.table_descs: Dict[str, str] = {}
+        if self.index is None:
+            self.index = DocumentIndex(self.text)
         self.contexts: Dict[str, str] = {}
-        self.brute_force_cache: Dict[str, str] = {}
+        self.spans: Dict[str, Tuple[int, int]] = {}
         self.used_strategies: Dict[str, Dict[str, str]] = {}
-        self.table_values = self._parse_main_table()
+        self.prefilter_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._main_table: Optional[Tuple[Dict, ...]] = None
+        self._brute_force_cache: Optional[Dict[str, str]] = None
+        self.brute_force_spans: Dict[str, Tuple[int, int]] = {}
+        self._brute_force_deadline: Optional[float] = None
+        self.strategy_notes: Dict[str, Dict[str, object]] = {}
+        self.strategy_runs: Dict[str, StrategyRun] = {}
+        self._active_run: Optional[StrategyRun] = None
         base = self.field_defaults or DOC1_FIELD_TEMPLATE
         self.base_values = dict(base)
-        self.strategy_config_map = dict(
-            self.strategy_config or load_field_strategy_config()
-        )
-
-    def _parse_main_table(self) -> Dict[str, str]:
-        values: Dict[str, str] = {}
-        for match in MAIN_TABLE_ROW.finditer(self.text):
-            code = match.group("code").strip().upper()
-            value = _clean_numeric(match.group("value"))
-            values.setdefault(code, value)
-            self.table_contexts[code] = match.group(0).strip()
-            self.table_descs[code] = match.group("desc")
-        return values
+        if self.engine is None:
+            self.engine = get_extraction_engine(self.strategy_config)
+
+    @property
+    def strategy_config_map(self) -> Mapping[str, str]:
+        return self.engine.strategy_config
+
+    @property
+    def table_values(self) -> Dict[str, str]:
+        return self._parse_main_table()[0]
+
+    @property
+    def table_contexts(self) -> Dict[str, str]:
+        return self._parse_main_table()[1]
+
+    @property
+    def table_descs(self) -> Dict[str, str]:
+        return self._parse_main_table()[2]
+
+    @property
+    def table_spans(self) -> Dict[str, Tuple[int, int]]:
+        return self._parse_main_table()[3]
+
+    @property
+    def brute_force_cache(self) -> Dict[str, str]:
+        if self._brute_force_cache is None:
+            self._brute_force_cache = {}
+        return self._brute_force_cache
+
+    def _parse_main_table(self) -> Tuple[Dict, ...]:
+        """Build (values, contexts, descs, spans) for the face table on first use."""
+        if self._main_table is None:
+            values: Dict[str, str] = {}
+            contexts: Dict[str, str] = {}
+            descs: Dict[str, str] = {}
+            spans: Dict[str, Tuple[int, int]] = {}
+            for row in self.index.main_table_rows:
+                if row.code in values:
+                    continue
+                values[row.code] = _clean_numeric(row.value)
+                contexts[row.code] = row.context
+                descs[row.code] = row.desc
+                spans[row.code] = (row.start, row.start + len(row.context))
+            self._main_table = (values, contexts, descs, spans)
+        return self._main_table
 
     def _extract_with_regex(
-        self, pattern: str, field_name: str, flags: int = 0
+        self,
+        pattern: str | re.Pattern[str],
+        field_name: str,
+        flags: int = 0,
+        *,
+        pos: int = 0,
+        endpos: Optional[int] = None,
     ) -> str:
-        regex_flags = re.IGNORECASE | re.DOTALL | flags
-        match = re.search(pattern, self.text, regex_flags)
+        compiled = (
+            pattern
+            if isinstance(pattern, re.Pattern)
+            else _compile_pattern(pattern, flags)
+        )
+        if endpos is None:
+            endpos = len(self.text)
+        match = self._regex_search(compiled, pos=pos, endpos=endpos)
         if not match:
-            raise ValueError(f"Pattern not found: {pattern}")
+            raise ValueError(f"Pattern not found: {compiled.pattern}")
         span = match.span(1)
         excerpt = self.text[max(0, span[0] - 80) : span[1] + 80].replace("\n", " ")
         self.contexts[field_name] = excerpt.strip()
+        self.spans[field_name] = span
         value = match.group(1).strip()
         value = value.rstrip("|").strip()
         return value
 
+    def _regex_search(
+        self,
+        pattern: re.Pattern[str],
+        text: Optional[str] = None,
+        *,
+        pos: int = 0,
+        endpos: Optional[int] = None,
+    ) -> Optional[re.Match[str]]:
+        """Search `text` (the document by default), counting the call for metrics."""
+        self._count_regex()
+        target = self.text if text is None else text
+        return pattern.search(target, pos, len(target) if endpos is None else endpos)
+
+    def _count_regex(self, calls: int = 1) -> None:
+        if self._active_run is not None:
+            self._active_run.regex_calls += calls
+
+    def _note_span(self, field_name: str, span: Optional[Tuple[int, int]]) -> None:
+        """Remember where in the document a field's value came from."""
+        if span is None:
+            self.spans.pop(field_name, None)
+        else:
+            self.spans[field_name] = span
+
+    def _note_fallback(self) -> None:
+        """Record that a candidate strategy failed and the next one is tried."""
+        if self._active_run is not None:
+            self._active_run.fallback_depth += 1
+
+    def _main_table_row(self, code: str) -> Optional[MainTableRow]:
+        """The face-table row for `code`, looked up in the table index.
+
+        Supplemental statements reuse codes such as `A` and `H`; the first
+        row wins, as it always has.
+        """
+        by_start = self.index.main_table_by_start
+        for row in self.index.tables.by_code(code, include_headers=True):
+            main = by_start.get(row.start)
+            if main is not None:
+                return main
+        return None
+
+    def _note_table_row(self, field_name: str, row: MainTableRow) -> None:
+        self.contexts[field_name] = row.context
+        self._note_span(field_name, (row.start, row.start + len(row.context)))
+
     def _extract_table_value(self, code: str, field_name: str) -> str:
-        value = self.table_values.get(code.upper(), "0")
-        self.contexts[field_name] = self.table_contexts.get(code.upper(), "")
-        return value
-    
+        row = self._main_table_row(code)
+        if row is None:
+            self.contexts[field_name] = ""
+            self._note_span(field_name, None)
+            return "0"
+        self._note_table_row(field_name, row)
+        return _clean_numeric(row.value)
+
     def _table_value_by_label(self, label: str, field_name: str) -> str:
         normalized = label.lower()
-        for match in MAIN_TABLE_ROW.finditer(self.text):
-            desc = match.group("desc").strip()
-            if normalized in desc.lower():
-                value = match.group("value").strip()
-                self.contexts[field_name] = match.group(0).strip()
-                return value
+        by_start = self.index.main_table_by_start
+        for row in self.index.tables.by_label(label, include_headers=True):
+            main = by_start.get(row.start)
+            if main is not None and normalized in main.desc.strip().lower():
+                self._note_table_row(field_name, main)
+                return main.value.strip()
         raise ValueError(f"Row with label '{label}' not found.")
 
     def _statement_total(self, label: str, field_name: str) -> str:
         return _clean_numeric(
             self._extract_with_regex(
-                rf"{label}[^\n]*\|\s*([\d,.\-()]+)\s*\|", field_name=field_name
+                _statement_pattern(label), field_name=field_name
             )
         )
 
-    def extract(self) -> Dict[str, str]:
-        data: Dict[str, str] = dict(self.base_values)
+    def extract(self, fields: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Extract every configured field, or only `fields` when given."""
+        return self.engine.run(self, fields)
 
-        for field_name, strategies in FIELD_STRATEGIES.items():
-            if not strategies:
-                continue
-            configured_name = self.strategy_config_map.get(field_name)
-            chosen_name = (
-                configured_name if configured_name in strategies else None
-            )
-            if not chosen_name:
-                chosen_name = next(iter(strategies))
-            strategy = strategies[chosen_name]
-            try:
-                value = strategy(self)
-            except ValueError:
-                value = self.base_values.get(field_name, "0")
-            normalized = (
-                _strip_html_breaks(value)
-                if isinstance(value, str)
-                else str(value)
-            )
-            data[field_name] = normalized
-            self.used_strategies[field_name] = {
-                "name": chosen_name,
-                "pattern": getattr(strategy, "_pattern", ""),
+    def candidate_matrix(
+        self, fields: Optional[Iterable[str]] = None, *, include_brute_force: bool = False
+    ) -> CandidateMatrix:
+        """Evaluate every registered strategy per field; see the engine method."""
+        return self.engine.candidate_matrix(
+            self, fields, include_brute_force=include_brute_force
+        )
+
+    def slowest_strategies(self, limit: int = 5) -> list[Dict[str, object]]:
+        """Return the slowest strategy runs for this document, slowest first."""
+        ranked = sorted(self.strategy_runs.values(), key=lambda run: -run.elapsed)
+        return [
+            {
+                "field": run.field,
+                "strategy": run.strategy,
+                "pattern": self.used_strategies.get(run.field, {}).get("pattern", ""),
+                "elapsed": round(run.elapsed, 6),
             }
+            for run in ranked[:limit]
+        ]
 
-        data["line_20N_interest_expense_for_corporate_partners"] = data[
-            "line_20N_interest_expense_for_corporate_partners"
-        ].lstrip("+")
-        for key in data:
-            self.contexts.setdefault(key, "default")
-        return data
+    def strategy_metrics(self) -> Dict[str, Dict[str, object]]:
+        """Per-field timing, outcome, fallback depth and regex call counts."""
+        return {field_name: run.as_dict() for field_name, run in self.strategy_runs.items()}
 
     def _gather_brute_force_snippets(self, field_name: str) -> list[str]:
         tokens = _tokenize_field_name(field_name)
         snippets: list[str] = []
-        upper_text = self.text.upper()
+        upper_text = self.index.upper_text
         for token in tokens:
             upper_token = token.upper()
             if len(upper_token) < 3:
@@ -685,14 +1359,37 @@ class ParsedK1RegexExtractor:
         cached = _get_cached_brute_force_patterns(field_name)
         if cached:
             return cached
-        executor = _ensure_brute_force_executor()
-        future = executor.submit(_build_brute_force_patterns_for_field, field_name)
-        patterns = future.result()
+        patterns = _build_brute_force_patterns_for_field(field_name)
         if not patterns:
             patterns = [(r"([\d,.\-()]+)", True)]
         _set_cached_brute_force_patterns(field_name, patterns)
         return patterns
 
+    def _search_brute_force(self, field_name: str) -> BruteForceOutcome:
+        """Search the field's snippets within the field and document budgets."""
+        now = time.perf_counter()
+        if self._brute_force_deadline is None:
+            self._brute_force_deadline = now + BRUTE_FORCE_DOCUMENT_BUDGET_SECONDS
+        budget = min(BRUTE_FORCE_FIELD_BUDGET_SECONDS, self._brute_force_deadline - now)
+        if budget <= 0:
+            return BruteForceOutcome(match=None, elapsed=0.0, patterns_tried=0, timed_out=True)
+
+        patterns = tuple(self._generate_brute_force_patterns(field_name))
+        snippets = self._gather_brute_force_snippets(field_name)
+        workload = len(patterns) * sum(len(snippet) for snippet in snippets)
+        parallel = workload >= BRUTE_FORCE_PARALLEL_WORKLOAD
+        if not parallel and interruptible_here():
+            return search_patterns(patterns, snippets, budget)
+        # Off the main thread only a worker's timer can stop a runaway pattern.
+        executor = _ensure_brute_force_executor()
+        return search_patterns_parallel(
+            executor,
+            patterns,
+            snippets,
+            budget,
+            slices=executor.max_workers if parallel else 1,
+        )
+
 
 TABLE_FIELD_CODES = {
     "1": "line_1_ordinary_business_income_loss",
@@ -719,10 +1416,12 @@ FIELD_STRATEGIES = {
         "cover_page_block": _regex_strategy(
             r"Partnership's name.*?<br>([^\n<]+)",
             "partnership_name",
+            anchors=["Partnership's name"],
         ),
         "cover_page_line_header": _regex_strategy(
             r"Partnership['']s name[^<]+<br>\s*([^\n<]+)",
             "partnership_name",
+            anchors=["Partnership's name"],
         ),
     },
     "partnership_employer_identification_number": {
@@ -734,10 +1433,12 @@ FIELD_STRATEGIES = {
         "official_label": _regex_strategy(
             r"employer identification number<br>([\d\-]+)",
             "partnership_employer_identification_number",
+            anchors=["employer identification number"],
         ),
         "loose_ein_header": _regex_strategy(
             r"(?:EIN|Identification number)[:\s]+([\d\-]+)",
             "partnership_employer_identification_number",
+            anchors=["EIN", "Identification number"],
         ),
     },
     "line_18b_other_tax_exempt_income": {
@@ -795,6 +1496,7 @@ FIELD_STRATEGIES = {
         "credits_section": _numeric_regex_strategy(
             r"15\s+Credits.*?O\s+([\d,.\-()]+)",
             "line_15o_backup_withholding",
+            anchors=["15 Credits"],
         ),
         "loose_code_scan": _numeric_regex_strategy(
             r"line\s*15[^|]*code\s*O.*?\$?\s*([\d,.\-()]+)",
@@ -822,20 +1524,24 @@ FIELD_STRATEGIES = {
         "currency_label": _numeric_regex_strategy(
             r"Capital contributed during the year.*?\$\s*([\d,.\-()]+)",
             "capital_contributions_during_year",
+            anchors=["Capital contributed during the year"],
         ),
         "loose_currency_label": _numeric_regex_strategy(
             r"Capital contributed during the year.*?([\d,.\-()]+)",
             "capital_contributions_during_year",
+            anchors=["Capital contributed during the year"],
         ),
     },
     "withdrawals_and_distributions_cash": {
         "currency_label": _numeric_regex_strategy(
             r"Withdrawals and distributions.*?\$\s*([\d,.\-()]+)",
             "withdrawals_and_distributions_cash",
+            anchors=["Withdrawals and distributions"],
         ),
         "loose_currency_label": _numeric_regex_strategy(
             r"Withdrawals and distributions.*?([\d,.\-()]+)",
             "withdrawals_and_distributions_cash",
+            anchors=["Withdrawals and distributions"],
         ),
     },
     "ending_capital_account": {
@@ -845,10 +1551,12 @@ FIELD_STRATEGIES = {
         "currency_label": _numeric_regex_strategy(
             r"Ending capital account.*?\$\s*([\d,.\-()]+)",
             "ending_capital_account",
+            anchors=["Ending capital account"],
         ),
         "loose_currency_label": _numeric_regex_strategy(
             r"Ending capital account.*?([\d,.\-()]+)",
             "ending_capital_account",
+            anchors=["Ending capital account"],
         ),
     },
     "line_5_interest_income_us_government_interest": {
@@ -940,24 +1648,23 @@ for code, field in TABLE_FIELD_CODES.items():
     strategies["table_lookup"] = _table_strategy(code, field)
     strategies["table_regex_scan"] = _table_regex_strategy(code, field)
 
+# Every known field can opt into brute force from regex_field_config.yaml,
+# including fields that have no hand-written strategy yet.
 for field in FIELD_KEYS:
     strategies = FIELD_STRATEGIES.setdefault(field, {})
-    if strategies:
-        strategies.setdefault("brute_force", _brute_force_strategy(field))
+    strategies.setdefault("brute_force", _brute_force_strategy(field))
 
 def extract_fields_from_file(
     path: Path,
     field_defaults: Optional[Mapping[str, str]] = None,
     strategy_config: Optional[Mapping[str, str]] = None,
     return_context: bool = False,
+    fields: Optional[Iterable[str]] = None,
 ) -> Dict[str, str]:
     text = path.read_text(encoding="utf-8")
-    extractor = ParsedK1RegexExtractor(
-        text,
-        field_defaults=field_defaults,
-        strategy_config=strategy_config,
-    )
-    result = extractor.extract()
+    engine = get_extraction_engine(strategy_config)
+    extractor = engine.document(text, field_defaults=field_defaults)
+    result = extractor.extract(fields)
     if return_context:
         return result, extractor.contexts, extractor.used_strategies
     return result
@@ -0,0 +1,202 @@
+"""Streaming tokenizer for the pipe tables in Datalab markdown.
+
+One linear pass over the document's lines groups consecutive table lines into
+`MarkdownTable`s with their header (when a `|---|` separator follows the first
+row), body rows, cells with their character spans, numeric columns and the
+page they came from. Each table line is split once with `str.split("|")`; the
+stripped cells, pipe offsets and numeric columns are derived from those parts
+on first use. The cost therefore stays proportional to the text, even for the
+very large tabular statements of fund-of-funds K-1s. `TableIndex` then answers
+lookups by code, label or column without re-splitting or regex-scanning table
+text.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ..pdf_pages import PAGE_MARKER
+from .numeric_index import NUMERIC_TOKEN_PATTERN
+
+_SEPARATOR_CELL = re.compile(r"\s*:?-{3,}:?\s*")
+
+
+@dataclass(frozen=True)
+class TableRow:
+    """One `| a | b | c |` line, kept as its `str.split("|")` parts."""
+
+    line_no: int
+    start: int
+    parts: Tuple[str, ...]
+
+    @property
+    def end(self) -> int:
+        return self.start + sum(map(len, self.parts)) + len(self.parts) - 1
+
+    @cached_property
+    def cells(self) -> Tuple[str, ...]:
+        """Stripped cells between the outer pipes, as `line.split("|")[1:-1]`."""
+        return tuple(part.strip() for part in self.parts[1:-1])
+
+    @cached_property
+    def pipes(self) -> Tuple[int, ...]:
+        """Character offsets of the row's pipes."""
+        offsets: List[int] = []
+        position = self.start - 1
+        for part in self.parts[:-1]:
+            position += len(part) + 1
+            offsets.append(position)
+        return tuple(offsets)
+
+    @property
+    def code(self) -> str:
+        """First cell upper-cased, the line code on the K-1 face table."""
+        return self.cells[0].upper() if self.cells else ""
+
+    def cell_span(self, column: int) -> Tuple[int, int]:
+        """Character offsets of a cell's raw text (between its pipes)."""
+        return self.pipes[column] + 1, self.pipes[column + 1]
+
+
+@dataclass(frozen=True)
+class MarkdownTable:
+    """A run of consecutive table lines.
+
+    `header_rows` holds the header and `|---|` separator lines when the table
+    has a header; `rows` holds the body.
+    """
+
+    header_rows: Tuple[TableRow, ...]
+    rows: Tuple[TableRow, ...]
+    page: Optional[int]
+
+    @property
+    def header(self) -> Optional[Tuple[str, ...]]:
+        return self.header_rows[0].cells if self.header_rows else None
+
+    @property
+    def first_line(self) -> int:
+        return (self.header_rows or self.rows)[0].line_no
+
+    @property
+    def last_line(self) -> int:
+        return (self.rows or self.header_rows)[-1].line_no
+
+    @cached_property
+    def numeric_columns(self) -> Tuple[int, ...]:
+        """Columns where at least half of the non-empty body cells are numbers."""
+        return _numeric_columns(self.rows)
+
+    def column(self, key: Union[int, str]) -> List[str]:
+        """Cells of one column, by position or (case-insensitive) header name."""
+        if isinstance(key, str):
+            if self.header is None:
+                raise KeyError(f"Table has no header to look up column '{key}'")
+            names = [name.lower() for name in self.header]
+            if key.lower() not in names:
+                raise KeyError(f"Column '{key}' not found in {self.header}")
+            key = names.index(key.lower())
+        return [row.cells[key] if key < len(row.cells) else "" for row in self.rows]
+
+
+def _is_numeric(cell: str) -> bool:
+    return bool(NUMERIC_TOKEN_PATTERN.fullmatch(cell.rstrip(".")))
+
+
+def _numeric_columns(rows: Sequence[TableRow]) -> Tuple[int, ...]:
+    width = max((len(row.cells) for row in rows), default=0)
+    columns = []
+    for column in range(width):
+        filled = [
+            row.cells[column]
+            for row in rows
+            if column < len(row.cells) and row.cells[column]
+        ]
+        if filled and 2 * sum(map(_is_numeric, filled)) >= len(filled):
+            columns.append(column)
+    return tuple(columns)
+
+
+def _build_table(rows: List[TableRow], page: Optional[int]) -> MarkdownTable:
+    if len(rows) >= 2 and len(rows[1].parts) > 2 and all(
+        _SEPARATOR_CELL.fullmatch(part) for part in rows[1].parts[1:-1]
+    ):
+        return MarkdownTable(header_rows=tuple(rows[:2]), rows=tuple(rows[2:]), page=page)
+    return MarkdownTable(header_rows=(), rows=tuple(rows), page=page)
+
+
+def iter_tables(lines: Iterable[Tuple[int, str]]) -> Iterator[MarkdownTable]:
+    """Yield each table from `(offset, line)` pairs once the line after it is read."""
+    page: Optional[int] = None
+    pending: List[TableRow] = []
+    for line_no, (start, line) in enumerate(lines):
+        if "|" in line and line.lstrip().startswith("|"):
+            pending.append(TableRow(line_no, start, tuple(line.split("|"))))
+            continue
+        if pending:
+            yield _build_table(pending, page)
+            pending = []
+        if "{" in line:
+            marker = PAGE_MARKER.match(line.strip())
+            if marker:
+                page = int(marker.group(1))
+    if pending:
+        yield _build_table(pending, page)
+
+
+class TableIndex:
+    """Every table in a document with row lookups by line, code and label."""
+
+    def __init__(self, lines: Iterable[Tuple[int, str]]):
+        self.tables: Tuple[MarkdownTable, ...] = tuple(iter_tables(lines))
+        # Every table line, header and separator lines included.
+        self.lines: Dict[int, TableRow] = {}
+        self._tables_by_line: Dict[int, MarkdownTable] = {}
+        for table in self.tables:
+            for row in table.header_rows + table.rows:
+                self.lines[row.line_no] = row
+                self._tables_by_line[row.line_no] = table
+
+    @cached_property
+    def _rows_by_code(self) -> Dict[str, List[TableRow]]:
+        return _group_by_code(self.rows())
+
+    @cached_property
+    def _lines_by_code(self) -> Dict[str, List[TableRow]]:
+        return _group_by_code(self.rows(include_headers=True))
+
+    def rows(self, *, include_headers: bool = False) -> Iterator[TableRow]:
+        """Body rows of every table, in document order.
+
+        With `include_headers`, header lines are included too: Datalab often
+        renders the first row of a K-1 face table as the table's header.
+        """
+        for table in self.tables:
+            if include_headers:
+                yield from table.header_rows
+            yield from table.rows
+
+    def table_at(self, line_no: int) -> Optional[MarkdownTable]:
+        return self._tables_by_line.get(line_no)
+
+    def by_code(self, code: str, *, include_headers: bool = False) -> Tuple[TableRow, ...]:
+        """All rows whose first cell is `code`, in document order."""
+        by_code = self._lines_by_code if include_headers else self._rows_by_code
+        return tuple(by_code.get(code.upper(), ()))
+
+    def by_label(self, label: str, *, include_headers: bool = False) -> Iterator[TableRow]:
+        """Rows with a cell containing `label` (case-insensitive)."""
+        needle = label.lower()
+        for row in self.rows(include_headers=include_headers):
+            if any(needle in cell.lower() for cell in row.cells):
+                yield row
+
+
+def _group_by_code(rows: Iterable[TableRow]) -> Dict[str, List[TableRow]]:
+    by_code: Dict[str, List[TableRow]] = {}
+    for row in rows:
+        by_code.setdefault(row.code, []).append(row)
+    return by_code
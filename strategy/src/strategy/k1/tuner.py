@@ -0,0 +1,515 @@
+"""Pick the best named strategy per field by sweeping an evaluation dataset.
+
+Every candidate strategy registered in `FIELD_STRATEGIES` is run for every
+field against every document. Each document is parsed and indexed once and
+all of its candidates share that state. The best candidate per field is the
+one with the highest accuracy against the ground truth, with the lowest mean
+latency breaking ties. The result is written to `regex_field_config.yaml`.
+
+Each (document, field, strategy) output is stored in SQLite, keyed by a
+hash of the document text and a fingerprint of the strategy code. Repeated
+sweeps only run candidates whose document or code changed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from ..pool import WorkerPool, get_cpu_pool
+from .anchors import AnchorPrefilter
+
+CandidateKey = Tuple[str, str]
+# (field, strategy, value, elapsed seconds, outcome)
+CandidateOutput = Tuple[str, str, str, float, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tuning_outputs (
+    document TEXT NOT NULL,
+    field TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    value TEXT NOT NULL,
+    elapsed REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    PRIMARY KEY (document, field, strategy, fingerprint)
+)
+"""
+_BUSY_TIMEOUT_SECONDS = 10.0
+# The default strategy keeps its place unless an equally accurate candidate is
+# faster by more than this, so timing noise does not churn the config.
+LATENCY_TOLERANCE_SECONDS = 1e-3
+
+
+@dataclass(frozen=True)
+class TuningSample:
+    """One evaluation document with its expected field values."""
+
+    name: str
+    text: str
+    expected: Mapping[str, str]
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CandidateScore:
+    """How one strategy did for one field across the dataset."""
+
+    strategy: str
+    matched: int
+    total: int
+    mean_seconds: float
+
+    @property
+    def accuracy(self) -> float:
+        return self.matched / self.total if self.total else 0.0
+
+
+@dataclass
+class FieldTuning:
+    """Ranked candidates for a field; `scores[0]` is the winner."""
+
+    field: str
+    default: str
+    scores: List[CandidateScore] = field(default_factory=list)
+
+    @property
+    def best(self) -> str:
+        return self.scores[0].strategy if self.scores else self.default
+
+
+@dataclass
+class TuningReport:
+    """Outcome of a sweep, including how much work the cache saved."""
+
+    fields: Dict[str, FieldTuning]
+    documents: int
+    evaluated: int
+    cached: int
+    elapsed: float
+
+    def strategy_config(self) -> Dict[str, str]:
+        """Config entries for fields whose best strategy is not the default."""
+        return {
+            name: tuning.best
+            for name, tuning in sorted(self.fields.items())
+            if tuning.best != tuning.default
+        }
+
+    def summary(self) -> str:
+        changed = len(self.strategy_config())
+        return (
+            f"Tuned {len(self.fields)} fields over {self.documents} documents "
+            f"({self.evaluated} candidate runs, {self.cached} cached) in "
+            f"{self.elapsed:.2f}s; {changed} fields use a non-default strategy"
+        )
+
+
+class TuningOutputStore:
+    """SQLite cache of candidate outputs per document and strategy fingerprint.
+
+    Like the brute-force pattern store, a connection is opened per operation
+    and storage errors degrade to cache misses.
+    """
+
+    def __init__(self, path: Path, fingerprint: str):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT_SECONDS)
+        with self._lock:
+            if not self._ready:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(_SCHEMA)
+                connection.commit()
+                self._ready = True
+        return connection
+
+    def get_document(self, digest: str) -> Dict[CandidateKey, Tuple[str, float, str]]:
+        if not self.path.exists():
+            return {}
+        try:
+            connection = self._connect()
+            try:
+                rows = connection.execute(
+                    "SELECT field, strategy, value, elapsed, outcome FROM tuning_outputs"
+                    " WHERE document = ? AND fingerprint = ?",
+                    (digest, self.fingerprint),
+                ).fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return {}
+        return {(row[0], row[1]): (row[2], row[3], row[4]) for row in rows}
+
+    def put_document(self, digest: str, outputs: Sequence[CandidateOutput]) -> None:
+        rows = [
+            (digest, field_name, strategy, self.fingerprint, value, elapsed, outcome)
+            for field_name, strategy, value, elapsed, outcome in outputs
+        ]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO tuning_outputs"
+                        " (document, field, strategy, fingerprint, value, elapsed, outcome)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+            finally:
+                connection.close()
+        except (OSError, sqlite3.Error):
+            return
+
+    def prune(self) -> int:
+        """Delete outputs produced by other strategy code; return how many."""
+        if not self.path.exists():
+            return 0
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    cursor = connection.execute(
+                        "DELETE FROM tuning_outputs WHERE fingerprint != ?",
+                        (self.fingerprint,),
+                    )
+                return cursor.rowcount
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return 0
+
+
+@lru_cache(maxsize=1)
+def strategy_fingerprint() -> str:
+    """Hash of the code that defines and runs strategies: every module in `strategy.k1`."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_tuning_store(path: Optional[Path] = None) -> TuningOutputStore:
+    from .regex_extractor import DATA_DIR
+
+    return TuningOutputStore(
+        path or DATA_DIR / "regex_tuning_cache.sqlite3", strategy_fingerprint()
+    )
+
+
+def comparable_value(value: object) -> str:
+    """Normalize a value the way the evaluation harness compares fields."""
+    if value is None:
+        return ""
+    text = str(value).strip()
+    if not text:
+        return ""
+    text = text.replace(",", "").replace("$", "").replace("%", "").strip()
+    if text.startswith("(") and text.endswith(")"):
+        inner = text[1:-1].strip()
+        text = f"-{inner}" if inner else ""
+    try:
+        return str(int(text))
+    except ValueError:
+        return text
+
+
+def load_tuning_samples(
+    markdown_dir: Path, csv_path: Optional[Path] = None
+) -> List[TuningSample]:
+    """Pair each ground-truth column (e.g. `doc_1.pdf`) with `<stem>.md`.
+
+    Columns without parsed markdown are skipped.
+    """
+    from .regex_extractor import DEFAULT_EVAL_CSV
+
+    with (csv_path or DEFAULT_EVAL_CSV).open(newline="", encoding="utf-8-sig") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        rows = [row for row in reader if row and row[0].strip()]
+    samples: List[TuningSample] = []
+    for column, doc_name in enumerate(header[1:], start=1):
+        doc_name = doc_name.strip()
+        markdown_path = Path(markdown_dir) / f"{Path(doc_name).stem}.md"
+        if not doc_name or not markdown_path.exists():
+            continue
+        expected = {
+            row[0].strip(): (row[column].strip() if column < len(row) else "")
+            for row in rows
+        }
+        samples.append(
+            TuningSample(
+                name=doc_name,
+                text=markdown_path.read_text(encoding="utf-8"),
+                expected=expected,
+            )
+        )
+    return samples
+
+
+def _candidates(
+    fields: Optional[Iterable[str]], include_brute_force: bool
+) -> Dict[str, List[str]]:
+    from .regex_extractor import FIELD_STRATEGIES
+
+    names = list(fields) if fields is not None else list(FIELD_STRATEGIES)
+    unknown = [name for name in names if name not in FIELD_STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unknown tuning fields: {', '.join(unknown)}")
+    candidates: Dict[str, List[str]] = {}
+    for field_name in names:
+        strategies = [
+            name
+            for name in FIELD_STRATEGIES[field_name]
+            if include_brute_force or name != "brute_force"
+        ]
+        if strategies:
+            candidates[field_name] = strategies
+    return candidates
+
+
+def _evaluate_document(
+    text: str, candidates: Sequence[CandidateKey]
+) -> List[CandidateOutput]:
+    # Runs in the worker: one extractor (and so one index and main-table
+    # parse) is shared by every candidate for this document.
+    from .regex_extractor import (
+        DOC1_FIELD_TEMPLATE,
+        FIELD_STRATEGIES,
+        FieldPlan,
+        get_extraction_engine,
+    )
+
+    plans = [
+        FieldPlan.for_strategy(field_name, strategy, FIELD_STRATEGIES[field_name][strategy])
+        for field_name, strategy in candidates
+    ]
+    engine = get_extraction_engine()
+    extractor = engine.document(text, field_defaults=DOC1_FIELD_TEMPLATE)
+    present = AnchorPrefilter(anchor for plan in plans for anchor in plan.anchors).scan(text)
+    outputs: List[CandidateOutput] = []
+    for plan in plans:
+        value, run = engine.run_plan(plan, extractor, present)
+        outputs.append((plan.field_name, plan.strategy_name, value, run.elapsed, run.outcome))
+    return outputs
+
+
+def _iter_outputs(
+    pending_work: Iterable[Tuple[TuningSample, List[CandidateKey]]],
+    workers: Optional[int],
+) -> Iterator[Tuple[TuningSample, List[CandidateOutput]]]:
+    if workers == 1:
+        for sample, missing in pending_work:
+            yield sample, _evaluate_document(sample.text, missing)
+        return
+
+    work = iter(pending_work)
+    pool = get_cpu_pool() if workers is None else WorkerPool(workers)
+    with nullcontext(pool) if workers is None else pool:
+        in_flight: Dict[Future, TuningSample] = {}
+        queue = deque(islice(work, pool.max_workers * 2))
+        while queue or in_flight:
+            while queue:
+                sample, missing = queue.popleft()
+                in_flight[pool.submit(_evaluate_document, sample.text, missing)] = sample
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            queue.extend(islice(work, len(done)))
+            for future in done:
+                yield in_flight.pop(future), future.result()
+
+
+def tune_field_strategies(
+    samples: Sequence[TuningSample],
+    *,
+    fields: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    store: Optional[TuningOutputStore] = None,
+    include_brute_force: bool = False,
+) -> TuningReport:
+    """Score every candidate strategy per field and rank them.
+
+    Documents run in parallel on the shared CPU pool by default; `workers=N`
+    uses a dedicated pool and `workers=1` runs inline. Brute force is slow
+    and never a default, so it is only considered when asked for.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    started = time.perf_counter()
+    store = store or get_tuning_store()
+    candidates = _candidates(fields, include_brute_force)
+    keys = [(field_name, strategy) for field_name, names in candidates.items() for strategy in names]
+
+    outputs: Dict[str, Dict[CandidateKey, Tuple[str, float, str]]] = {}
+    work: List[Tuple[TuningSample, List[CandidateKey]]] = []
+    cached = 0
+    for sample in samples:
+        known = store.get_document(sample.digest)
+        missing = [key for key in keys if key not in known]
+        cached += len(keys) - len(missing)
+        outputs[sample.name] = known
+        if missing:
+            work.append((sample, missing))
+
+    evaluated = 0
+    for sample, results in _iter_outputs(work, workers):
+        store.put_document(sample.digest, results)
+        evaluated += len(results)
+        for field_name, strategy, value, elapsed, outcome in results:
+            outputs[sample.name][(field_name, strategy)] = (value, elapsed, outcome)
+
+    tunings: Dict[str, FieldTuning] = {}
+    for field_name, names in candidates.items():
+        # The engine's unconfigured choice: the first non-brute-force strategy.
+        default = next((name for name in names if name != "brute_force"), names[0])
+        scores = []
+        for strategy in names:
+            matched = total = 0
+            seconds = 0.0
+            for sample in samples:
+                value, elapsed, _outcome = outputs[sample.name][(field_name, strategy)]
+                total += 1
+                seconds += elapsed
+                matched += comparable_value(value) == comparable_value(
+                    sample.expected.get(field_name, "")
+                )
+            scores.append(
+                CandidateScore(
+                    strategy=strategy,
+                    matched=matched,
+                    total=total,
+                    mean_seconds=seconds / total if total else 0.0,
+                )
+            )
+        order = {name: position for position, name in enumerate(names)}
+        scores.sort(key=lambda score: (-score.accuracy, score.mean_seconds, order[score.strategy]))
+        default_score = next(score for score in scores if score.strategy == default)
+        if (
+            default_score.accuracy == scores[0].accuracy
+            and default_score.mean_seconds - scores[0].mean_seconds <= LATENCY_TOLERANCE_SECONDS
+        ):
+            scores.remove(default_score)
+            scores.insert(0, default_score)
+        tunings[field_name] = FieldTuning(field=field_name, default=default, scores=scores)
+
+    return TuningReport(
+        fields=tunings,
+        documents=len(samples),
+        evaluated=evaluated,
+        cached=cached,
+        elapsed=time.perf_counter() - started,
+    )
+
+
+def _parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Choose the best regex strategy per K-1 field over an evaluation set."
+    )
+    parser.add_argument(
+        "markdown_dir",
+        type=Path,
+        help="Directory with parsed markdown named after the ground-truth columns.",
+    )
+    parser.add_argument(
+        "--ground-truth",
+        type=Path,
+        default=None,
+        help="Ground-truth CSV (default: the bundled eval_set.csv).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Config YAML to write (default: regex_field_config.yaml).",
+    )
+    parser.add_argument(
+        "--fields",
+        default=None,
+        help="Comma-separated subset of fields to tune.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: the shared CPU pool; 1 runs inline).",
+    )
+    parser.add_argument(
+        "--include-brute-force",
+        action="store_true",
+        help="Also consider the brute-force strategy.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the chosen config instead of writing it.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    from .regex_extractor import (
+        REGEX_FIELD_CONFIG_PATH,
+        clear_extraction_engines,
+        load_field_strategy_config,
+        save_field_strategy_config,
+    )
+
+    args = _parse_args(argv)
+    samples = load_tuning_samples(args.markdown_dir, args.ground_truth)
+    if not samples:
+        print(f"No markdown found in {args.markdown_dir} for the ground-truth columns", file=sys.stderr)
+        return 1
+    fields = [name.strip() for name in args.fields.split(",")] if args.fields else None
+    store = get_tuning_store()
+    store.prune()
+    report = tune_field_strategies(
+        samples,
+        fields=fields,
+        workers=args.workers,
+        store=store,
+        include_brute_force=args.include_brute_force,
+    )
+
+    output = args.output or REGEX_FIELD_CONFIG_PATH
+    config = report.strategy_config()
+    if fields is not None:
+        # Keep the existing choices for fields that were not tuned this time.
+        merged = {
+            name: strategy
+            for name, strategy in load_field_strategy_config(path=output).items()
+            if name not in report.fields
+        }
+        config = {**merged, **config}
+    if args.dry_run:
+        for name, strategy in sorted(config.items()):
+            print(f"{name}: {strategy}")
+    else:
+        save_field_strategy_config(config, path=output)
+        clear_extraction_engines()
+    print(report.summary(), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""Registry of named strategy versions, each compiled into an engine once.
+
+A strategy version pins a field strategy config and the strategy set it
+chooses from, so several versions (e.g. `v1.0.0` and `v1.1.0`) can be served
+side by side. Versions come from `data/strategy_versions.yaml` or are
+registered in code. The manifest and each version's config file go through
+the process-wide config cache, so requests never parse YAML, yet an edited
+file is picked up on the next request: only the versions whose config
+changed get a new `RegexExtractionEngine`. Asking for an unknown version
+raises immediately.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import yaml
+
+from ..config_cache import CONFIG_CACHE
+from .regex_extractor import (
+    DATA_DIR,
+    FieldStrategy,
+    RegexExtractionEngine,
+    cached_field_strategy_config,
+)
+
+
+STRATEGY_VERSIONS_PATH = DATA_DIR / "strategy_versions.yaml"
+DEFAULT_STRATEGY_VERSION = "v1.0.0"
+
+
+class UnknownStrategyVersionError(ValueError):
+    """Raised when a strategy version is not registered."""
+
+
+@dataclass(frozen=True)
+class StrategyVersion:
+    """One servable strategy version: a field config plus its strategy set.
+
+    `field_strategies` of None means the built-in `FIELD_STRATEGIES`.
+    """
+
+    version: str
+    strategy_config: Mapping[str, str]
+    description: str = ""
+    field_strategies: Optional[Mapping[str, Mapping[str, FieldStrategy]]] = None
+    source: Optional[Path] = None
+
+
+class StrategyRegistry:
+    """Thread-safe map of version name to `StrategyVersion` and compiled engine.
+
+    The manifest is read lazily and re-checked on every lookup. Versions
+    registered in code take precedence over manifest entries with the same
+    name.
+    """
+
+    def __init__(self, manifest_path: Optional[Path] = STRATEGY_VERSIONS_PATH):
+        self.manifest_path = manifest_path
+        self._registered: Dict[str, StrategyVersion] = {}
+        self._manifest: Dict[str, StrategyVersion] = {}
+        self._manifest_raw: Optional[Tuple[Optional[str], Mapping[str, Any]]] = None
+        self._engines: Dict[str, Tuple[StrategyVersion, RegexExtractionEngine]] = {}
+        self._default: Optional[str] = None
+        self._lock = threading.RLock()
+
+    def _sync_manifest(self) -> None:
+        path = self.manifest_path
+        if path is None or not path.exists():
+            return
+        raw = CONFIG_CACHE.load(path, _parse_manifest)
+        if raw is self._manifest_raw:
+            return
+        with self._lock:
+            if raw is self._manifest_raw:
+                return
+            default, entries = raw
+            self._manifest = {
+                version: _version_from_manifest(version, body, path.parent)
+                for version, body in entries.items()
+            }
+            self._default = default
+            self._manifest_raw = raw
+
+    def _refresh(self, entry: StrategyVersion) -> StrategyVersion:
+        # Swap in the current config when the version's source file changed.
+        if entry.source is None:
+            return entry
+        config = cached_field_strategy_config(entry.source)
+        if config is entry.strategy_config:
+            return entry
+        fresh = dataclasses.replace(entry, strategy_config=config)
+        target = self._registered if entry.version in self._registered else self._manifest
+        target[entry.version] = fresh
+        return fresh
+
+    @property
+    def default_version(self) -> str:
+        self._sync_manifest()
+        return self._default or DEFAULT_STRATEGY_VERSION
+
+    def register(
+        self,
+        version: str,
+        *,
+        strategy_config: Optional[Mapping[str, str]] = None,
+        config_path: Optional[Path] = None,
+        field_strategies: Optional[Mapping[str, Mapping[str, FieldStrategy]]] = None,
+        description: str = "",
+        replace: bool = False,
+    ) -> StrategyVersion:
+        """Add a version from an inline config or a config YAML path.
+
+        A version backed by `config_path` follows edits to that file.
+        """
+        if strategy_config is not None and config_path is not None:
+            raise ValueError("Pass either strategy_config or config_path, not both.")
+        self._sync_manifest()
+        config = (
+            cached_field_strategy_config(config_path)
+            if config_path is not None
+            else MappingProxyType(dict(strategy_config or {}))
+        )
+        entry = StrategyVersion(
+            version=version,
+            strategy_config=config,
+            description=description,
+            field_strategies=field_strategies,
+            source=config_path,
+        )
+        with self._lock:
+            if not replace and (version in self._registered or version in self._manifest):
+                raise ValueError(f"Strategy version '{version}' is already registered.")
+            self._registered[version] = entry
+            self._engines.pop(version, None)
+        return entry
+
+    def _all(self) -> Dict[str, StrategyVersion]:
+        return {**self._manifest, **self._registered}
+
+    def get(self, version: str) -> StrategyVersion:
+        self._sync_manifest()
+        with self._lock:
+            versions = self._all()
+            entry = versions.get(version)
+            if entry is None:
+                available = ", ".join(sorted(versions)) or "none"
+                raise UnknownStrategyVersionError(
+                    f"Unknown strategy version '{version}'. Available: {available}"
+                )
+            return self._refresh(entry)
+
+    def engine(self, version: str) -> RegexExtractionEngine:
+        """Return the compiled engine for `version`, rebuilding it if its config changed."""
+        entry = self.get(version)
+        cached = self._engines.get(version)
+        if cached is not None and cached[0] is entry:
+            return cached[1]
+        with self._lock:
+            cached = self._engines.get(version)
+            if cached is not None and cached[0] is entry:
+                return cached[1]
+            engine = RegexExtractionEngine(
+                entry.strategy_config, field_strategies=entry.field_strategies
+            )
+            self._engines[version] = (entry, engine)
+            return engine
+
+    def versions(self) -> List[StrategyVersion]:
+        self._sync_manifest()
+        with self._lock:
+            versions = self._all()
+            return [self._refresh(versions[name]) for name in sorted(versions)]
+
+    def is_loaded(self, version: str) -> bool:
+        """Whether the version's engine has been compiled in this process."""
+        return version in self._engines
+
+    def clear(self) -> None:
+        """Drop compiled engines and rebuild manifest entries on next use.
+
+        Versions registered in code are kept.
+        """
+        with self._lock:
+            self._engines.clear()
+            self._manifest.clear()
+            self._manifest_raw = None
+            self._default = None
+
+
+def _parse_manifest(text: str) -> Tuple[Optional[str], Mapping[str, Any]]:
+    raw = yaml.safe_load(text) or {}
+    if not isinstance(raw, Mapping):
+        raise ValueError("Strategy version manifest must be a mapping.")
+    entries = raw.get("versions") or {}
+    if not isinstance(entries, Mapping):
+        raise ValueError("`versions` must be a mapping of version to options.")
+    bodies: Dict[str, Any] = {}
+    for version, body in entries.items():
+        body = body or {}
+        if not isinstance(body, Mapping):
+            raise ValueError(f"Strategy version '{version}' must be a mapping.")
+        bodies[str(version)] = body
+    default = str(raw["default"]) if raw.get("default") else None
+    return default, MappingProxyType(bodies)
+
+
+def _version_from_manifest(version: str, body: Mapping, base_dir: Path) -> StrategyVersion:
+    if "config" in body:
+        config_path = base_dir / str(body["config"])
+        config = cached_field_strategy_config(config_path)
+    else:
+        config_path = None
+        fields = body.get("fields") or {}
+        config = MappingProxyType({str(key): str(value) for key, value in fields.items()})
+    return StrategyVersion(
+        version=version,
+        strategy_config=config,
+        description=str(body.get("description") or ""),
+        source=config_path,
+    )
+
+
+STRATEGY_VERSIONS = StrategyRegistry()
+
+
+def get_strategy_engine(version: Optional[str] = None) -> RegexExtractionEngine:
+    """Return the cached engine for a strategy version (default: the manifest default)."""
+    return STRATEGY_VERSIONS.engine(version or STRATEGY_VERSIONS.default_version)
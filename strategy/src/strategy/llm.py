@@ -1,17 +1,37 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
 import os
-from typing import Any, Callable, Dict, Mapping, Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Union
 
 from strategy.k1 import DOC1_FIELD_TEMPLATE, FIELD_KEYS, load_document_values
 from strategy.models.k1.pydantic_model import map_to_generic_lines
 
 from .base import BaseStrategy, StrategyError, StrategyResult
+from .openrouter_client import (
+    AsyncOpenRouterClient,
+    OpenRouterClient,
+    get_async_openrouter_client,
+    get_openrouter_client,
+)
+
+RequestFunc = Callable[
+    [str, str, Mapping[str, Any]], Union[Mapping[str, Any], Awaitable[Mapping[str, Any]]]
+]
 
 
 class OpenRouterExtractK1(BaseStrategy[Dict[str, str]]):
-    """Extract K-1 field values using OpenRouter."""
+    """Extract K-1 field values using OpenRouter.
+
+    Requests go through the process-wide pooled clients in
+    `strategy.openrouter_client` (retries, backoff, concurrency cap) unless
+    `client`/`async_client` or a `request_func` is given. `request_func` may
+    be sync or async; `execute_async` awaits an async one on the event loop
+    and runs a sync one in a worker thread.
+    """
 
     def __init__(
         self,
@@ -20,7 +40,9 @@ class OpenRouterExtractK1(BaseStrategy[Dict[str, str]]):
         api_key: Optional[str] = None,
         base_url: str = "https://openrouter.ai/api/v1/chat/completions",
         field_defaults: Optional[Mapping[str, str]] = None,
-        request_func: Optional[Callable[[str, str, Mapping[str, Any]], Mapping[str, Any]]] = None,
+        request_func: Optional[RequestFunc] = None,
+        client: Optional[OpenRouterClient] = None,
+        async_client: Optional[AsyncOpenRouterClient] = None,
     ):
         super().__init__(name="OpenRouterExtractK1", version="v1", activity="extract_fields")
         self.model = model
@@ -28,6 +50,8 @@ class OpenRouterExtractK1(BaseStrategy[Dict[str, str]]):
         self.base_url = base_url
         self.field_defaults = field_defaults or DOC1_FIELD_TEMPLATE
         self.request_func = request_func or self._default_request
+        self.client = client
+        self.async_client = async_client
 
     def _build_messages(self, markdown: str) -> list[dict[str, str]]:
         field_list = ", ".join(FIELD_KEYS)
@@ -49,23 +73,13 @@ class OpenRouterExtractK1(BaseStrategy[Dict[str, str]]):
     def _default_request(
         self, api_key: str, base_url: str, payload: Mapping[str, Any]
     ) -> Mapping[str, Any]:
-        try:
-            import requests
-        except ImportError as exc:  # pragma: no cover - dependency guard
-            raise StrategyError("requests is required for OpenRouterExtractK1") from exc
+        return (self.client or get_openrouter_client()).post(api_key, base_url, payload)
 
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        }
-        response = requests.post(
-            base_url,
-            headers=headers,
-            json=payload,
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
+    async def _default_request_async(
+        self, api_key: str, base_url: str, payload: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        client = self.async_client or get_async_openrouter_client()
+        return await client.post(api_key, base_url, payload)
 
     def _parse_response(self, raw: Mapping[str, Any]) -> Dict[str, str]:
         choices = raw.get("choices")
@@ -86,7 +100,7 @@ class OpenRouterExtractK1(BaseStrategy[Dict[str, str]]):
             field_values.setdefault(field, default)
         return field_values
 
-    def execute(self, context):
+    def _prepare(self, context) -> tuple[str, Dict[str, Any]]:
         if not context.parsed_markdown:
             raise StrategyError("parsed_markdown is required before LLM extraction")
 
@@ -100,7 +114,11 @@ class OpenRouterExtractK1(BaseStrategy[Dict[str, str]]):
             "messages": messages,
             "response_format": {"type": "json_object"},
         }
-        raw_response = self.request_func(api_key, self.base_url, payload)
+        return api_key, payload
+
+    def _result(
+        self, context, payload: Mapping[str, Any], raw_response: Mapping[str, Any], seconds: float
+    ) -> StrategyResult[Dict[str, str]]:
         field_values = self._parse_response(raw_response)
         generic_lines = map_to_generic_lines(field_values)
 
@@ -110,6 +128,7 @@ class OpenRouterExtractK1(BaseStrategy[Dict[str, str]]):
                 "generic_lines": generic_lines.model_dump(),
                 "openrouter_payload": {k: v for k, v in payload.items() if k != "messages"},
                 "openrouter_response": raw_response,
+                "openrouter_seconds": round(seconds, 6),
             },
             context_updates={
                 "field_values": field_values,
@@ -117,6 +136,33 @@ class OpenRouterExtractK1(BaseStrategy[Dict[str, str]]):
             },
         )
 
+    def execute(self, context):
+        api_key, payload = self._prepare(context)
+        started = time.perf_counter()
+        raw_response = self.request_func(api_key, self.base_url, payload)
+        if inspect.isawaitable(raw_response):
+            raw_response = asyncio.run(_awaited(raw_response))
+        return self._result(context, payload, raw_response, time.perf_counter() - started)
+
+    async def execute_async(self, context):
+        api_key, payload = self._prepare(context)
+        started = time.perf_counter()
+        if self.request_func == self._default_request:
+            raw_response = await self._default_request_async(api_key, self.base_url, payload)
+        elif inspect.iscoroutinefunction(self.request_func):
+            raw_response = await self.request_func(api_key, self.base_url, payload)
+        else:
+            raw_response = await asyncio.to_thread(
+                self.request_func, api_key, self.base_url, payload
+            )
+            if inspect.isawaitable(raw_response):
+                raw_response = await raw_response
+        return self._result(context, payload, raw_response, time.perf_counter() - started)
+
+
+async def _awaited(awaitable: Awaitable[Mapping[str, Any]]) -> Mapping[str, Any]:
+    return await awaitable
+
 
 class MockOpenRouterExtractK1(BaseStrategy[Dict[str, str]]):
     """Mock OpenRouter extractor for tests and offline runs."""
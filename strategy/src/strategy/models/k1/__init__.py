@@ -1,15 +1,16 @@
 """K-1 specific Pydantic models."""
 
+from . import pydantic_model as _pydantic_model
 from .pydantic_model import (
-    GenericK1Lines,
     build_generic_line_model,
     create_chunked_models,
     default_line_value_resolver,
+    generic_k1_lines_model,
     generic_line_key,
+    k1_chunked_models,
     k1_cover_page,
     k1_federal_footnotes,
     map_to_generic_lines,
-    k1_pydantic_classes,
 )
 
 __all__ = [
@@ -17,9 +18,18 @@ __all__ = [
     "build_generic_line_model",
     "create_chunked_models",
     "default_line_value_resolver",
+    "generic_k1_lines_model",
     "generic_line_key",
+    "k1_chunked_models",
     "k1_cover_page",
     "k1_federal_footnotes",
     "map_to_generic_lines",
     "k1_pydantic_classes",
 ]
+
+
+def __getattr__(name: str):
+    # GenericK1Lines and k1_pydantic_classes are built lazily by pydantic_model.
+    if name in ("GenericK1Lines", "k1_pydantic_classes"):
+        return getattr(_pydantic_model, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic import BaseModel, create_model
 from typing import (
     List,
@@ -338,18 +339,34 @@ def map_to_generic_lines(
         else:
             generic_payload[generic] = resolver(generic, options)
 
-    return GenericK1Lines(**generic_payload)
+    return generic_k1_lines_model()(**generic_payload)
 
 
-GenericK1Lines = build_generic_line_model(
-    "GenericK1Lines", [k1_cover_page, k1_federal_footnotes]
-)
+# The derived models below cost tens of milliseconds of `create_model` work, so
+# they are built on first use instead of at import time.
+@lru_cache(maxsize=1)
+def generic_k1_lines_model() -> Type[BaseModel]:
+    return build_generic_line_model(
+        "GenericK1Lines", [k1_cover_page, k1_federal_footnotes]
+    )
 
 
-k1_pydantic_classes = create_chunked_models(
-    models=[
-        k1_cover_page, 
-        k1_federal_footnotes
-    ],
-    chunk_size=PYDANTIC_CHUNK_SIZE
-)
+@lru_cache(maxsize=1)
+def k1_chunked_models() -> Tuple[Type[BaseModel], ...]:
+    return tuple(
+        create_chunked_models(
+            models=[
+                k1_cover_page,
+                k1_federal_footnotes
+            ],
+            chunk_size=PYDANTIC_CHUNK_SIZE
+        )
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name == "GenericK1Lines":
+        return generic_k1_lines_model()
+    if name == "k1_pydantic_classes":
+        return list(k1_chunked_models())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
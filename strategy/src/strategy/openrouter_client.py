@@ -0,0 +1,353 @@
+"""Pooled HTTP clients for OpenRouter chat completions.
+
+`OpenRouterExtractK1` used to open a new connection for every request and
+gave up on the first 429 or 5xx. `OpenRouterClient` keeps one `requests`
+session, and `AsyncOpenRouterClient` keeps one `aiohttp` session per event
+loop, so connections are reused across documents. Both cap the requests
+in flight with a semaphore shared by every caller; a call waiting to retry
+gives its slot back. A call that fails with a
+retryable status (408, 409, 425, 429 or 5xx) or a connection error is
+retried. The wait honours `Retry-After` when the server sends it and is
+otherwise a full-jitter exponential backoff. `stats()` reports calls,
+attempts, retries, failures, latency and responses by status.
+
+Sizing comes from the environment unless passed explicitly:
+
+- `TAXMAN_OPENROUTER_MAX_IN_FLIGHT`: concurrent calls per client (default: 8)
+- `TAXMAN_OPENROUTER_MAX_ATTEMPTS`: attempts per call, first one included (default: 4)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+import weakref
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
+
+from .base import StrategyError
+from .pool import env_int
+
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_TIMEOUT_SECONDS = 30.0
+RETRY_STATUSES = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+# Status label for attempts that never got a response.
+CONNECTION_ERROR = "error"
+
+
+class OpenRouterHTTPError(StrategyError):
+    """An OpenRouter call that ended with an error response or no response."""
+
+    def __init__(self, status: str, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a `Retry-After` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How many times to try a call and how long to wait in between."""
+
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+
+    def retryable(self, status: str) -> bool:
+        return status == CONNECTION_ERROR or int(status) in RETRY_STATUSES
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Wait before retry `attempt` (zero-based): `Retry-After`, else full jitter."""
+        requested = parse_retry_after(retry_after)
+        if requested is not None:
+            return min(requested, self.max_delay)
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+@dataclass
+class OpenRouterStats:
+    """Counters for one client since it was created."""
+
+    max_in_flight: int
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    in_flight: int = 0
+    latency_seconds: float = 0.0
+    responses: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def mean_latency_seconds(self) -> float:
+        return self.latency_seconds / self.calls if self.calls else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["mean_latency_seconds"] = round(self.mean_latency_seconds, 6)
+        return data
+
+
+class _OpenRouterClientBase:
+    def __init__(
+        self,
+        *,
+        max_in_flight: Optional[int] = None,
+        retry: Optional[RetryPolicy] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ):
+        self.max_in_flight = (
+            max_in_flight or env_int("TAXMAN_OPENROUTER_MAX_IN_FLIGHT") or DEFAULT_MAX_IN_FLIGHT
+        )
+        self.retry = retry or RetryPolicy(
+            max_attempts=env_int("TAXMAN_OPENROUTER_MAX_ATTEMPTS") or DEFAULT_MAX_ATTEMPTS
+        )
+        self.timeout = timeout
+        self._stats = OpenRouterStats(max_in_flight=self.max_in_flight)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _headers(api_key: str) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+
+    def _update(self, **changes: float) -> None:
+        with self._lock:
+            for name, amount in changes.items():
+                setattr(self._stats, name, getattr(self._stats, name) + amount)
+
+    def _attempted(self, status: str) -> None:
+        with self._lock:
+            self._stats.attempts += 1
+            self._stats.responses[status] = self._stats.responses.get(status, 0) + 1
+
+    def _next_wait(self, attempt: int, error: OpenRouterHTTPError, retry_after: Optional[str]) -> float:
+        """Seconds to wait before retrying, or raise `error` when the call is done."""
+        self._attempted(error.status)
+        if attempt + 1 >= self.retry.max_attempts or not self.retry.retryable(error.status):
+            self._update(failures=1)
+            raise error
+        self._update(retries=1)
+        return self.retry.backoff(attempt, retry_after)
+
+    def stats(self) -> OpenRouterStats:
+        with self._lock:
+            return OpenRouterStats(
+                **{**asdict(self._stats), "responses": dict(self._stats.responses)}
+            )
+
+    def _render_prometheus(self, prefix: str) -> str:
+        stats = self.stats()
+        series = (
+            ("calls_total", "counter", "Calls made.", stats.calls),
+            ("attempts_total", "counter", "HTTP requests sent, retries included.", stats.attempts),
+            ("retries_total", "counter", "Requests retried after a retryable failure.", stats.retries),
+            ("failures_total", "counter", "Calls that failed after their last attempt.", stats.failures),
+            ("in_flight", "gauge", "Calls currently running.", stats.in_flight),
+            ("max_in_flight", "gauge", "Concurrency cap.", stats.max_in_flight),
+            ("latency_seconds_total", "counter", "Time spent in calls, retries included.", f"{stats.latency_seconds:.6f}"),
+        )
+        lines = []
+        for name, kind, description, value in series:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.append(f"{prefix}_{name} {value}")
+        lines.append(f"# HELP {prefix}_responses_total Responses by HTTP status.")
+        lines.append(f"# TYPE {prefix}_responses_total counter")
+        for status, count in sorted(stats.responses.items()):
+            lines.append(f'{prefix}_responses_total{{status="{status}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+class OpenRouterClient(_OpenRouterClientBase):
+    """Thread-safe OpenRouter client over one pooled `requests.Session`."""
+
+    def __init__(self, **options: Any):
+        super().__init__(**options)
+        self._session: Any = None
+        self._semaphore = threading.BoundedSemaphore(self.max_in_flight)
+
+    def _get_session(self) -> Any:
+        with self._lock:
+            if self._session is None:
+                try:
+                    import requests
+                except ImportError as exc:  # pragma: no cover - dependency guard
+                    raise StrategyError("requests is required for OpenRouterExtractK1") from exc
+                self._session = requests.Session()
+            return self._session
+
+    def post(self, api_key: str, url: str, payload: Mapping[str, Any]) -> Mapping[str, Any]:
+        """POST `payload` as JSON and return the decoded response, retrying as configured.
+
+        Each attempt holds a concurrency slot; backoff waits do not.
+        """
+        session = self._get_session()
+        self._update(calls=1, in_flight=1)
+        started = time.perf_counter()
+        try:
+            for attempt in range(self.retry.max_attempts):
+                retry_after = None
+                with self._semaphore:
+                    try:
+                        response = session.post(
+                            url, headers=self._headers(api_key), json=payload, timeout=self.timeout
+                        )
+                    except OSError as exc:  # requests' exceptions are IOErrors
+                        error = OpenRouterHTTPError(CONNECTION_ERROR, f"OpenRouter request failed: {exc}")
+                    else:
+                        status = str(response.status_code)
+                        if response.status_code < 400:
+                            self._attempted(status)
+                            return response.json()
+                        retry_after = response.headers.get("Retry-After")
+                        error = OpenRouterHTTPError(
+                            status, f"OpenRouter returned HTTP {status}: {response.text[:200]}"
+                        )
+                time.sleep(self._next_wait(attempt, error, retry_after))
+            raise AssertionError("unreachable")  # pragma: no cover
+        finally:
+            self._update(in_flight=-1, latency_seconds=time.perf_counter() - started)
+
+    def render_prometheus(self) -> str:
+        """Render call, retry and latency counters in the Prometheus text format."""
+        return self._render_prometheus("taxman_openrouter")
+
+    def close(self) -> None:
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+async def _close_on_loop_shutdown(session: Any) -> AsyncIterator[None]:
+    """Async generator whose cleanup closes `session`.
+
+    The event loop tracks started async generators, and `asyncio.run` (like
+    any runner calling `loop.shutdown_asyncgens()`) finalizes them before
+    closing, so sessions on short-lived loops are not left unclosed.
+    """
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+@dataclass
+class _AsyncLoopSlot:
+    session: Any
+    semaphore: asyncio.Semaphore
+    closer: AsyncIterator[None]
+
+
+class AsyncOpenRouterClient(_OpenRouterClientBase):
+    """OpenRouter client for the event loop over a pooled `aiohttp` session.
+
+    Sessions and semaphores belong to an event loop, so each loop that uses
+    the client gets its own; stats are shared. A loop's session is closed by
+    `aclose()` or, failing that, when the loop shuts down its async generators.
+    """
+
+    def __init__(self, **options: Any):
+        super().__init__(**options)
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncLoopSlot]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def _slot(self) -> _AsyncLoopSlot:
+        loop = asyncio.get_running_loop()
+        slot = self._loops.get(loop)
+        if slot is None:
+            try:
+                import aiohttp
+            except ImportError as exc:  # pragma: no cover - dependency guard
+                raise StrategyError("aiohttp is required for async OpenRouter calls") from exc
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_in_flight),
+            )
+            closer = _close_on_loop_shutdown(session)
+            # Starting the generator registers it with the loop; the slot keeps it alive.
+            await closer.__anext__()
+            slot = _AsyncLoopSlot(session, asyncio.Semaphore(self.max_in_flight), closer)
+            self._loops[loop] = slot
+        return slot
+
+    async def post(self, api_key: str, url: str, payload: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Awaitable `OpenRouterClient.post`."""
+        import aiohttp
+
+        slot = await self._slot()
+        self._update(calls=1, in_flight=1)
+        started = time.perf_counter()
+        try:
+            for attempt in range(self.retry.max_attempts):
+                retry_after = None
+                async with slot.semaphore:
+                    try:
+                        async with slot.session.post(
+                            url, headers=self._headers(api_key), json=payload
+                        ) as response:
+                            status = str(response.status)
+                            if response.status < 400:
+                                self._attempted(status)
+                                return await response.json(content_type=None)
+                            retry_after = response.headers.get("Retry-After")
+                            body = await response.text()
+                        error = OpenRouterHTTPError(
+                            status, f"OpenRouter returned HTTP {status}: {body[:200]}"
+                        )
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                        error = OpenRouterHTTPError(CONNECTION_ERROR, f"OpenRouter request failed: {exc}")
+                await asyncio.sleep(self._next_wait(attempt, error, retry_after))
+            raise AssertionError("unreachable")  # pragma: no cover
+        finally:
+            self._update(in_flight=-1, latency_seconds=time.perf_counter() - started)
+
+    def render_prometheus(self) -> str:
+        """Render call, retry and latency counters in the Prometheus text format."""
+        return self._render_prometheus("taxman_openrouter_async")
+
+    async def aclose(self) -> None:
+        """Close the session opened on the running event loop."""
+        slot = self._loops.pop(asyncio.get_running_loop(), None)
+        if slot is not None:
+            await slot.closer.aclose()
+
+
+_OPENROUTER_CLIENT: Optional[OpenRouterClient] = None
+_ASYNC_OPENROUTER_CLIENT: Optional[AsyncOpenRouterClient] = None
+_OPENROUTER_CLIENT_LOCK = threading.Lock()
+
+
+def get_openrouter_client() -> OpenRouterClient:
+    """Return the process-wide OpenRouter client, creating it on first use."""
+    global _OPENROUTER_CLIENT
+    with _OPENROUTER_CLIENT_LOCK:
+        if _OPENROUTER_CLIENT is None:
+            _OPENROUTER_CLIENT = OpenRouterClient()
+        return _OPENROUTER_CLIENT
+
+
+def get_async_openrouter_client() -> AsyncOpenRouterClient:
+    """Return the process-wide async OpenRouter client, creating it on first use."""
+    global _ASYNC_OPENROUTER_CLIENT
+    with _OPENROUTER_CLIENT_LOCK:
+        if _ASYNC_OPENROUTER_CLIENT is None:
+            _ASYNC_OPENROUTER_CLIENT = AsyncOpenRouterClient()
+        return _ASYNC_OPENROUTER_CLIENT
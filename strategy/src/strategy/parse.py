@@ -1,72 +1,290 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from pathlib import Path
-from typing import Callable, Optional
-
-from datalab_sdk import DatalabClient
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .base import BaseStrategy, StrategyError, StrategyResult
+from .datalab_pool import (
+    AsyncDatalabClientPool,
+    DatalabClientPool,
+    datalab_client,
+    get_async_datalab_pool,
+    get_datalab_pool,
+)
+from .parse_cache import ParseCache, get_parse_cache, parse_cache_key
+from .pdf_pages import page_ranges, pdf_page_count, stitch_page
+from .pool import env_int
+
+if TYPE_CHECKING:  # the SDK is only imported when a real parse runs
+    from datalab_sdk import AsyncDatalabClient, DatalabClient
+
+DEFAULT_PAGES_PER_CHUNK = 20
 
 
 class ParsePdfToDatalabMarkdown(BaseStrategy[str]):
-    """Call the Datalab API to convert a PDF to markdown."""
+    """Call the Datalab API to convert a PDF to markdown.
+
+    Results are cached by PDF content and convert options (see
+    `strategy.parse_cache`); a cache hit skips the remote call. Pass
+    `use_cache=False` to always call Datalab.
+
+    Clients are borrowed from a `DatalabClientPool`: the process-wide one by
+    default, or a pool of this strategy's own when `client_factory` is given.
+    `execute_async` does the same with `AsyncDatalabClient`s, submitting the
+    convert and awaiting its polling without holding a thread.
+
+    Every convert is paginated, so the markdown always carries `{n}------`
+    page separators. PDFs longer than `pages_per_chunk` pages
+    (`TAXMAN_DATALAB_PAGES_PER_CHUNK`, default 20) are converted as concurrent
+    page ranges and stitched back with absolute separators (see
+    `strategy.pdf_pages`), giving the same markdown as a whole-PDF convert.
+    `pages_per_chunk=0` always sends the whole PDF.
+    """
 
     def __init__(
         self,
         *,
         api_key: Optional[str] = None,
         client_factory: Optional[Callable[[str], object]] = None,
+        client_pool: Optional[DatalabClientPool] = None,
+        async_client_factory: Optional[Callable[[str], object]] = None,
+        async_client_pool: Optional[AsyncDatalabClientPool] = None,
+        cache: Optional[ParseCache] = None,
+        use_cache: bool = True,
+        poll_interval: float = 1.0,
+        pages_per_chunk: Optional[int] = None,
     ):
         super().__init__(name="ParsePdfToDatalabMarkdown", version="v1", activity="parse")
         self.api_key = api_key
-        self._client_factory = client_factory or self._default_client_factory
+        if client_pool is None and client_factory is not None:
+            client_pool = DatalabClientPool(client_factory)
+        self._client_pool = client_pool
+        if async_client_pool is None and async_client_factory is not None:
+            async_client_pool = AsyncDatalabClientPool(async_client_factory)
+        self._async_client_pool = async_client_pool
+        self.convert_options: Dict[str, Any] = {"output_format": "markdown", "paginate": True}
+        self._cache = cache
+        self.use_cache = use_cache
+        self.poll_interval = poll_interval
+        self.pages_per_chunk = (
+            pages_per_chunk
+            if pages_per_chunk is not None
+            else env_int("TAXMAN_DATALAB_PAGES_PER_CHUNK") or DEFAULT_PAGES_PER_CHUNK
+        )
+
+    @property
+    def cache(self) -> Optional[ParseCache]:
+        if not self.use_cache:
+            return None
+        return self._cache or get_parse_cache()
+
+    @property
+    def client_pool(self) -> DatalabClientPool:
+        return self._client_pool or get_datalab_pool()
+
+    @property
+    def async_client_pool(self) -> AsyncDatalabClientPool:
+        return self._async_client_pool or get_async_datalab_pool()
 
     def _default_client_factory(self, api_key: str):
-        try:
-            from datalab_sdk import DatalabClient  # type: ignore
-        except ImportError as exc:  # pragma: no cover - dependency guard
-            raise StrategyError(
-                "datalab-python-sdk is required for ParsePdfToDatalabMarkdown"
-            ) from exc
-        return DatalabClient(api_key=api_key)
+        return datalab_client(api_key)
 
-    def _convert(self, client: DatalabClient, pdf_path: Path) -> str:
+    def _options(self, **overrides: Any):
         try:
             from datalab_sdk.models import ConvertOptions  # type: ignore
         except ImportError as exc:  # pragma: no cover - dependency guard
             raise StrategyError(
                 "datalab-python-sdk is required for ParsePdfToDatalabMarkdown"
             ) from exc
+        return ConvertOptions(**self.convert_options, **overrides)
 
+    def _convert(self, client: DatalabClient, pdf_path: Path, **overrides: Any) -> str:
+        options = self._options(**overrides)
         try:
-            options = ConvertOptions(output_format="markdown")
             result = client.convert(str(pdf_path), options=options)
         except Exception as exc:
             raise StrategyError(f"Datalab convert failed: {exc}") from exc
+        return _markdown_from(result)
 
-        markdown = getattr(result, "markdown", None)
-        if not markdown:
-            raise StrategyError("Datalab API response did not include markdown")
-        return str(markdown)
+    async def _convert_async(
+        self, client: AsyncDatalabClient, pdf_path: Path, **overrides: Any
+    ) -> str:
+        options = self._options(**overrides)
+        try:
+            result = await client.convert(
+                str(pdf_path), options=options, poll_interval=self.poll_interval
+            )
+        except Exception as exc:
+            raise StrategyError(f"Datalab convert failed: {exc}") from exc
+        return _markdown_from(result)
 
-    def execute(self, context):
-        pdf_path = context.pdf_path
-        if not pdf_path.exists():
-            raise StrategyError(f"PDF not found: {pdf_path}")
+    def _iter_pages(
+        self, api_key: str, pdf_path: Path, ranges: List[Tuple[int, int]]
+    ) -> Iterator[str]:
+        def convert(page_range: Tuple[int, int]) -> str:
+            with self.client_pool.lease(api_key) as client:
+                return self._convert(client, pdf_path, **_range_options(page_range))
+
+        workers = min(len(ranges), self.client_pool.max_in_flight)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="datalab-pages") as executor:
+            # `map` hands results back in page order as soon as each is ready.
+            for (first, _), markdown in zip(ranges, executor.map(convert, ranges)):
+                yield stitch_page(first, markdown)
 
+    async def _aiter_pages(
+        self, api_key: str, pdf_path: Path, ranges: List[Tuple[int, int]]
+    ) -> AsyncIterator[str]:
+        async def convert(page_range: Tuple[int, int]) -> str:
+            async with self.async_client_pool.lease(api_key) as client:
+                return await self._convert_async(client, pdf_path, **_range_options(page_range))
+
+        tasks = [asyncio.ensure_future(convert(page_range)) for page_range in ranges]
+        try:
+            for (first, _), task in zip(ranges, tasks):
+                yield stitch_page(first, await task)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _api_key(self) -> str:
         api_key = self.api_key or os.getenv("DATALAB_API_KEY")
         if not api_key:
             raise StrategyError("DATALAB_API_KEY is not configured")
+        return api_key
 
-        client = self._client_factory(api_key)
-        markdown = self._convert(client, pdf_path)
+    def _page_ranges(self, pdf_path: Path) -> List[Tuple[int, int]]:
+        """Page ranges to convert concurrently; empty when the PDF goes in one request."""
+        if not self.pages_per_chunk:
+            return []
+        page_count = pdf_page_count(pdf_path.read_bytes())
+        if page_count is None or page_count <= self.pages_per_chunk:
+            return []
+        return page_ranges(page_count, self.pages_per_chunk)
+
+    def _lookup(
+        self, pdf_path: Path, ranges: List[Tuple[int, int]]
+    ) -> Tuple[Optional[ParseCache], Optional[str], Optional[str]]:
+        """The cache in use, the PDF's cache key and the cached markdown, if any."""
+        cache = self.cache
+        if cache is None:
+            return None, None, None
+        options = dict(self.convert_options)
+        if ranges:
+            # Ranges are converted separately, so split parses are cached apart.
+            options.update(pages_per_chunk=self.pages_per_chunk)
+        cache_key = parse_cache_key(pdf_path, options)
+        return cache, cache_key, cache.get(cache_key)
+
+    def _prepare(self, pdf_path: Path):
+        if not pdf_path.exists():
+            raise StrategyError(f"PDF not found: {pdf_path}")
+        ranges = self._page_ranges(pdf_path)
+        return (ranges, *self._lookup(pdf_path, ranges))
+
+    def _store(
+        self,
+        markdown: str,
+        ranges: List[Tuple[int, int]],
+        cache: Optional[ParseCache],
+        cache_key: Optional[str],
+        artifacts: Dict[str, Any],
+    ) -> None:
+        if ranges:
+            artifacts["page_ranges"] = ranges
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, markdown)
+            artifacts.update(parse_cache="miss", cache_key=cache_key)
+
+    def _result(self, markdown: str, **artifacts: Any) -> StrategyResult[str]:
         return StrategyResult(
             output=markdown,
             context_updates={"parsed_markdown": markdown},
-            artifacts={"source": "datalab"},
+            artifacts={"source": "datalab", **artifacts},
         )
 
+    def iter_markdown(
+        self, context, artifacts: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """Yield the markdown in page order as it arrives from Datalab.
+
+        A split PDF yields one stitched page range at a time, as soon as it
+        and every range before it are converted; otherwise the whole markdown
+        comes at once. The parts join to what `execute` returns, and
+        `artifacts`, when given, receives the artifacts `execute` reports.
+        """
+        artifacts = {} if artifacts is None else artifacts
+        artifacts["source"] = "datalab"
+        ranges, cache, cache_key, cached = self._prepare(context.pdf_path)
+        if cached is not None:
+            artifacts.update(parse_cache="hit", cache_key=cache_key)
+            yield cached
+            return
+
+        api_key = self._api_key()
+        if ranges:
+            parts = []
+            for part in self._iter_pages(api_key, context.pdf_path, ranges):
+                parts.append(part)
+                yield part
+            markdown = "".join(parts)
+        else:
+            with self.client_pool.lease(api_key) as client:
+                markdown = self._convert(client, context.pdf_path)
+            yield markdown
+        self._store(markdown, ranges, cache, cache_key, artifacts)
+
+    async def aiter_markdown(
+        self, context, artifacts: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """`iter_markdown` on the event loop, using the async client pool."""
+        artifacts = {} if artifacts is None else artifacts
+        artifacts["source"] = "datalab"
+        # Reading and hashing the PDF and SQLite lookups stay off the event loop.
+        ranges, cache, cache_key, cached = await asyncio.to_thread(self._prepare, context.pdf_path)
+        if cached is not None:
+            artifacts.update(parse_cache="hit", cache_key=cache_key)
+            yield cached
+            return
+
+        api_key = self._api_key()
+        if ranges:
+            parts = []
+            async for part in self._aiter_pages(api_key, context.pdf_path, ranges):
+                parts.append(part)
+                yield part
+            markdown = "".join(parts)
+        else:
+            async with self.async_client_pool.lease(api_key) as client:
+                markdown = await self._convert_async(client, context.pdf_path)
+            yield markdown
+        await asyncio.to_thread(self._store, markdown, ranges, cache, cache_key, artifacts)
+
+    def execute(self, context):
+        artifacts: Dict[str, Any] = {}
+        markdown = "".join(self.iter_markdown(context, artifacts))
+        return self._result(markdown, **artifacts)
+
+    async def execute_async(self, context):
+        artifacts: Dict[str, Any] = {}
+        markdown = "".join([part async for part in self.aiter_markdown(context, artifacts)])
+        return self._result(markdown, **artifacts)
+
+
+def _range_options(page_range: Tuple[int, int]) -> Dict[str, Any]:
+    first, last = page_range
+    return {"page_range": f"{first}-{last}"}
+
+
+def _markdown_from(result: Any) -> str:
+    markdown = getattr(result, "markdown", None)
+    if not markdown:
+        raise StrategyError("Datalab API response did not include markdown")
+    return str(markdown)
+
 
 class MockParsePdfToDatalabMarkdown(BaseStrategy[str]):
     """Return canned markdown for a given PDF name."""
@@ -0,0 +1,245 @@
+"""Content-addressed on-disk cache of Datalab parse results.
+
+A parse is keyed by the SHA-256 of the PDF bytes and the convert options, so
+re-uploads, retries and re-runs under another strategy version reuse the
+markdown instead of calling Datalab again. Entries live in a SQLite database
+(WAL mode) and are stored zlib-compressed. Once the stored bytes exceed
+`max_bytes`, the least recently used entries are evicted. Like the
+brute-force pattern store, storage errors degrade to cache misses.
+
+Configuration comes from the environment unless passed explicitly:
+
+- `TAXMAN_PARSE_CACHE_PATH`: database file (default:
+  `~/.cache/taxman/datalab_parse_cache.sqlite3`)
+- `TAXMAN_PARSE_CACHE_MAX_MB`: size bound for stored markdown (default: 512)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from .pool import env_int
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS parse_results (
+        key TEXT PRIMARY KEY,
+        markdown BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        last_used REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS parse_results_last_used ON parse_results (last_used)",
+)
+_BUSY_TIMEOUT_SECONDS = 10.0
+# Bump when the cached payload changes meaning, e.g. a different converter.
+_KEY_VERSION = b"datalab-markdown-v1"
+
+DEFAULT_MAX_MB = 512
+PARSE_CACHE_PATH = Path(
+    os.getenv("TAXMAN_PARSE_CACHE_PATH")
+    or Path.home() / ".cache" / "taxman" / "datalab_parse_cache.sqlite3"
+)
+_PARSE_CACHE: Optional["ParseCache"] = None
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def parse_cache_key(pdf_path: Path, options: Mapping[str, Any]) -> str:
+    """SHA-256 over the PDF bytes and the canonical JSON of the convert options."""
+    with open(pdf_path, "rb") as handle:
+        pdf_digest = hashlib.file_digest(handle, "sha256").digest()
+    digest = hashlib.sha256(_KEY_VERSION)
+    digest.update(pdf_digest)
+    digest.update(json.dumps(dict(options), sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class ParseCacheStats:
+    """Counters for one `ParseCache` since it was opened."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["hit_rate"] = round(self.hit_rate, 4)
+        return data
+
+
+class ParseCache:
+    """SQLite-backed LRU of parsed markdown keyed by `parse_cache_key`.
+
+    A connection is opened per operation so the cache is safe to use from
+    threads and forked workers.
+    """
+
+    def __init__(self, path: Path, *, max_bytes: Optional[int] = None):
+        self.path = Path(path)
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else (env_int("TAXMAN_PARSE_CACHE_MAX_MB") or DEFAULT_MAX_MB) * 1024 * 1024
+        )
+        self._stats = ParseCacheStats()
+        self._lock = threading.Lock()
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=_BUSY_TIMEOUT_SECONDS)
+        if not self._ready:
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+            self._ready = True
+        return connection
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for name, amount in increments.items():
+                setattr(self._stats, name, getattr(self._stats, name) + amount)
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached markdown for `key`, refreshing its recency; None on a miss."""
+        if not self.path.exists():
+            self._count(misses=1)
+            return None
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    row = connection.execute(
+                        "SELECT markdown FROM parse_results WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        connection.execute(
+                            "UPDATE parse_results SET last_used = ? WHERE key = ?",
+                            (time.time(), key),
+                        )
+            finally:
+                connection.close()
+            markdown = zlib.decompress(row[0]).decode("utf-8") if row else None
+        except (sqlite3.Error, zlib.error, UnicodeDecodeError):
+            self._count(misses=1, errors=1)
+            return None
+        self._count(**({"hits": 1} if markdown is not None else {"misses": 1}))
+        return markdown
+
+    def put(self, key: str, markdown: str) -> None:
+        """Store markdown for `key`, then evict least recently used entries over the bound."""
+        payload = zlib.compress(markdown.encode("utf-8"))
+        if len(payload) > self.max_bytes:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO parse_results (key, markdown, size, last_used)"
+                        " VALUES (?, ?, ?, ?)",
+                        (key, payload, len(payload), time.time()),
+                    )
+                    evicted = self._evict(connection)
+            finally:
+                connection.close()
+        except (OSError, sqlite3.Error):
+            self._count(errors=1)
+            return
+        self._count(writes=1, evictions=evicted)
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM parse_results"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return 0
+        victims = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM parse_results ORDER BY last_used"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM parse_results WHERE key = ?", victims)
+        return len(victims)
+
+    def usage(self) -> Dict[str, int]:
+        """Entries and stored (compressed) bytes currently on disk."""
+        if not self.path.exists():
+            return {"entries": 0, "bytes": 0}
+        try:
+            connection = self._connect()
+            try:
+                entries, stored = connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM parse_results"
+                ).fetchone()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return {"entries": 0, "bytes": 0}
+        return {"entries": entries, "bytes": stored}
+
+    def stats(self) -> ParseCacheStats:
+        with self._lock:
+            return ParseCacheStats(**asdict(self._stats))
+
+    def clear(self) -> None:
+        if not self.path.exists():
+            return
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("DELETE FROM parse_results")
+        finally:
+            connection.close()
+
+    def render_prometheus(self) -> str:
+        """Render hit/miss counters and disk usage in the Prometheus text format."""
+        stats = self.stats()
+        usage = self.usage()
+        series = (
+            ("hits_total", "counter", "Parses served from the cache.", stats.hits),
+            ("misses_total", "counter", "Parses not found in the cache.", stats.misses),
+            ("writes_total", "counter", "Parse results written to the cache.", stats.writes),
+            ("evictions_total", "counter", "Entries evicted to stay under the size bound.", stats.evictions),
+            ("errors_total", "counter", "Cache reads or writes that failed.", stats.errors),
+            ("entries", "gauge", "Entries currently stored.", usage["entries"]),
+            ("bytes", "gauge", "Compressed bytes currently stored.", usage["bytes"]),
+        )
+        lines = []
+        for name, kind, description, value in series:
+            lines.append(f"# HELP taxman_parse_cache_{name} {description}")
+            lines.append(f"# TYPE taxman_parse_cache_{name} {kind}")
+            lines.append(f"taxman_parse_cache_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def get_parse_cache() -> ParseCache:
+    """Return the shared cache for `PARSE_CACHE_PATH`, opening it on first use."""
+    global _PARSE_CACHE
+    with _PARSE_CACHE_LOCK:
+        cache = _PARSE_CACHE
+        if cache is None or cache.path != PARSE_CACHE_PATH:
+            cache = ParseCache(PARSE_CACHE_PATH)
+            _PARSE_CACHE = cache
+        return cache
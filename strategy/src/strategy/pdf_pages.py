@@ -0,0 +1,94 @@
+"""Split PDFs into page ranges for Datalab and stitch the markdown back together.
+
+Datalab converts a document as one request, so a long K-1 package costs the
+sum of its pages. `ParsePdfToDatalabMarkdown` instead converts `page_ranges`
+of a large PDF concurrently and joins the parts with `stitch_pages`. Every
+convert, whole or per range, uses `paginate=True`. Each part's `{n}------`
+page separators are renumbered to absolute page numbers, so a stitched
+document has the same shape as a whole-PDF parse and `DocumentIndex.page_at`
+and `DocumentIndex.page_span` work on both.
+
+The page count is read from the PDF bytes with the standard library: the
+page tree's `/Count`, looking inside compressed object streams when needed.
+When it cannot be determined the PDF is parsed in one request.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# Page separator lines Datalab writes with `paginate=True`; pages are zero-based.
+PAGE_MARKER = re.compile(r"^\{(\d+)\}(-{3,})[ \t]*$", re.MULTILINE)
+PAGE_MARKER_DASHES = "-" * 48
+
+_PAGES_COUNT = re.compile(
+    rb"/Type\s*/Pages\b[^>]*?/Count\s+(\d+)|/Count\s+(\d+)[^>]*?/Type\s*/Pages\b"
+)
+_PAGE_OBJECT = re.compile(rb"/Type\s*/Page(?![A-Za-z])")
+_STREAM_START = re.compile(rb"stream\r?\n")
+# How far before `stream` to look for the stream dictionary's `/ObjStm` type.
+_STREAM_DICT_WINDOW = 512
+
+
+def _object_streams(data: bytes) -> Iterator[bytes]:
+    """Inflate each Flate-encoded object stream; PDF 1.5+ hides the page tree in them."""
+    for match in _STREAM_START.finditer(data):
+        head = data[max(0, match.start() - _STREAM_DICT_WINDOW) : match.start()]
+        if b"/ObjStm" not in head[head.rfind(b"<<") :]:
+            continue
+        end = data.find(b"endstream", match.end())
+        if end < 0:
+            continue
+        try:
+            yield zlib.decompressobj().decompress(data[match.end() : end])
+        except zlib.error:
+            continue
+
+
+def pdf_page_count(data: bytes) -> Optional[int]:
+    """Pages in a PDF, or None when the page tree cannot be found."""
+    sources = [data]
+    counts = [int(a or b) for a, b in _PAGES_COUNT.findall(data)]
+    if not counts:
+        sources.extend(_object_streams(data))
+        counts = [int(a or b) for source in sources[1:] for a, b in _PAGES_COUNT.findall(source)]
+    if counts:
+        # The root of the page tree counts every page below it.
+        return max(counts) or None
+    pages = sum(len(_PAGE_OBJECT.findall(source)) for source in sources)
+    return pages or None
+
+
+def page_ranges(page_count: int, pages_per_chunk: int) -> List[Tuple[int, int]]:
+    """Inclusive, zero-based `(first, last)` ranges covering `page_count` pages."""
+    return [
+        (first, min(first + pages_per_chunk, page_count) - 1)
+        for first in range(0, page_count, pages_per_chunk)
+    ]
+
+
+def page_marker(page: int) -> str:
+    return f"{{{page}}}{PAGE_MARKER_DASHES}"
+
+
+def stitch_page(first_page: int, markdown: str) -> str:
+    """One part of a stitched document: `markdown` with absolute page separators.
+
+    Separators are shifted so the first one reads `first_page`, whether
+    Datalab numbered the range from zero or from its first page. A part
+    without separators gets one at its start. Parts are concatenated as is.
+    """
+    markdown = markdown.strip("\n")
+    first = PAGE_MARKER.search(markdown)
+    if first is None:
+        return f"{page_marker(first_page)}\n\n{markdown}\n\n"
+    shift = first_page - int(first.group(1))
+    renumbered = PAGE_MARKER.sub(lambda match: page_marker(int(match.group(1)) + shift), markdown)
+    return f"{renumbered}\n\n"
+
+
+def stitch_pages(parts: Iterable[Tuple[int, str]]) -> str:
+    """Join `(first_page, markdown)` parts in order; see `stitch_page`."""
+    return "".join(stitch_page(first_page, markdown) for first_page, markdown in parts)
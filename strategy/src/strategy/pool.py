@@ -0,0 +1,239 @@
+"""Shared process pool for CPU-bound stages (batch extraction, brute force).
+
+One `WorkerPool` per process replaces ad-hoc `ProcessPoolExecutor`s. It can
+be warmed up at service start so the first request does not pay for process
+spawning, and it recycles workers after a number of tasks or once a worker's
+resident memory grows past a limit. Queue depth and throughput counters are
+exposed through `stats()`.
+
+Sizing comes from the environment unless passed explicitly:
+
+- `TAXMAN_CPU_WORKERS`: worker processes (default: CPU count, at most 4)
+- `TAXMAN_WORKER_MAX_TASKS`: tasks per worker before it is replaced
+- `TAXMAN_WORKER_MAX_RSS_MB`: peak RSS after which the pool is recycled
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+import threading
+from concurrent.futures import Future, InvalidStateError, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def env_int(name: str) -> Optional[int]:
+    """Read a positive integer setting from the environment, else None."""
+    raw = os.getenv(name)
+    if not raw:
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:  # pragma: no cover - Windows
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_measured(fn: Callable[..., Any], args: tuple, kwargs: dict) -> tuple[Any, float]:
+    return fn(*args, **kwargs), _peak_rss_mb()
+
+
+def _noop() -> int:
+    return os.getpid()
+
+
+@dataclass
+class PoolStats:
+    """Point-in-time counters for a `WorkerPool`."""
+
+    max_workers: int
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    recycles: int = 0
+    peak_worker_rss_mb: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class WorkerPool:
+    """Process pool with warm-up, worker recycling and queue-depth metrics.
+
+    `submit` mirrors `Executor.submit` and returns a standard `Future`, so
+    callers can keep using `wait`/`as_completed`. The underlying executor is
+    created on first use and replaced (letting queued work finish on the old
+    one) when a worker reports memory above `max_rss_mb`.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        *,
+        max_tasks_per_child: Optional[int] = None,
+        max_rss_mb: Optional[float] = None,
+    ):
+        self.max_workers = (
+            max_workers
+            or env_int("TAXMAN_CPU_WORKERS")
+            or max(1, min(os.cpu_count() or 1, DEFAULT_MAX_WORKERS))
+        )
+        self.max_tasks_per_child = max_tasks_per_child or env_int("TAXMAN_WORKER_MAX_TASKS")
+        self.max_rss_mb = max_rss_mb or env_int("TAXMAN_WORKER_MAX_RSS_MB")
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = PoolStats(max_workers=self.max_workers)
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            kwargs: Dict[str, Any] = {"max_workers": self.max_workers}
+            if self.max_tasks_per_child:
+                kwargs["max_tasks_per_child"] = self.max_tasks_per_child
+            self._executor = ProcessPoolExecutor(**kwargs)
+        return self._executor
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        outer: Future = Future()
+        with self._lock:
+            executor = self._ensure_executor()
+            inner = executor.submit(_run_measured, fn, args, kwargs)
+            self._stats.submitted += 1
+            self._stats.queue_depth += 1
+            self._stats.max_queue_depth = max(
+                self._stats.max_queue_depth, self._stats.queue_depth
+            )
+
+        def _forward(done: Future) -> None:
+            rss = 0.0
+            result: Any = None
+            error = None if done.cancelled() else done.exception()
+            if not done.cancelled() and error is None:
+                result, rss = done.result()
+            with self._lock:
+                self._stats.queue_depth -= 1
+                if done.cancelled() or error is not None:
+                    self._stats.failed += 1
+                else:
+                    self._stats.completed += 1
+                    self._stats.peak_worker_rss_mb = max(self._stats.peak_worker_rss_mb, rss)
+            if self.max_rss_mb and rss > self.max_rss_mb:
+                self._recycle(executor)
+            try:
+                if done.cancelled():
+                    outer.cancel()
+                elif error is not None:
+                    outer.set_exception(error)
+                else:
+                    outer.set_result(result)
+            except InvalidStateError:
+                # The caller already cancelled the outer future.
+                pass
+
+        def _cancel_inner(done: Future) -> None:
+            if done.cancelled():
+                inner.cancel()
+
+        outer.add_done_callback(_cancel_inner)
+        inner.add_done_callback(_forward)
+        return outer
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._stats.recycles += 1
+        # Queued tasks still finish on the old workers; new ones go to a fresh pool.
+        executor.shutdown(wait=False)
+
+    def recycle(self) -> None:
+        """Replace all workers, e.g. after a config reload."""
+        with self._lock:
+            executor = self._executor
+        if executor is not None:
+            self._recycle(executor)
+
+    def warm_up(self) -> int:
+        """Start every worker now; returns how many distinct workers answered."""
+        futures = [self.submit(_noop) for _ in range(self.max_workers)]
+        return len({future.result() for future in futures})
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(**asdict(self._stats))
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.shutdown()
+
+
+_CPU_POOL: Optional[WorkerPool] = None
+_CPU_POOL_LOCK = threading.Lock()
+
+
+def get_cpu_pool() -> WorkerPool:
+    """Return the process-wide pool, creating it from the environment on first use."""
+    global _CPU_POOL
+    with _CPU_POOL_LOCK:
+        if _CPU_POOL is None:
+            _CPU_POOL = WorkerPool()
+        return _CPU_POOL
+
+
+def configure_cpu_pool(
+    max_workers: Optional[int] = None,
+    *,
+    max_tasks_per_child: Optional[int] = None,
+    max_rss_mb: Optional[float] = None,
+    warm_up: bool = False,
+) -> WorkerPool:
+    """Replace the process-wide pool with one built from explicit settings."""
+    global _CPU_POOL
+    pool = WorkerPool(
+        max_workers, max_tasks_per_child=max_tasks_per_child, max_rss_mb=max_rss_mb
+    )
+    with _CPU_POOL_LOCK:
+        previous, _CPU_POOL = _CPU_POOL, pool
+    if previous is not None:
+        previous.shutdown(wait=False)
+    if warm_up:
+        pool.warm_up()
+    return pool
+
+
+def shutdown_cpu_pool() -> None:
+    global _CPU_POOL
+    with _CPU_POOL_LOCK:
+        pool, _CPU_POOL = _CPU_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_cpu_pool)
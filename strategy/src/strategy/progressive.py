@@ -0,0 +1,149 @@
+"""Extract cover-page fields while the rest of the document is still parsing.
+
+`ProgressiveParse` wraps the parse strategy. It reads the markdown in page
+order as Datalab returns it (`ParsePdfToDatalabMarkdown.iter_markdown`). After
+each part arrives it runs the early fields' regex plans on the markdown
+received so far. Parts always end on a page boundary, so a field is only
+evaluated against complete pages. A field whose value is located is published
+through `on_partial` and is not evaluated again.
+
+Partial values are provisional. The full `ExtractRegexK1` run on the complete
+document still produces `field_values`. The partial ones are kept in
+`metadata["partial_field_values"]`, and the parse artifacts record how many
+pages and seconds each took to find.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+
+from strategy.k1.metrics import MATCH
+from strategy.k1.regex_extractor import DOC1_FIELD_TEMPLATE
+from strategy.k1.versions import STRATEGY_VERSIONS
+
+from .base import BaseStrategy, StrategyResult
+
+# Partnership name and EIN (Part I) and the capital account (Part II, item L)
+# are on the first page of every K-1.
+COVER_PAGE_FIELDS = (
+    "partnership_name",
+    "partnership_employer_identification_number",
+    "capital_contributions_during_year",
+    "withdrawals_and_distributions_cash",
+    "ending_capital_account",
+)
+
+PartialCallback = Callable[[Dict[str, str]], None]
+
+
+class _PartialFields:
+    """Early fields found so far, re-evaluated on each longer prefix."""
+
+    def __init__(self, version: str, fields: Iterable[str], on_partial: Optional[PartialCallback]):
+        self.engine = STRATEGY_VERSIONS.engine(version)
+        self.pending = [name for name in fields if name in self.engine.plans_by_field]
+        self.on_partial = on_partial
+        self.values: Dict[str, str] = {}
+        self.found: Dict[str, Dict[str, Any]] = {}
+        self.started = time.perf_counter()
+
+    def update(self, markdown: str) -> None:
+        if not self.pending:
+            return
+        extractor = self.engine.document(markdown, field_defaults=DOC1_FIELD_TEMPLATE)
+        pages = len(extractor.index.page_starts)
+        new: Dict[str, str] = {}
+        for name in self.pending:
+            # `run_plan` rather than `run`: prefixes are not counted as documents.
+            value, run = self.engine.run_plan(self.engine.plans_by_field[name], extractor)
+            # Judge by the run, not the value: a located "0" is a real answer,
+            # and a field's default is not.
+            if run.outcome == MATCH:
+                new[name] = value
+                self.found[name] = {
+                    "value": value,
+                    "pages": pages,
+                    "seconds": round(time.perf_counter() - self.started, 6),
+                }
+        if not new:
+            return
+        self.pending = [name for name in self.pending if name not in new]
+        self.values.update(new)
+        if self.on_partial is not None:
+            self.on_partial(dict(self.values))
+
+
+class ProgressiveParse(BaseStrategy[str]):
+    """Run a parse strategy and publish early field values as its pages arrive.
+
+    `parser` is used through `iter_markdown`/`aiter_markdown` when it has
+    them; any other parse strategy is run whole and the fields are evaluated
+    once. The result is the parser's, plus the partial values.
+    """
+
+    def __init__(
+        self,
+        parser: BaseStrategy[str],
+        *,
+        fields: Optional[Iterable[str]] = None,
+        version: Optional[str] = None,
+        on_partial: Optional[PartialCallback] = None,
+    ):
+        super().__init__(name="ProgressiveParse", version=parser.version, activity="parse")
+        self.parser = parser
+        self.fields = tuple(fields) if fields else COVER_PAGE_FIELDS
+        self.strategy_version = version or STRATEGY_VERSIONS.default_version
+        self.on_partial = on_partial
+
+    def _tracker(self) -> _PartialFields:
+        return _PartialFields(self.strategy_version, self.fields, self.on_partial)
+
+    def _result(
+        self, markdown: str, artifacts: Mapping[str, Any], tracker: _PartialFields
+    ) -> StrategyResult[str]:
+        return StrategyResult(
+            output=markdown,
+            context_updates={
+                "parsed_markdown": markdown,
+                "partial_field_values": dict(tracker.values),
+            },
+            artifacts={
+                **artifacts,
+                "parser": self.parser.name,
+                "partial_fields": tracker.found,
+                "missing_partial_fields": list(tracker.pending),
+            },
+        )
+
+    def execute(self, context):
+        tracker = self._tracker()
+        iter_markdown = getattr(self.parser, "iter_markdown", None)
+        if iter_markdown is None:
+            result = self.parser.execute(context)
+            tracker.update(result.output)
+            return self._result(result.output, result.artifacts, tracker)
+
+        artifacts: Dict[str, Any] = {}
+        markdown = ""
+        for part in iter_markdown(context, artifacts):
+            markdown += part
+            tracker.update(markdown)
+        return self._result(markdown, artifacts, tracker)
+
+    async def execute_async(self, context):
+        tracker = self._tracker()
+        aiter_markdown = getattr(self.parser, "aiter_markdown", None)
+        if aiter_markdown is None:
+            result = await self.parser.execute_async(context)
+            await asyncio.to_thread(tracker.update, result.output)
+            return self._result(result.output, result.artifacts, tracker)
+
+        artifacts: Dict[str, Any] = {}
+        markdown = ""
+        async for part in aiter_markdown(context, artifacts):
+            markdown += part
+            # Regex plans are CPU work; keep them off the event loop.
+            await asyncio.to_thread(tracker.update, markdown)
+        return self._result(markdown, artifacts, tracker)
@@ -1,6 +1,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 
 # Ensure repository root and package src dirs are on sys.path so tests use local
 # workspace modules during development. Always (re)insert to guarantee coverage of
@@ -14,3 +16,21 @@ for path in (ROOT, STRATEGY_SRC, WORKFLOW_SRC):
     if path_str in sys.path:
         sys.path.remove(path_str)
     sys.path.insert(0, path_str)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_datalab_state(tmp_path, monkeypatch):
+    """Keep parse results and pooled clients from leaking between tests or into ~/.cache."""
+    import strategy.datalab_pool as datalab_pool
+    import strategy.openrouter_client as openrouter_client
+    import strategy.parse_cache as parse_cache
+
+    monkeypatch.setattr(parse_cache, "PARSE_CACHE_PATH", tmp_path / "parse_cache.sqlite3")
+    monkeypatch.setattr(datalab_pool, "_DATALAB_POOL", None)
+    monkeypatch.setattr(datalab_pool, "_ASYNC_DATALAB_POOL", None)
+    monkeypatch.setattr(datalab_pool, "_DATALAB_LOOP", None)
+    monkeypatch.setattr(openrouter_client, "_OPENROUTER_CLIENT", None)
+    monkeypatch.setattr(openrouter_client, "_ASYNC_OPENROUTER_CLIENT", None)
+    yield
+    if datalab_pool._DATALAB_LOOP is not None:
+        datalab_pool._DATALAB_LOOP.close()
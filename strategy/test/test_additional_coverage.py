@@ -30,7 +30,7 @@ def test_base_strategy_call_and_execute_not_implemented():
 
 def test_extract_numeric_values_uses_base_values(monkeypatch):
     class FakeExtractor:
-        def __init__(self, *_):
+        def __init__(self, *_, **__):
             self.base_values = {"x": "10"}
             self.table_values = {}
             self.table_contexts = {}
@@ -50,6 +50,8 @@ def test_extract_regex_loads_custom_config(tmp_path):
 
 def test_llm_default_request_and_parse_errors(monkeypatch, tmp_path):
     class FakeResponse:
+        status_code = 200
+        headers = {}
         def __init__(self):
             self.called = False
         def raise_for_status(self):
@@ -60,6 +62,8 @@ def test_llm_default_request_and_parse_errors(monkeypatch, tmp_path):
     class FakeRequests:
         def __init__(self):
             self.last = None
+        def Session(self):
+            return self
         def post(self, base_url, headers=None, json=None, timeout=None):
             self.last = (base_url, headers, json, timeout)
             return FakeResponse()
@@ -121,25 +125,26 @@ def test_parse_mock_fixture_root_selection(monkeypatch, tmp_path):
 
 
 def test_regex_cache_edge_cases(monkeypatch, tmp_path):
-    monkeypatch.setattr(rx, "BRUTE_FORCE_CACHE_PATH", tmp_path / "cache.json")
-    monkeypatch.setattr(rx, "_BRUTE_FORCE_PATTERN_CACHE", {})
+    monkeypatch.setattr(rx, "BRUTE_FORCE_CACHE_PATH", tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(rx, "_BRUTE_FORCE_STORE", None)
+    store = rx.get_brute_force_store()
     # Missing file
-    assert rx._load_brute_force_pattern_cache() == {}
-    # Bad json
-    rx.BRUTE_FORCE_CACHE_PATH.write_text("not-json")
-    assert rx._load_brute_force_pattern_cache() == {}
-    # Wrong version
-    rx.BRUTE_FORCE_CACHE_PATH.write_text(json.dumps({"version": 0, "patterns": {}}))
-    assert rx._load_brute_force_pattern_cache() == {}
-    # Patterns not dict
-    rx.BRUTE_FORCE_CACHE_PATH.write_text(json.dumps({"version": rx.BRUTE_FORCE_CACHE_VERSION, "patterns": []}))
-    assert rx._load_brute_force_pattern_cache() == {}
-    # Entries not list
-    rx.BRUTE_FORCE_CACHE_PATH.write_text(json.dumps({"version": rx.BRUTE_FORCE_CACHE_VERSION, "patterns": {"a": {}}}))
-    assert rx._load_brute_force_pattern_cache() == {}
-
-
-def test_regex_brute_force_helpers(monkeypatch):
+    assert store.get("a") is None
+    assert store.fields() == []
+    # Corrupt rows
+    store.put("a", [])
+    assert store.get("a") is None
+    # Not a database
+    rx.BRUTE_FORCE_CACHE_PATH.write_text("not-sqlite")
+    fresh = rx.BruteForcePatternStore(rx.BRUTE_FORCE_CACHE_PATH, "g")
+    assert fresh.get("a") is None
+    fresh.put("a", [("p", True)])
+    assert fresh.get("a") is None
+
+
+def test_regex_brute_force_helpers(monkeypatch, tmp_path):
+    monkeypatch.setattr(rx, "BRUTE_FORCE_CACHE_PATH", tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(rx, "_BRUTE_FORCE_STORE", None)
     extractor = rx.ParsedK1RegexExtractor("text")
     extractor.brute_force_cache["field"] = "cached"
     assert rx._brute_force_strategy("field")(extractor) == "cached"
@@ -0,0 +1,33 @@
+from strategy.k1.anchors import AnchorPrefilter, literal_anchor
+import strategy.k1.regex_extractor as rx
+
+
+def test_literal_anchor_accepts_only_plain_patterns():
+    assert literal_anchor(r"Capital\s+contributed\s+during\s+the\s+year") == (
+        "capital contributed during the year"
+    )
+    assert literal_anchor(r"SWAP\s+INCOME\/\(LOSS\)") == "swap income/(loss)"
+    assert literal_anchor(r"OTHER\s+INCOME(?:\s+\(LOSS\))?") is None
+
+
+def test_prefilter_scans_once_and_implies_prefix_anchors():
+    prefilter = AnchorPrefilter(["Ending capital", "ending  capital account", "EIN"])
+
+    found = prefilter.scan("| ENDING\nCapital   Account | $ 5 |")
+
+    assert found == {"ending capital", "ending capital account"}
+    assert AnchorPrefilter([]).scan("anything") == frozenset()
+
+
+def test_engine_skips_strategies_whose_anchors_are_absent():
+    text = "| L | Ending capital account | $ 1,250 |\n"
+
+    extractor = rx.get_extraction_engine().document(text)
+    values = extractor.extract()
+
+    assert values["ending_capital_account"] == "1250"
+    assert extractor.used_strategies["ending_capital_account"]["prefilter"] == "hit"
+    assert extractor.used_strategies["capital_contributions_during_year"]["prefilter"] == "miss"
+    assert values["capital_contributions_during_year"] == "0"
+    stats = extractor.prefilter_stats
+    assert stats["hits"] >= 1 and stats["misses"] >= 1
@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import strategy.k1.batch as batch
+from strategy.k1.regex_extractor import extract_fields_from_file
+
+
+MARKDOWN_DIR = (
+    Path(__file__).resolve().parent
+    / "fixtures"
+    / "MockParsePdfToMarkdown"
+    / "mock_markdown_response_body"
+)
+
+
+def test_iter_extract_batch_inline_matches_single_file_extraction():
+    paths = sorted(MARKDOWN_DIR.glob("*.md"))
+    stats = batch.BatchStats()
+
+    results = list(batch.iter_extract_batch(paths, workers=1, chunk_size=2, stats=stats))
+
+    assert [result.source for result in results] == [str(path) for path in paths]
+    for path, result in zip(paths, results):
+        assert result.ok
+        assert result.values == extract_fields_from_file(path)
+    assert stats.documents == len(paths)
+    assert stats.failures == 0
+    assert stats.docs_per_second > 0
+
+
+def test_extract_batch_process_pool_streams_every_document(tmp_path):
+    documents = [("a", "| 1 | Ordinary business income | 1,000 |"), tmp_path / "missing.md"]
+    documents += [f"| 1 | Ordinary business income | {n} |" for n in range(5)]
+
+    results, stats = batch.extract_batch(
+        documents,
+        workers=2,
+        chunk_size=2,
+        fields=["line_1_ordinary_business_income_loss"],
+    )
+
+    by_source = {result.source: result for result in results}
+    assert len(results) == 7
+    assert by_source["a"].values == {"line_1_ordinary_business_income_loss": "1000"}
+    assert not by_source[str(tmp_path / "missing.md")].ok
+    assert by_source["document-6"].values["line_1_ordinary_business_income_loss"] == "4"
+    assert stats.failures == 1
+
+
+def test_batch_rejects_bad_settings():
+    with pytest.raises(ValueError):
+        list(batch.iter_extract_batch([], chunk_size=0))
+    with pytest.raises(ValueError):
+        list(batch.iter_extract_batch([], workers=0))
+
+
+def test_batch_cli_writes_json_lines(tmp_path, capsys):
+    output = tmp_path / "out.jsonl"
+
+    exit_code = batch.main(
+        [str(MARKDOWN_DIR), "--workers", "1", "--fields", "partnership_name", "--output", str(output)]
+    )
+
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert exit_code == 0
+    assert len(lines) == 3
+    assert set(lines[0]["values"]) == {"partnership_name"}
+    assert "docs/sec" in capsys.readouterr().err
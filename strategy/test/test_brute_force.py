@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import strategy.k1.brute_force as bf
+import strategy.k1.regex_extractor as rx
+
+
+PATTERNS = (
+    (r"Missing\s*:\s*([\d,]+)", True),
+    (r"Gross receipts\s*:\s*(abc)", True),
+    (r"Gross receipts\s*:\s*\$?([\d,]+)", True),
+    (r"Gross receipts\s*:\s*([A-Za-z ]+)", False),
+    (r"(unbalanced", True),
+)
+SNIPPETS = ["Intro", "Gross receipts: $12,500 | other"]
+
+
+def test_search_patterns_stops_at_first_confident_hit():
+    outcome = bf.search_patterns(PATTERNS, SNIPPETS, 1.0)
+
+    assert outcome.match.value == "12,500"
+    assert outcome.match.pattern == PATTERNS[2][0]
+    assert outcome.match.pattern_index == 2
+    assert outcome.patterns_tried == 3
+    assert not outcome.timed_out
+
+
+def test_search_patterns_honours_budget():
+    outcome = bf.search_patterns(PATTERNS, SNIPPETS, 0.0)
+
+    assert outcome.match is None
+    assert outcome.timed_out
+    assert outcome.patterns_tried == 0
+
+
+def test_parallel_search_matches_serial_winner():
+    patterns = tuple((rf"Row {n}\s*:\s*(\d+)", True) for n in range(40))
+    snippets = ["Row 31: 7", "Row 12: 99"]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        outcome = bf.search_patterns_parallel(executor, patterns, snippets, 1.0, slices=4)
+
+    assert outcome.match.pattern_index == 12
+    assert outcome.match.value == "99"
+
+
+@pytest.fixture
+def tmp_cache(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(rx, "BRUTE_FORCE_CACHE_PATH", tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(rx, "_BRUTE_FORCE_STORE", None)
+    return tmp_path
+
+
+def test_configured_brute_force_reports_winning_pattern(tmp_cache):
+    engine = rx.RegexExtractionEngine({"line_18c_nondeductible_expenses": "brute_force"})
+    extractor = engine.document("Schedule\nNONDEDUCTIBLE EXPENSES: 1,234\n")
+
+    values = extractor.extract(fields=["line_18c_nondeductible_expenses"])
+
+    used = extractor.used_strategies["line_18c_nondeductible_expenses"]
+    assert values["line_18c_nondeductible_expenses"] == "1234"
+    assert used["name"] == "brute_force"
+    assert "NONDEDUCTIBLE" in used["pattern"]
+    assert used["timed_out"] is False
+
+
+def test_brute_force_is_never_the_default_strategy():
+    plans = rx.RegexExtractionEngine().plans_by_field
+
+    assert all(plan.strategy_name != "brute_force" for plan in plans.values())
+
+
+def test_brute_force_hits_count_as_matches_with_a_span(tmp_cache):
+    text = "Schedule\nNONDEDUCTIBLE EXPENSES: 1,234\n"
+    extractor = rx.RegexExtractionEngine({"line_18c_nondeductible_expenses": "brute_force"}).document(text)
+
+    extractor.extract(fields=["line_18c_nondeductible_expenses"])
+
+    start, end = extractor.spans["line_18c_nondeductible_expenses"]
+    assert text[start:end] == "1,234"
+    assert extractor.strategy_runs["line_18c_nondeductible_expenses"].outcome == "match"
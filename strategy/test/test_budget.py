@@ -0,0 +1,150 @@
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import strategy.k1.budget as budget
+import strategy.k1.regex_extractor as rx
+from strategy.k1.metrics import ABORTED, MATCH
+from strategy.pool import WorkerPool
+
+
+CATASTROPHIC = re.compile(r"(a+)+$")
+
+
+def _backtracking_strategy(extractor):
+    CATASTROPHIC.search("a" * 40 + "b")
+    return "never"
+
+
+def _engine(**kwargs):
+    return rx.RegexExtractionEngine(
+        field_strategies={
+            "slow_field": {"backtracking": _backtracking_strategy},
+            "fast_field": {"constant": lambda _: "7"},
+        },
+        **kwargs,
+    )
+
+
+def test_time_limit_aborts_backtracking_regex():
+    with pytest.raises(budget.StrategyTimeout):
+        with budget.time_limit(0.05) as enforced:
+            assert enforced
+            CATASTROPHIC.search("a" * 40 + "b")
+
+
+def test_engine_aborts_and_records_slow_strategies(monkeypatch):
+    monkeypatch.setattr(rx, "SLOW_PATTERNS", budget.SlowPatternLog())
+    extractor = _engine(strategy_budget=0.05).document("text")
+
+    values = extractor.extract(fields=["slow_field", "fast_field"])
+
+    assert values == {"slow_field": "0", "fast_field": "7"}
+    assert extractor.used_strategies["slow_field"]["budget"] == "aborted"
+    assert "budget" not in extractor.used_strategies["fast_field"]
+    assert extractor.slowest_strategies(1)[0]["field"] == "slow_field"
+    slowest = rx.SLOW_PATTERNS.slowest(1)[0]
+    assert (slowest.field, slowest.aborted) == ("slow_field", 1)
+
+
+TOTAL = re.compile(r"Total: (\d+)")
+FIXTURES = Path(__file__).parent / "fixtures" / "MockParsePdfToMarkdown" / "mock_markdown_response_body"
+
+
+def _total_strategy(extractor):
+    return extractor._extract_with_regex(TOTAL, "fast_field")
+
+
+def _in_thread(fn):
+    outcome = {}
+    worker = threading.Thread(target=lambda: outcome.update(fn()))
+    worker.start()
+    worker.join(timeout=30)
+    assert not worker.is_alive()
+    return outcome
+
+
+def test_engine_aborts_backtracking_strategies_off_the_main_thread(monkeypatch):
+    pool = WorkerPool(max_workers=1)
+    monkeypatch.setattr(rx, "_isolation_executor", lambda: pool)
+    # Module-level strategies, so the engine can be rebuilt in a worker.
+    engine = rx.RegexExtractionEngine(
+        field_strategies={
+            "slow_field": {"backtracking": _backtracking_strategy},
+            "fast_field": {"total": _total_strategy},
+        },
+        strategy_budget=0.2,
+    )
+    text = "x" * rx.ISOLATED_DOCUMENT_MIN_CHARS + "Total: 7\n"
+
+    def extract():
+        extractor = engine.document(text)
+        began = time.perf_counter()
+        values = extractor.extract(fields=["slow_field", "fast_field"])
+        return {
+            "values": values,
+            "elapsed": time.perf_counter() - began,
+            "runs": extractor.strategy_runs,
+            "spans": extractor.spans,
+        }
+
+    with pool:
+        outcome = _in_thread(extract)
+
+    assert outcome["values"] == {"slow_field": "0", "fast_field": "7"}
+    assert outcome["runs"]["slow_field"].outcome == ABORTED
+    assert outcome["runs"]["fast_field"].outcome == MATCH
+    assert outcome["spans"]["fast_field"] == TOTAL.search(text).span(1)
+    assert outcome["elapsed"] < 5
+    assert pool.stats().submitted == 1
+
+
+def test_threaded_extraction_matches_serial_extraction(monkeypatch):
+    pool = WorkerPool(max_workers=2)
+    monkeypatch.setattr(rx, "_isolation_executor", lambda: pool)
+    engine = rx.RegexExtractionEngine(rx.load_field_strategy_config())
+    documents = [path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("*.md"))]
+
+    def extract(text):
+        extractor = engine.document(text)
+        values = extractor.extract()
+        outcomes = {name: run.outcome for name, run in extractor.strategy_runs.items()}
+        return values, outcomes, dict(extractor.spans)
+
+    serial = [extract(text) for text in documents]
+    with pool:
+        # Jobs hold both workers for longer than the strategy budget; time
+        # spent queued behind them must not count against it.
+        blockers = [pool.submit(time.sleep, 2 * engine.strategy_budget) for _ in range(2)]
+        with ThreadPoolExecutor(max_workers=8) as threads:
+            threaded = list(threads.map(extract, documents * 4))
+        for blocker in blockers:
+            blocker.result()
+
+    assert threaded == serial * 4
+    assert ABORTED not in {outcome for _, outcomes, _ in threaded for outcome in outcomes.values()}
+    assert pool.stats().submitted == 2 + len(threaded)
+
+
+def test_engine_skips_remaining_strategies_once_document_budget_is_spent():
+    extractor = _engine(document_budget=-1).document("text")
+
+    extractor.extract()
+
+    assert extractor.used_strategies["fast_field"]["budget"] == "skipped"
+
+
+def test_slow_pattern_report_lists_slowest_first(monkeypatch):
+    log = budget.SlowPatternLog()
+    log.record("a", "s1", "p1", 0.01)
+    log.record("b", "s2", "p2", 0.5, over_budget=True)
+    monkeypatch.setattr(budget, "SLOW_PATTERNS", log)
+
+    report = budget.slow_pattern_report()
+
+    assert report.splitlines()[1].endswith("b:s2  p2")
+    assert [row.field for row in log.slowest()] == ["b", "a"]
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+import strategy.k1.regex_extractor as rx
+from strategy.extraction import ExtractRegexK1
+from workflow.context import WorkflowContext
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "MockParsePdfToMarkdown" / "mock_markdown_response_body"
+ALTERNATE_CONFIG = {
+    "partnership_name": "cover_page_block",
+    "line_5_interest_income": "table_regex_scan",
+    "partnership_employer_identification_number": "loose_ein_header",
+}
+
+
+@pytest.mark.parametrize("doc", ["doc_1.md", "doc_2.md", "doc_3.md"])
+def test_matrix_reproduces_extraction_for_any_config(doc):
+    text = (FIXTURES / doc).read_text(encoding="utf-8")
+    extractor = rx.RegexExtractionEngine({}).document(text)
+
+    matrix = extractor.candidate_matrix()
+
+    assert extractor.contexts == {} and extractor.spans == {}
+    assert matrix.values() == extractor.extract(matrix.fields)
+    alternate = rx.RegexExtractionEngine(ALTERNATE_CONFIG).document(text)
+    assert matrix.values(ALTERNATE_CONFIG) == alternate.extract(matrix.fields)
+    assert all(len(matrix.strategies[name]) >= 1 for name in matrix.fields)
+    assert "brute_force" not in {name for names in matrix.strategies.values() for name in names}
+
+
+def test_matrix_records_spans_and_disagreements():
+    text = "header\nTotal income | 1,250 |\nOther | 9 |\n"
+    engine = rx.RegexExtractionEngine(
+        field_strategies={
+            "income": {
+                "regex": rx._numeric_regex_strategy(r"Total income \| ([\d,]+)", "income"),
+                "missing": rx._regex_strategy(r"Absent \| (\d+)", "income"),
+            },
+        }
+    )
+    extractor = engine.document(text, field_defaults={"income": "0"})
+
+    matrix = extractor.candidate_matrix()
+
+    hit = matrix.get("income", "regex")
+    assert (hit.value, hit.outcome) == ("1250", "match")
+    assert text[slice(*hit.span)] == "1,250"
+    assert matrix.get("income", "missing").span is None
+    assert matrix.disagreements() == {"income": {"regex": "1250", "missing": "0"}}
+    assert matrix.as_dict()["fields"]["income"]["regex"]["span"] == list(hit.span)
+
+    with pytest.raises(ValueError):
+        extractor.candidate_matrix(["nope"])
+
+
+def test_extract_regex_k1_publishes_candidate_matrix():
+    context = WorkflowContext(
+        pdf_path=Path("doc_1.pdf"),
+        parsed_markdown=(FIXTURES / "doc_1.md").read_text(encoding="utf-8"),
+    )
+
+    result = ExtractRegexK1(candidate_matrix=True).execute(context)
+
+    matrix = result.artifacts["candidate_matrix"]
+    assert set(matrix["selected"]) == set(matrix["fields"])
+    for field_name, strategy in matrix["selected"].items():
+        assert matrix["fields"][field_name][strategy]["value"] == result.output[field_name]
+    assert "candidate_matrix" not in ExtractRegexK1().execute(context).artifacts
@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from strategy.config_cache import ConfigCache
+
+
+def _parse(text: str):
+    data = yaml.safe_load(text)
+    if not isinstance(data, dict):
+        raise ValueError("expected a mapping")
+    return data
+
+
+def _write(path: Path, text: str, mtime_ns: int | None = None) -> None:
+    path.write_text(text, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_parses_once_until_the_file_changes(tmp_path: Path):
+    cache = ConfigCache(racy_window=0)
+    path = tmp_path / "config.yaml"
+    _write(path, "a: 1\n", mtime_ns=1_000_000_000)
+    calls = []
+
+    def parser(text):
+        calls.append(text)
+        return _parse(text)
+
+    first = cache.load(path, parser)
+    assert cache.load(path, parser) is first
+    assert len(calls) == 1
+    generation = cache.generation
+
+    _write(path, "a: 2\n", mtime_ns=2_000_000_000)
+    assert cache.load(path, parser) == {"a": 2}
+    assert cache.generation == generation + 1
+
+
+def test_same_tick_edit_is_caught_by_content_hash(tmp_path: Path):
+    cache = ConfigCache()
+    path = tmp_path / "config.yaml"
+    _write(path, "a: 1\n")
+    mtime_ns = path.stat().st_mtime_ns
+    assert cache.load(path, _parse) == {"a": 1}
+
+    # Same size and mtime: only the hash can tell the files apart.
+    _write(path, "a: 2\n", mtime_ns=mtime_ns)
+    assert cache.load(path, _parse) == {"a": 2}
+
+
+def test_touch_without_edit_keeps_value_and_generation(tmp_path: Path):
+    cache = ConfigCache(racy_window=0)
+    path = tmp_path / "config.yaml"
+    _write(path, "a: 1\n", mtime_ns=1_000_000_000)
+    first = cache.load(path, _parse)
+    generation = cache.generation
+
+    os.utime(path, ns=(5_000_000_000, 5_000_000_000))
+    assert cache.load(path, _parse) is first
+    assert cache.generation == generation
+
+
+def test_invalid_edit_keeps_last_good_value(tmp_path: Path):
+    cache = ConfigCache(racy_window=0)
+    path = tmp_path / "config.yaml"
+    _write(path, "- not a mapping\n", mtime_ns=1_000_000_000)
+    with pytest.raises(ValueError):
+        cache.load(path, _parse)
+
+    _write(path, "a: 1\n", mtime_ns=2_000_000_000)
+    good = cache.load(path, _parse)
+    _write(path, "- broken\n", mtime_ns=3_000_000_000)
+    with pytest.warns(RuntimeWarning, match="Ignoring invalid config change"):
+        assert cache.load(path, _parse) is good
+    assert cache.load(path, _parse) is good
+
+    _write(path, "a: 3\n", mtime_ns=4_000_000_000)
+    assert cache.load(path, _parse) == {"a": 3}
+
+
+def test_missing_file_raises(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        ConfigCache().load(tmp_path / "missing.yaml", _parse)
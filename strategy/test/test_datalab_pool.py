@@ -0,0 +1,217 @@
+import asyncio
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+from datalab_sdk import AsyncDatalabClient
+
+from strategy.datalab_pool import (
+    DatalabClientPool,
+    DatalabLoop,
+    get_datalab_loop,
+    get_datalab_pool,
+    key_fingerprint,
+)
+from strategy.parse import ParsePdfToDatalabMarkdown
+from workflow.context import WorkflowContext
+
+
+class FakeClient:
+    created = 0
+
+    def __init__(self, api_key):
+        FakeClient.created += 1
+        self.api_key = api_key
+        self.closed = False
+
+    def convert(self, *_args, **_kwargs):
+        return SimpleNamespace(markdown=f"# parsed with {self.api_key}")
+
+    def close(self):
+        self.closed = True
+
+
+class FakeAsyncClient(FakeClient):
+    async def convert(self, *_args, **_kwargs):
+        return SimpleNamespace(markdown=f"# parsed with {self.api_key}")
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_client():
+    FakeClient.created = 0
+
+
+class StandInDatalab:
+    """Local Datalab stand-in that records the client port behind every request."""
+
+    def __init__(self):
+        self.peers = []
+        self.loop = asyncio.new_event_loop()
+        self.runner = None
+
+    async def _convert(self, request):
+        self.peers.append(request.transport.get_extra_info("peername")[1])
+        await request.post()
+        return web.json_response({"success": True, "request_check_url": "/api/v1/check"})
+
+    async def _check(self, request):
+        self.peers.append(request.transport.get_extra_info("peername")[1])
+        return web.json_response({"status": "complete", "success": True, "markdown": "# page"})
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_post("/api/v1/convert", self._convert)
+        app.router.add_get("/api/v1/check", self._check)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+    def __enter__(self):
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        port = asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    def __exit__(self, *_exc):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def test_sequential_leases_reuse_one_client():
+    pool = DatalabClientPool(FakeClient, max_in_flight=2)
+
+    clients = []
+    for _ in range(3):
+        with pool.lease("key") as client:
+            clients.append(client)
+
+    assert clients[0] is clients[1] is clients[2]
+    stats = pool.stats()[key_fingerprint("key")]
+    assert FakeClient.created == 1
+    assert (stats.leases, stats.clients, stats.in_flight) == (3, 1, 0)
+
+
+def test_waiters_over_the_cap_are_served_in_arrival_order():
+    pool = DatalabClientPool(FakeClient, max_in_flight=1)
+    order = []
+
+    def stats():
+        return pool.stats()[key_fingerprint("key")]
+
+    def worker(name):
+        with pool.lease("key"):
+            order.append(name)
+
+    with pool.lease("key"):
+        assert stats().utilization == 1.0
+        threads = []
+        for position, name in enumerate("abc", start=1):
+            thread = threading.Thread(target=worker, args=(name,))
+            thread.start()
+            threads.append(thread)
+            _wait_for(lambda: stats().queued == position)
+    for thread in threads:
+        thread.join()
+
+    assert order == ["a", "b", "c"]
+    assert stats().max_queued == 3
+    assert stats().wait_seconds > 0
+    assert FakeClient.created == 1
+
+
+def test_keys_have_independent_caps():
+    pool = DatalabClientPool(FakeClient, max_in_flight=1)
+
+    with pool.lease("first"), pool.lease("second") as client:
+        assert client.api_key == "second"
+
+    assert set(pool.stats()) == {key_fingerprint("first"), key_fingerprint("second")}
+
+
+def test_failed_lease_discards_client():
+    pool = DatalabClientPool(FakeClient, max_in_flight=1)
+
+    with pytest.raises(RuntimeError):
+        with pool.lease("key") as client:
+            raise RuntimeError("connection reset")
+
+    stats = pool.stats()[key_fingerprint("key")]
+    assert client.closed
+    assert (stats.failures, stats.clients, stats.in_flight) == (1, 0, 0)
+    with pool.lease("key") as replacement:
+        assert replacement is not client
+    assert 'taxman_datalab_pool_failures_total{key="' in pool.render_prometheus()
+
+
+def test_sync_converts_reuse_one_session_and_connection(tmp_path):
+    pdf = tmp_path / "file.pdf"
+    pdf.write_bytes(b"%PDF pooled")
+
+    with StandInDatalab() as server:
+        loop = DatalabLoop(lambda key: AsyncDatalabClient(api_key=key, base_url=server.url))
+        pool = DatalabClientPool(loop.client, max_in_flight=2)
+        sessions = []
+
+        def convert():
+            with pool.lease("key") as client:
+                assert client.convert(str(pdf)).markdown == "# page"
+            session = loop._clients["key"]._session
+            sessions.append((session, session.connector))
+
+        for _ in range(3):
+            convert()
+        sequential_peers = list(server.peers)
+        threads = [threading.Thread(target=convert) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        session, connector = sessions[0]
+        loop.close()
+
+    assert len(sessions) == 7 and set(sessions) == {(session, connector)}
+    # Three converts (a submit and a poll each) over one kept-alive connection.
+    assert len(sequential_peers) == 6 and len(set(sequential_peers)) == 1
+    # Concurrent converts open at most one extra connection per extra caller.
+    assert len(set(server.peers)) <= 2
+    assert session.closed and loop._clients == {}
+
+
+def test_strategy_borrows_from_the_shared_pool(tmp_path, monkeypatch):
+    monkeypatch.setitem(
+        sys.modules,
+        "datalab_sdk",
+        SimpleNamespace(DatalabClient=FakeClient, AsyncDatalabClient=FakeAsyncClient),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "datalab_sdk.models",
+        SimpleNamespace(ConvertOptions=lambda **options: SimpleNamespace(**options)),
+    )
+    pdf = tmp_path / "file.pdf"
+    pdf.write_bytes(b"%PDF pooled")
+
+    for _ in range(2):
+        result = ParsePdfToDatalabMarkdown(api_key="key", use_cache=False).execute(
+            WorkflowContext(pdf_path=pdf)
+        )
+
+    assert result.output == "# parsed with key"
+    assert FakeClient.created == 1
+    assert list(get_datalab_loop()._clients) == ["key"]
+    assert get_datalab_pool().stats()[key_fingerprint("key")].leases == 2
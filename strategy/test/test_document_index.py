@@ -0,0 +1,83 @@
+import pytest
+
+from strategy.k1.document_index import DocumentIndex
+import strategy.k1.regex_extractor as rx
+
+
+SAMPLE = """Intro line
+| 1 | Ordinary business income | 1,000 |
+| 4A | Guaranteed payments | 25 |
+| 1 | Duplicate row | 99 |
+**LINE 11ZZ: OTHER**
+| SWAP INCOME/(LOSS) | (48,613) |
+| TOTAL TO SCHEDULE K-1, BOX 13, CODE ZZ | | 22,693. |
+Ending Capital Account | $ 777 |
+"""
+
+
+def test_line_offsets_match_splitlines():
+    index = DocumentIndex(SAMPLE)
+
+    assert list(index.lines) == SAMPLE.splitlines()
+    start, end = index.line_offsets(2)
+    assert SAMPLE[start:end] == "| 4A | Guaranteed payments | 25 |"
+    assert index.line_number_at(start + 3) == 2
+
+
+def test_lines_containing_is_case_insensitive_and_deduplicated():
+    index = DocumentIndex(SAMPLE + "ending capital account ending capital account\n")
+
+    hits = [line_no for line_no, _ in index.lines_containing("ENDING CAPITAL ACCOUNT")]
+
+    assert hits == [7, 8]
+    assert index.cells(7) == ["$ 777"]
+
+
+def test_main_table_rows_and_section_anchors():
+    index = DocumentIndex(SAMPLE)
+
+    codes = [row.code for row in index.main_table_rows]
+    assert codes == ["1", "4A", "1"]
+    assert index.main_table_rows[1].context == "| 4A | Guaranteed payments | 25 |"
+
+    anchors = [(anchor.label, anchor.kind) for anchor in index.section_anchors]
+    assert anchors == [("LINE 11ZZ", "line"), ("TOTAL TO SCHEDULE K-1", "total")]
+
+
+def test_extractor_reuses_supplied_index():
+    index = DocumentIndex(SAMPLE)
+    extractor = rx.ParsedK1RegexExtractor(SAMPLE, index=index)
+
+    assert extractor.index is index
+    assert extractor.table_values["1"] == "1000"
+    assert rx._partnership_capital_row_strategy("ending_capital_account")(extractor) == "777"
+
+
+def test_section_spans_close_at_next_header_or_total_row():
+    text = (
+        "**LINE 11ZZ: OTHER**\n"
+        "| OTHER INCOME/(LOSS) | 373 |\n"
+        "**LINE 13H: INVESTMENT INTEREST**\n"
+        "| SWAP INCOME/(LOSS) | (48,613) |\n"
+        "SCHEDULE K-1 OTHER DEDUCTIONS, BOX 13, CODE ZZ\n"
+        "| TOTAL TO SCHEDULE K-1, BOX 13, CODE ZZ | | 22,693. |\n"
+        "trailing notes\n"
+    )
+    index = DocumentIndex(text)
+
+    line_11zz = index.section_map["LINE 11ZZ"][0]
+    assert text[line_11zz.start : line_11zz.end].count("\n") == 2
+    box = index.section_map["BOX 13, CODE ZZ"][0]
+    assert text[box.start : box.end].endswith("22,693. |")
+
+    extractor = rx.ParsedK1RegexExtractor(text, index=index)
+    swap = rx._section_row_numeric_strategy(
+        r"LINE\s+11ZZ", r"SWAP\s+INCOME/\(LOSS\)", "line_11ZZ_swap_net_income_loss"
+    )
+    other = rx._section_row_numeric_strategy(
+        r"LINE\s+11ZZ", r"OTHER\s+INCOME/\(LOSS\)", "line_11ZZ_other_income_loss"
+    )
+    assert other(extractor) == "373"
+    # The swap row belongs to LINE 13H, so the LINE 11ZZ window must not reach it.
+    with pytest.raises(ValueError):
+        swap(extractor)
@@ -24,3 +24,18 @@ def test_infer_extraction_completeness_uses_required_fields(tmp_path):
 
     result = strategy.execute(context)
     assert result.output["missing_required_fields"] == ["a"]
+
+
+def test_infer_extraction_completeness_extracts_required_fields_on_demand(tmp_path):
+    markdown = "| Partnership's name, address, city, state, and ZIP code<br>Acme Fund LP |\n"
+    context = WorkflowContext(pdf_path=tmp_path / "x.pdf", parsed_markdown=markdown)
+    strategy = InferExtractionCompleteness(
+        required_fields=["partnership_name", "partnership_employer_identification_number"]
+    )
+
+    result = strategy.execute(context)
+
+    assert result.artifacts["extracted_fields"]["partnership_name"] == "Acme Fund LP"
+    assert result.output["missing_required_fields"] == [
+        "partnership_employer_identification_number"
+    ]
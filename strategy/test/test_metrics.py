@@ -0,0 +1,89 @@
+import strategy.k1.metrics as metrics
+import strategy.k1.regex_extractor as rx
+
+
+def _failing(extractor):
+    extractor._regex_search(rx.NUMERIC_TOKEN, "no digits here")
+    raise ValueError("not found")
+
+
+def _numeric(extractor):
+    match = extractor._regex_search(rx.NUMERIC_TOKEN, "Total | 1,234 |")
+    extractor._note_span("fallback_field", match.span(1))
+    return match.group(1)
+
+
+def _engine():
+    return rx.RegexExtractionEngine(
+        field_strategies={
+            "fallback_field": {"chain": rx._fallback_strategy(_failing, _failing, _numeric)},
+            "missing_field": {"failing": _failing},
+            "anchored_field": {"anchored": rx._with_anchors(_numeric, ["Box 20"])},
+        }
+    )
+
+
+def test_extractor_records_outcome_depth_and_regex_calls(monkeypatch):
+    monkeypatch.setattr(rx, "EXTRACTION_METRICS", metrics.ExtractionMetrics())
+    extractor = _engine().document("document body")
+
+    values = extractor.extract(fields=["fallback_field", "missing_field", "anchored_field"])
+
+    assert values["fallback_field"] == "1,234"
+    runs = extractor.strategy_metrics()
+    assert runs["fallback_field"]["outcome"] == metrics.MATCH
+    assert runs["fallback_field"]["fallback_depth"] == 2
+    assert runs["fallback_field"]["regex_calls"] == 3
+    assert runs["missing_field"]["outcome"] == metrics.NO_MATCH
+    assert runs["anchored_field"]["outcome"] == metrics.PREFILTER_MISS
+    assert runs["anchored_field"]["regex_calls"] == 0
+
+
+def test_only_located_values_count_as_hits(monkeypatch):
+    monkeypatch.setattr(rx, "EXTRACTION_METRICS", metrics.ExtractionMetrics())
+    engine = rx.RegexExtractionEngine(
+        field_strategies={
+            "missing_code": {"table": rx._table_strategy("99Z", "missing_code")},
+            "present_code": {"table": rx._table_strategy("1", "present_code")},
+            "zero_code": {"table": rx._table_strategy("2", "zero_code")},
+        }
+    )
+    extractor = engine.document(
+        "| 1 | Ordinary business income (loss) | 1,234 |\n"
+        "| 2 | Net rental real estate income (loss) | 0 |\n"
+    )
+
+    values = extractor.extract()
+
+    runs = extractor.strategy_metrics()
+    assert values["missing_code"] == "0"
+    assert runs["missing_code"]["outcome"] == metrics.NO_MATCH
+    assert values["present_code"] == "1234"
+    assert runs["present_code"]["outcome"] == metrics.MATCH
+    # A located zero is a hit even though it equals the default.
+    assert values["zero_code"] == "0"
+    assert runs["zero_code"]["outcome"] == metrics.MATCH
+
+
+def test_process_metrics_aggregate_and_render_prometheus(monkeypatch):
+    aggregate = metrics.ExtractionMetrics()
+    monkeypatch.setattr(rx, "EXTRACTION_METRICS", aggregate)
+    engine = _engine()
+    for _ in range(3):
+        engine.document("document body").extract(fields=["fallback_field", "missing_field"])
+
+    snapshot = aggregate.snapshot()
+    assert snapshot["documents"] == 3
+    by_field = {entry["field"]: entry for entry in snapshot["strategies"]}
+    assert by_field["fallback_field"]["runs"] == 3
+    assert by_field["fallback_field"]["fallback_steps"] == 6
+    assert by_field["fallback_field"]["hit_rate"] == 1.0
+    assert by_field["missing_field"]["outcomes"] == {metrics.NO_MATCH: 3}
+
+    text = aggregate.render_prometheus()
+    assert "taxman_extraction_documents_total 3" in text
+    assert (
+        'taxman_extraction_strategy_runs_total{field="missing_field",'
+        'strategy="failing",outcome="no_match"} 3'
+    ) in text
+    assert 'taxman_extraction_regex_calls_total{field="fallback_field",strategy="chain"} 9' in text
@@ -0,0 +1,45 @@
+from strategy.k1.document_index import DocumentIndex
+from strategy.k1.numeric_index import NumericTokenIndex, parse_numeric_token
+
+
+TEXT = (
+    "SCHEDULE K-1 (Form 1065) LINE 13H\n"
+    "| 4A | Guaranteed payments | (1,234) |\n"
+    "| 5 | Interest | $5,000.50 |\n"
+    "EIN 12-3456789 rate 12% loss -7\n"
+)
+
+
+def test_tokens_skip_codes_and_keep_spans():
+    index = NumericTokenIndex(TEXT)
+
+    assert [token.text for token in index] == [
+        "1065", "(1,234)", "5", "$5,000.50", "12", "12%", "-7",
+    ]
+    for token in index:
+        assert TEXT[token.start:token.end] == token.text
+    assert [token.value for token in index] == [1065, -1234, 5, 5000.5, 12, 12, -7]
+
+
+def test_lookup_by_position_and_value():
+    index = NumericTokenIndex(TEXT)
+    amount = TEXT.index("$5,000.50")
+
+    assert index.at(amount + 3).text == "$5,000.50"
+    assert index.at(TEXT.index("Interest")) is None
+    line = TEXT.index("| 5 |")
+    assert [token.text for token in index.within(line, TEXT.index("EIN"))] == ["5", "$5,000.50"]
+    assert [token.text for token in index.find(12)] == ["12", "12%"]
+    assert [token.text for token in index.find(5000, tolerance=1)] == ["$5,000.50"]
+    assert [token.value for token in index.in_range(-2000, 0)] == [-1234, -7]
+    assert index.find(42) == []
+
+
+def test_document_index_shares_the_numeric_index():
+    document = DocumentIndex(TEXT)
+    assert document.numeric_tokens is document.numeric_tokens
+    assert document.numeric_tokens.as_dict()["n1"] == {
+        "text": "(1,234)", "value": -1234.0, "span": [TEXT.index("(1,234)"), TEXT.index("(1,234)") + 7],
+    }
+    assert parse_numeric_token("(5%)") == -5
+    assert len(NumericTokenIndex("no numbers here")) == 0
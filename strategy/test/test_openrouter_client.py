@@ -0,0 +1,204 @@
+import asyncio
+import json
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import time
+
+import pytest
+from aiohttp import web
+
+from strategy.base import StrategyError
+from strategy.llm import OpenRouterExtractK1
+from strategy.openrouter_client import (
+    AsyncOpenRouterClient,
+    OpenRouterClient,
+    RetryPolicy,
+    parse_retry_after,
+)
+from workflow.context import WorkflowContext
+
+
+FAST_RETRY = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.05)
+COMPLETION = {"choices": [{"message": {"content": json.dumps({"partnership_name": "ACME LP"})}}]}
+
+
+class ScriptedServer:
+    """Local HTTP server answering each POST with the next scripted (status, headers)."""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.requests = []
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                outer.requests.append((self.headers["Authorization"], json.loads(body)))
+                status, headers = outer.script.pop(0) if outer.script else (200, {})
+                data = json.dumps(COMPLETION if status < 400 else {"error": "busy"}).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *_args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/chat/completions"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *_exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def test_retry_after_accepts_seconds_and_http_dates():
+    assert parse_retry_after("3") == 3.0
+    assert 8 < parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert policy.backoff(0, "2") == 2.0
+    assert policy.backoff(0, "120") == 5.0
+    assert all(0.0 <= policy.backoff(attempt) <= min(5.0, 2**attempt) for attempt in range(6))
+
+
+def test_sync_client_retries_429_and_5xx_then_succeeds():
+    client = OpenRouterClient(retry=FAST_RETRY)
+    with ScriptedServer([(429, {"Retry-After": "0"}), (503, {})]) as server:
+        response = client.post("key", server.url, {"model": "m"})
+
+    assert response == COMPLETION
+    assert server.requests == [("Bearer key", {"model": "m"})] * 3
+    stats = client.stats()
+    assert (stats.calls, stats.attempts, stats.retries, stats.failures) == (1, 3, 2, 0)
+    assert stats.responses == {"429": 1, "503": 1, "200": 1}
+    assert 'taxman_openrouter_responses_total{status="429"} 1' in client.render_prometheus()
+    client.close()
+
+
+def test_sync_client_gives_up_on_client_errors_and_exhausted_retries():
+    client = OpenRouterClient(retry=FAST_RETRY)
+    with ScriptedServer([(400, {}), (500, {}), (500, {}), (500, {})]) as server:
+        with pytest.raises(StrategyError, match="HTTP 400"):
+            client.post("key", server.url, {})
+        with pytest.raises(StrategyError, match="HTTP 500"):
+            client.post("key", server.url, {})
+
+    assert len(server.requests) == 4
+    stats = client.stats()
+    assert (stats.calls, stats.failures, stats.retries, stats.in_flight) == (2, 2, 2, 0)
+
+
+def test_async_client_caps_concurrency_and_retries():
+    running = 0
+    peak = 0
+    attempts = 0
+
+    async def completions(request):
+        nonlocal running, peak, attempts
+        attempts += 1
+        if attempts == 1:
+            return web.json_response({"error": "busy"}, status=429, headers={"Retry-After": "0"})
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return web.json_response(COMPLETION)
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_post("/chat/completions", completions)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        client = AsyncOpenRouterClient(max_in_flight=3, retry=FAST_RETRY)
+        try:
+            url = f"http://127.0.0.1:{port}/chat/completions"
+            return client, await asyncio.gather(*(client.post("key", url, {}) for _ in range(10)))
+        finally:
+            await client.aclose()
+            await runner.cleanup()
+
+    client, responses = asyncio.run(scenario())
+
+    assert responses == [COMPLETION] * 10
+    assert peak == 3
+    stats = client.stats()
+    assert (stats.calls, stats.attempts, stats.retries) == (10, 11, 1)
+    assert stats.responses == {"429": 1, "200": 10}
+
+
+def test_execute_async_awaits_an_async_request_func_stub():
+    seen = []
+
+    async def stub(api_key, base_url, payload):
+        seen.append((api_key, base_url, payload["model"]))
+        return COMPLETION
+
+    extractor = OpenRouterExtractK1(api_key="k", base_url="http://stub", request_func=stub)
+    context = WorkflowContext(pdf_path="doc.pdf", parsed_markdown="| 1 | ACME LP |")
+
+    result = asyncio.run(extractor.execute_async(context))
+
+    assert seen == [("k", "http://stub", "openai/gpt-4o-mini")]
+    assert result.output["partnership_name"] == "ACME LP"
+    assert result.artifacts["openrouter_seconds"] >= 0
+    assert extractor.execute(context).output == result.output
+
+
+def test_execute_uses_the_injected_pooled_client():
+    client = OpenRouterClient(retry=FAST_RETRY)
+    context = WorkflowContext(pdf_path="doc.pdf", parsed_markdown="| 1 | ACME LP |")
+    with ScriptedServer([(502, {})]) as server:
+        extractor = OpenRouterExtractK1(api_key="k", base_url=server.url, client=client)
+        result = extractor.execute(context)
+
+    assert result.output["partnership_name"] == "ACME LP"
+    assert client.stats().retries == 1
+    client.close()
+
+
+def test_async_client_closes_its_session_when_the_loop_shuts_down():
+    client = AsyncOpenRouterClient(retry=FAST_RETRY)
+
+    async def call(url):
+        await client.post("key", url, {})
+        return (await client._slot()).session
+
+    with ScriptedServer([]) as server:
+        first = asyncio.run(call(server.url))
+        second = asyncio.run(call(server.url))
+
+    assert first is not second
+    assert first.closed and second.closed
+
+
+def test_backoff_waits_release_the_concurrency_slot():
+    client = AsyncOpenRouterClient(max_in_flight=1, retry=RetryPolicy(max_attempts=2, max_delay=1.0))
+    finished = []
+
+    async def call(url, name):
+        await client.post("key", url, {})
+        finished.append(name)
+
+    async def scenario(url):
+        first = asyncio.create_task(call(url, "throttled"))
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(call(url, "other"), timeout=0.4)
+        await first
+
+    with ScriptedServer([(429, {"Retry-After": "0.5"})]) as server:
+        asyncio.run(scenario(server.url))
+
+    assert finished == ["other", "throttled"]
@@ -0,0 +1,160 @@
+import asyncio
+import time
+
+from aiohttp import web
+from datalab_sdk import AsyncDatalabClient
+
+from strategy.base import StrategyError
+from strategy.datalab_pool import AsyncDatalabClientPool, key_fingerprint
+from strategy.parse import MockParsePdfToDatalabMarkdown, ParsePdfToDatalabMarkdown
+from workflow.context import WorkflowContext
+from workflow.core import Activity, Workflow
+
+
+class SlowAsyncClient:
+    """Stands in for `AsyncDatalabClient`: every convert waits on the "server"."""
+
+    created = 0
+
+    def __init__(self, api_key, delay=0.05):
+        SlowAsyncClient.created += 1
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self.closed = False
+
+    async def convert(self, file_path, **_kwargs):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        if file_path.endswith("broken.pdf"):
+            raise RuntimeError("HTTP 500")
+        return type("Result", (), {"markdown": f"# {file_path.rsplit('/', 1)[-1]}"})()
+
+    async def close(self):
+        self.closed = True
+
+
+def _pdfs(tmp_path, count):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"doc_{index}.pdf"
+        path.write_bytes(b"%PDF " + str(index).encode())
+        paths.append(path)
+    return paths
+
+
+def test_async_parses_share_one_client_under_the_cap(tmp_path):
+    SlowAsyncClient.created = 0
+    pool = AsyncDatalabClientPool(SlowAsyncClient, max_in_flight=5)
+    strategy = ParsePdfToDatalabMarkdown(api_key="key", async_client_pool=pool, use_cache=False)
+
+    async def main():
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(strategy.execute_async(WorkflowContext(pdf_path=pdf)) for pdf in _pdfs(tmp_path, 20))
+        )
+        elapsed = time.perf_counter() - started
+        (client,) = [slot.client for slot in pool._loops[asyncio.get_running_loop()].values()]
+        await pool.aclose()
+        return results, elapsed, client
+
+    results, elapsed, client = asyncio.run(main())
+
+    assert [result.output for result in results] == [f"# doc_{index}.pdf" for index in range(20)]
+    assert SlowAsyncClient.created == 1
+    assert client.max_running == 5 and client.closed
+    # Four waves of five, not twenty sequential converts.
+    assert elapsed < 20 * client.delay / 2
+    stats = pool.stats()[key_fingerprint("key")]
+    assert (stats.leases, stats.in_flight, stats.queued, stats.clients) == (20, 0, 0, 0)
+    assert stats.max_queued == 15
+
+
+def test_async_convert_failure_raises_strategy_error(tmp_path):
+    pool = AsyncDatalabClientPool(SlowAsyncClient, max_in_flight=2)
+    pdf = tmp_path / "broken.pdf"
+    pdf.write_bytes(b"%PDF broken")
+    strategy = ParsePdfToDatalabMarkdown(api_key="key", async_client_pool=pool, use_cache=False)
+
+    async def main():
+        try:
+            return await Activity(name="parse", strategy=strategy).run_async(
+                WorkflowContext(pdf_path=pdf)
+            )
+        finally:
+            await pool.aclose()
+
+    result = asyncio.run(main())
+
+    assert result.output is None
+    assert result.errors == ["Datalab convert failed: HTTP 500"]
+    assert pool.stats()[key_fingerprint("key")].failures == 1
+    assert 'taxman_datalab_async_pool_failures_total{key="' in pool.render_prometheus()
+
+
+def test_execute_async_polls_a_datalab_server_and_caches(tmp_path):
+    """Drive the real async SDK client against a local stand-in for the Datalab API."""
+    polls = {"count": 0}
+
+    async def submit(request):
+        await request.post()
+        return web.json_response({"success": True, "request_check_url": "/api/v1/check/1"})
+
+    async def check(_request):
+        polls["count"] += 1
+        if polls["count"] < 3:
+            return web.json_response({"status": "processing", "success": True})
+        return web.json_response({"status": "complete", "success": True, "markdown": "# K-1"})
+
+    app = web.Application()
+    app.add_routes([web.post("/api/v1/convert", submit), web.get("/api/v1/check/1", check)])
+    pdf = tmp_path / "upload.pdf"
+    pdf.write_bytes(b"%PDF k1")
+
+    async def main():
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        strategy = ParsePdfToDatalabMarkdown(
+            api_key="key",
+            async_client_factory=lambda key: AsyncDatalabClient(
+                api_key=key, base_url=f"http://127.0.0.1:{port}"
+            ),
+            poll_interval=0.01,
+        )
+        try:
+            first = await strategy.execute_async(WorkflowContext(pdf_path=pdf))
+            second = await strategy.execute_async(WorkflowContext(pdf_path=pdf))
+        finally:
+            await strategy.async_client_pool.aclose()
+            await runner.cleanup()
+        return first, second
+
+    first, second = asyncio.run(main())
+
+    assert first.output == second.output == "# K-1"
+    assert (first.artifacts["parse_cache"], second.artifacts["parse_cache"]) == ("miss", "hit")
+    assert polls["count"] == 3
+
+
+def test_workflow_run_async_matches_run(tmp_path):
+    fixture = MockParsePdfToDatalabMarkdown().fixture_root / "input_pdf_docs" / "doc_1.pdf"
+    workflow = Workflow(
+        name="parse-only",
+        activities=[Activity(name="parse", strategy=MockParsePdfToDatalabMarkdown())],
+    )
+
+    sync_result = workflow.run(WorkflowContext(pdf_path=fixture))
+    async_result = asyncio.run(workflow.run_async(WorkflowContext(pdf_path=fixture)))
+
+    assert async_result.succeeded and sync_result.succeeded
+    assert async_result.context.parsed_markdown == sync_result.context.parsed_markdown
+    assert [r.output for r in async_result.activity_results] == [
+        r.output for r in sync_result.activity_results
+    ]
@@ -0,0 +1,121 @@
+import random
+import string
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from strategy.parse import ParsePdfToDatalabMarkdown
+from strategy.parse_cache import ParseCache, get_parse_cache, parse_cache_key
+from workflow.context import WorkflowContext
+
+
+class CountingClient:
+    def __init__(self, markdown="# parsed"):
+        self.markdown = markdown
+        self.calls = 0
+
+    def convert(self, *_args, **_kwargs):
+        self.calls += 1
+        return SimpleNamespace(markdown=self.markdown)
+
+
+@pytest.fixture
+def fake_convert_options(monkeypatch):
+    monkeypatch.setitem(
+        sys.modules,
+        "datalab_sdk.models",
+        SimpleNamespace(ConvertOptions=lambda **options: SimpleNamespace(**options)),
+    )
+
+
+def _pdf(tmp_path: Path, name: str, content: bytes) -> Path:
+    path = tmp_path / name
+    path.write_bytes(content)
+    return path
+
+
+def test_key_depends_on_content_and_options_not_name(tmp_path):
+    first = _pdf(tmp_path, "a.pdf", b"%PDF same")
+    renamed = _pdf(tmp_path, "b.pdf", b"%PDF same")
+    other = _pdf(tmp_path, "c.pdf", b"%PDF other")
+    options = {"output_format": "markdown"}
+
+    assert parse_cache_key(first, options) == parse_cache_key(renamed, options)
+    assert parse_cache_key(first, options) != parse_cache_key(other, options)
+    assert parse_cache_key(first, options) != parse_cache_key(first, {"output_format": "json"})
+
+
+def test_cache_hit_skips_remote_call(tmp_path, fake_convert_options):
+    client = CountingClient()
+    strategy = ParsePdfToDatalabMarkdown(api_key="key", client_factory=lambda *_: client)
+    pdf = _pdf(tmp_path, "upload.pdf", b"%PDF k1")
+
+    first = strategy.execute(WorkflowContext(pdf_path=pdf))
+    reupload = _pdf(tmp_path, "reupload.pdf", b"%PDF k1")
+    second = strategy.execute(WorkflowContext(pdf_path=reupload))
+
+    assert client.calls == 1
+    assert first.artifacts["parse_cache"] == "miss"
+    assert second.artifacts["parse_cache"] == "hit"
+    assert second.output == first.output == "# parsed"
+    assert second.context_updates == {"parsed_markdown": "# parsed"}
+    stats = get_parse_cache().stats()
+    assert (stats.hits, stats.misses, stats.writes) == (1, 1, 1)
+
+
+def test_cache_hit_does_not_need_api_key(tmp_path, fake_convert_options, monkeypatch):
+    monkeypatch.delenv("DATALAB_API_KEY", raising=False)
+    pdf = _pdf(tmp_path, "upload.pdf", b"%PDF k1")
+    ParsePdfToDatalabMarkdown(api_key="key", client_factory=lambda *_: CountingClient()).execute(
+        WorkflowContext(pdf_path=pdf)
+    )
+
+    result = ParsePdfToDatalabMarkdown().execute(WorkflowContext(pdf_path=pdf))
+
+    assert result.output == "# parsed"
+
+
+def test_cache_can_be_disabled(tmp_path, fake_convert_options):
+    client = CountingClient()
+    strategy = ParsePdfToDatalabMarkdown(
+        api_key="key", client_factory=lambda *_: client, use_cache=False
+    )
+    pdf = _pdf(tmp_path, "upload.pdf", b"%PDF k1")
+
+    strategy.execute(WorkflowContext(pdf_path=pdf))
+    result = strategy.execute(WorkflowContext(pdf_path=pdf))
+
+    assert client.calls == 2
+    assert "parse_cache" not in result.artifacts
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path):
+    # Random text so zlib cannot shrink entries far below 4k; two fit, three do not.
+    rng = random.Random(0)
+    blobs = {key: "".join(rng.choices(string.ascii_letters, k=4_000)) for key in "abc"}
+    cache = ParseCache(tmp_path / "cache.sqlite3", max_bytes=8_000)
+    cache.put("a", blobs["a"])
+    cache.put("b", blobs["b"])
+    assert cache.get("a") == blobs["a"]
+
+    cache.put("c", blobs["c"])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == blobs["a"]
+    assert cache.get("c") == blobs["c"]
+    assert cache.stats().evictions >= 1
+    assert cache.usage()["bytes"] <= 8_000
+
+
+def test_unwritable_cache_degrades_to_miss(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    cache = ParseCache(blocker / "cache.sqlite3")
+
+    cache.put("key", "# markdown")
+
+    assert cache.get("key") is None
+    assert cache.stats().errors == 1
+    assert "taxman_parse_cache_misses_total 1" in cache.render_prometheus()
@@ -39,12 +39,18 @@ def test_parse_pdf_success_with_stub_client(tmp_path: Path, monkeypatch):
         def convert(self, *_args, **_kwargs):
             return SimpleNamespace(markdown="# heading")
 
+    class StubAsyncClient(StubClient):
+        async def convert(self, *_args, **_kwargs):
+            return SimpleNamespace(markdown="# heading")
+
     class StubConvertOptions:
-        def __init__(self, output_format):
+        def __init__(self, output_format, paginate=False):
             self.output_format = output_format
+            self.paginate = paginate
 
     # Install fake datalab modules so _convert import paths resolve.
-    monkeypatch.setitem(sys.modules, "datalab_sdk", SimpleNamespace(DatalabClient=StubClient))
+    sdk = SimpleNamespace(DatalabClient=StubClient, AsyncDatalabClient=StubAsyncClient)
+    monkeypatch.setitem(sys.modules, "datalab_sdk", sdk)
     monkeypatch.setitem(sys.modules, "datalab_sdk.models", SimpleNamespace(ConvertOptions=StubConvertOptions))
     importlib.reload(parse)
 
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+import strategy.k1.pattern_cache as pc
+import strategy.k1.regex_extractor as rx
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(rx, "BRUTE_FORCE_CACHE_PATH", tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(rx, "_BRUTE_FORCE_STORE", None)
+    return rx.get_brute_force_store()
+
+
+def test_precompute_fills_cache_in_parallel_and_skips_cached_fields(store):
+    fields = ["line_5_interest_income", "partnership_name"]
+
+    written = pc.precompute_brute_force_cache(fields, workers=2)
+
+    assert set(written) == set(fields)
+    assert store.fields() == sorted(fields)
+    assert store.get("partnership_name") == rx._build_brute_force_patterns_for_field(
+        "partnership_name"
+    )
+    assert pc.precompute_brute_force_cache(fields, workers=1) == {}
+
+
+def test_precompute_cli_prunes_stale_generators(store, capsys):
+    pc.BruteForcePatternStore(store.path, "stale").put("partnership_name", [("x", False)])
+
+    assert pc.main(["--fields", "partnership_name", "--workers", "1"]) == 0
+
+    assert store.fields() == ["partnership_name"]
+    assert "Cached 1 fields" in capsys.readouterr().err
+    assert store.prune() == 0
+
+
+def test_generator_hash_is_stable():
+    assert rx.brute_force_generator_hash() == rx.brute_force_generator_hash()
+    assert len(rx.brute_force_generator_hash()) == 64
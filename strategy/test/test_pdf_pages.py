@@ -0,0 +1,182 @@
+import asyncio
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from strategy.datalab_pool import AsyncDatalabClientPool, DatalabClientPool
+from strategy.k1.document_index import DocumentIndex
+from strategy.k1.regex_extractor import get_extraction_engine
+from strategy.parse import ParsePdfToDatalabMarkdown
+from strategy.pdf_pages import page_marker, page_ranges, pdf_page_count, stitch_pages
+from workflow.context import WorkflowContext
+
+
+PDFS = Path(__file__).parent / "fixtures" / "MockParsePdfToMarkdown" / "input_pdf_docs"
+
+
+class PageRangeClient:
+    """Converts a page range into one line per page, numbering separators from zero."""
+
+    def __init__(self, _api_key=None, delay=0.05, pages=7):
+        self.delay = delay
+        self.pages = pages
+        self.ranges = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def _render(self, options):
+        page_range = getattr(options, "page_range", None)
+        first, last = map(int, page_range.split("-")) if page_range else (0, self.pages - 1)
+        self.ranges.append((first, last))
+        assert options.paginate is True
+        return SimpleNamespace(
+            markdown="\n\n".join(
+                f"{page_marker(relative)}\n\n| 1 | page {first + relative} | {first + relative}00 |"
+                for relative in range(last - first + 1)
+            )
+        )
+
+    def convert(self, _path, options):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return self._render(options)
+
+    async def aconvert(self, _path, options, **_kwargs):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return self._render(options)
+
+
+@pytest.fixture
+def fake_convert_options(monkeypatch):
+    monkeypatch.setitem(
+        sys.modules,
+        "datalab_sdk.models",
+        SimpleNamespace(ConvertOptions=lambda **options: SimpleNamespace(**options)),
+    )
+
+
+def _pages(markdown):
+    return [int(number) for number in re.findall(r"^\{(\d+)\}-+$", markdown, re.MULTILINE)]
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    # doc_3 keeps its page tree in compressed object streams.
+    [("doc_1.pdf", 4), ("doc_2.pdf", 2), ("doc_3.pdf", 7)],
+)
+def test_pdf_page_count_reads_the_page_tree(name, expected):
+    assert pdf_page_count((PDFS / name).read_bytes()) == expected
+
+
+def test_pdf_page_count_is_none_without_a_page_tree():
+    assert pdf_page_count(b"%PDF not really") is None
+
+
+def test_page_ranges_cover_every_page_once():
+    assert page_ranges(45, 20) == [(0, 19), (20, 39), (40, 44)]
+    assert page_ranges(20, 20) == [(0, 19)]
+
+
+def test_stitch_pages_renumbers_separators():
+    relative = f"{page_marker(0)}\n\nA\n\n{page_marker(1)}\n\nB\n"
+    absolute = f"{page_marker(2)}\n\nC\n"
+
+    stitched = stitch_pages([(0, relative), (2, absolute), (3, "D"), (4, relative)])
+
+    assert _pages(stitched) == [0, 1, 2, 3, 4, 5]
+    assert [line for line in stitched.splitlines() if line.isalpha()] == list("ABCDAB")
+
+
+def test_document_index_maps_offsets_to_pages():
+    text = f"cover 1\n{page_marker(0)}\n| 1 | Income | 100 |\n{page_marker(1)}\n| 2 | Loss | (7) |\n"
+    index = DocumentIndex(text)
+
+    assert index.page_at(0) is None
+    assert index.page_at(text.index("100")) == 0
+    assert index.page_at(text.index("(7)")) == 1
+    assert [token.value for token in index.numeric_tokens.within(*index.page_span(1))] == [2.0, -7.0]
+    assert index.page_span(5) is None
+
+
+def test_large_pdf_is_converted_in_concurrent_page_ranges(fake_convert_options):
+    client = PageRangeClient()
+    strategy = ParsePdfToDatalabMarkdown(
+        api_key="key",
+        client_pool=DatalabClientPool(lambda _key: client, max_in_flight=3),
+        pages_per_chunk=3,
+    )
+
+    result = strategy.execute(WorkflowContext(pdf_path=PDFS / "doc_3.pdf"))
+
+    assert sorted(client.ranges) == [(0, 2), (3, 5), (6, 6)]
+    assert client.max_running == 3
+    assert _pages(result.output) == list(range(7))
+    assert result.artifacts["page_ranges"] == [(0, 2), (3, 5), (6, 6)]
+    index = DocumentIndex(result.output)
+    assert index.page_at(result.output.index("| page 4 |")) == 4
+
+
+def test_async_split_parse_is_stitched_and_cached(fake_convert_options):
+    client = PageRangeClient()
+    client.convert = client.aconvert
+    pool = AsyncDatalabClientPool(lambda _key: client, max_in_flight=8)
+    pdf = PDFS / "doc_1.pdf"
+
+    async def parse(**options):
+        strategy = ParsePdfToDatalabMarkdown(api_key="key", async_client_pool=pool, **options)
+        return await strategy.execute_async(WorkflowContext(pdf_path=pdf))
+
+    split = asyncio.run(parse(pages_per_chunk=1))
+    converted = len(client.ranges)
+    cached = asyncio.run(parse(pages_per_chunk=1))
+
+    assert client.max_running == 4 and converted == 4
+    assert _pages(split.output) == [0, 1, 2, 3]
+    assert cached.artifacts["parse_cache"] == "hit"
+    assert cached.output == split.output
+
+
+def test_split_and_whole_parses_have_the_same_shape(fake_convert_options):
+    def parse(pages_per_chunk):
+        client = PageRangeClient(delay=0)
+        strategy = ParsePdfToDatalabMarkdown(
+            api_key="key",
+            client_pool=DatalabClientPool(lambda _key: client),
+            pages_per_chunk=pages_per_chunk,
+            use_cache=False,
+        )
+        return strategy.execute(WorkflowContext(pdf_path=PDFS / "doc_3.pdf")).output
+
+    whole, split = parse(0), parse(3)
+
+    # Stitched parts each end in a blank line; a whole convert is returned as is.
+    assert whole.rstrip("\n") == split.rstrip("\n")
+    assert _pages(whole) == list(range(7))
+
+
+@pytest.mark.parametrize("name", ["doc_1.md", "doc_2.md", "doc_3.md"])
+def test_page_separators_do_not_change_extracted_values(name):
+    markdown = (PDFS.parent / "mock_markdown_response_body" / name).read_text()
+    paragraphs = markdown.split("\n\n")
+    size = -(-len(paragraphs) // 4)
+    paged = stitch_pages(
+        (page, "\n\n".join(paragraphs[start : start + size]))
+        for page, start in enumerate(range(0, len(paragraphs), size))
+    )
+    engine = get_extraction_engine()
+
+    assert _pages(paged) == list(range(4))
+    assert engine.document(paged).extract() == engine.document(markdown).extract()
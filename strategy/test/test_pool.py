@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+import strategy.pool as pool_module
+from strategy.pool import WorkerPool
+
+
+def _square(value):
+    return value * value
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+def test_pool_runs_tasks_and_tracks_queue_depth():
+    with WorkerPool(2) as pool:
+        futures = [pool.submit(_square, n) for n in range(6)]
+
+        assert [future.result() for future in futures] == [n * n for n in range(6)]
+        stats = pool.stats()
+
+    assert stats.submitted == 6
+    assert stats.completed == 6
+    assert stats.queue_depth == 0
+    assert 1 <= stats.max_queue_depth <= 6
+    assert stats.peak_worker_rss_mb > 0
+
+
+def test_pool_propagates_errors_and_counts_failures():
+    with WorkerPool(1) as pool:
+        with pytest.raises(ValueError):
+            pool.submit(_fail).result()
+
+        assert pool.stats().failed == 1
+
+
+def test_pool_recycles_workers_past_memory_limit():
+    with WorkerPool(1, max_rss_mb=0.001) as pool:
+        first = pool.submit(os.getpid).result()
+        second = pool.submit(os.getpid).result()
+
+        assert pool.stats().recycles >= 1
+        assert first != second
+
+
+def test_warm_up_and_task_limit_settings(monkeypatch):
+    monkeypatch.setenv("TAXMAN_CPU_WORKERS", "2")
+    monkeypatch.setenv("TAXMAN_WORKER_MAX_TASKS", "1")
+    monkeypatch.setattr(pool_module, "_CPU_POOL", None)
+
+    shared = pool_module.get_cpu_pool()
+    try:
+        assert shared.max_workers == 2
+        assert shared.max_tasks_per_child == 1
+        assert 1 <= shared.warm_up() <= 2
+        assert pool_module.get_cpu_pool() is shared
+    finally:
+        shared.shutdown()
@@ -0,0 +1,159 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from strategy.datalab_pool import AsyncDatalabClientPool, DatalabClientPool
+from strategy.k1.regex_extractor import DOC1_FIELD_TEMPLATE, get_extraction_engine
+from strategy.k1.versions import STRATEGY_VERSIONS
+from strategy.parse import MockParsePdfToDatalabMarkdown, ParsePdfToDatalabMarkdown
+from strategy.pdf_pages import page_marker
+from strategy.progressive import COVER_PAGE_FIELDS, ProgressiveParse, _PartialFields
+from workflow.context import WorkflowContext
+from workflow.k1 import build_k1_workflow
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "MockParsePdfToMarkdown"
+PDF = FIXTURES / "input_pdf_docs" / "doc_3.pdf"  # seven pages
+MARKDOWN = (FIXTURES / "mock_markdown_response_body" / "doc_3.md").read_text()
+
+
+def _page_texts(pages=7):
+    lines = MARKDOWN.splitlines()
+    size = -(-len(lines) // pages)
+    return ["\n".join(lines[i : i + size]) for i in range(0, len(lines), size)]
+
+
+class PagedClient:
+    """Serves doc_3's markdown a paginated range at a time; only the first range is fast."""
+
+    def __init__(self, _api_key=None, slow=0.2):
+        self.pages = _page_texts()
+        self.slow = slow
+        self.completed = 0
+
+    def _render(self, options):
+        first, last = map(int, options.page_range.split("-"))
+        self.completed += 1
+        return SimpleNamespace(
+            markdown="\n\n".join(
+                f"{page_marker(relative)}\n\n{text}"
+                for relative, text in enumerate(self.pages[first : last + 1])
+            )
+        )
+
+    def _delay(self, options):
+        return 0 if options.page_range.startswith("0-") else self.slow
+
+    def convert(self, _path, options):
+        time.sleep(self._delay(options))
+        return self._render(options)
+
+    async def aconvert(self, _path, options, **_kwargs):
+        await asyncio.sleep(self._delay(options))
+        return self._render(options)
+
+
+@pytest.fixture
+def fake_convert_options(monkeypatch):
+    monkeypatch.setitem(
+        sys.modules,
+        "datalab_sdk.models",
+        SimpleNamespace(ConvertOptions=lambda **options: SimpleNamespace(**options)),
+    )
+
+
+def test_cover_fields_are_published_before_the_parse_finishes(fake_convert_options):
+    client = PagedClient()
+    published = []
+    strategy = ProgressiveParse(
+        ParsePdfToDatalabMarkdown(
+            api_key="key",
+            client_pool=DatalabClientPool(lambda _key: client, max_in_flight=4),
+            pages_per_chunk=2,
+        ),
+        on_partial=lambda values: published.append((client.completed, values)),
+    )
+
+    result = strategy.execute(WorkflowContext(pdf_path=PDF))
+
+    completed_when_published, first_values = published[0]
+    assert completed_when_published < 4
+    assert first_values["partnership_name"] == "LIFE PARTNERS IRA HOLDER PARTNERSHIP LLC"
+    assert first_values["partnership_employer_identification_number"] == "81-4644966"
+    assert result.artifacts["partial_fields"]["partnership_name"]["pages"] == 2
+    full = get_extraction_engine().document(result.output).extract(fields=first_values)
+    assert full == first_values
+
+
+def test_async_progressive_parse_publishes_early(fake_convert_options):
+    client = PagedClient()
+    client.convert = client.aconvert
+    published = []
+    strategy = ProgressiveParse(
+        ParsePdfToDatalabMarkdown(
+            api_key="key",
+            async_client_pool=AsyncDatalabClientPool(lambda _key: client),
+            pages_per_chunk=2,
+            use_cache=False,
+        ),
+        fields=["partnership_name", "line_1_ordinary_business_income_loss"],
+        on_partial=lambda values: published.append(client.completed),
+    )
+
+    result = asyncio.run(strategy.execute_async(WorkflowContext(pdf_path=PDF)))
+
+    assert published[0] < 4
+    assert result.context_updates["partial_field_values"]["partnership_name"]
+    assert result.artifacts["source"] == "datalab"
+    assert "missing_partial_fields" in result.artifacts
+
+
+def test_workflow_with_mock_parser_publishes_once():
+    published = []
+    workflow, context = build_k1_workflow(
+        pdf_path=FIXTURES / "input_pdf_docs" / "doc_1.pdf", on_partial=published.append
+    )
+
+    result = workflow.run(context)
+
+    assert result.succeeded
+    assert len(published) == 1
+    assert published[0]["partnership_name"] == context.field_values["partnership_name"]
+    assert context.metadata["partial_field_values"] == published[0]
+    assert set(published[0]) <= set(COVER_PAGE_FIELDS)
+
+
+def test_progressive_parse_wraps_any_parser():
+    strategy = ProgressiveParse(MockParsePdfToDatalabMarkdown(), fields=["not_a_field"])
+
+    result = strategy.execute(
+        WorkflowContext(pdf_path=FIXTURES / "input_pdf_docs" / "doc_2.pdf")
+    )
+
+    assert result.output == result.context_updates["parsed_markdown"]
+    assert result.artifacts["partial_fields"] == {}
+    assert result.artifacts["missing_partial_fields"] == []
+
+
+def test_partial_fields_go_by_the_run_outcome(monkeypatch):
+    # A default other than "0" is still a miss; doc_1 really reports line 3 as 0.
+    defaults = {**DOC1_FIELD_TEMPLATE, "partnership_name": "UNKNOWN"}
+    monkeypatch.setattr("strategy.progressive.DOC1_FIELD_TEMPLATE", defaults)
+    published = []
+    tracker = _PartialFields(
+        STRATEGY_VERSIONS.default_version,
+        ["partnership_name", "line_3_other_rental_income_loss"],
+        published.append,
+    )
+
+    tracker.update("no cover page yet")
+    assert published == []
+    assert tracker.pending == ["partnership_name", "line_3_other_rental_income_loss"]
+
+    tracker.update((FIXTURES / "mock_markdown_response_body" / "doc_1.md").read_text())
+    assert published[-1]["line_3_other_rental_income_loss"] == "0"
+    assert "line_3_other_rental_income_loss" not in tracker.pending
@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 
 import pytest
@@ -8,9 +7,8 @@ import strategy.k1.regex_extractor as rx
 
 @pytest.fixture
 def tmp_cache(monkeypatch, tmp_path: Path):
-    monkeypatch.setattr(rx, "BRUTE_FORCE_CACHE_PATH", tmp_path / "cache.json")
-    monkeypatch.setattr(rx, "_BRUTE_FORCE_PATTERN_CACHE", {})
-    monkeypatch.setattr(rx, "_BRUTE_FORCE_EXECUTOR", None)
+    monkeypatch.setattr(rx, "BRUTE_FORCE_CACHE_PATH", tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(rx, "_BRUTE_FORCE_STORE", None)
     return tmp_path
 
 
@@ -19,25 +17,25 @@ def test_brute_force_cache_round_trip(tmp_cache):
     cached = rx._get_cached_brute_force_patterns("field")
     assert cached == [("pattern", True)]
 
-    # Loading from disk should also work
-    loaded = rx._load_brute_force_pattern_cache()
-    assert loaded["field"][0]["pattern"] == "pattern"
+    # A fresh store (as in another process) reads the row back from disk
+    reopened = rx.BruteForcePatternStore(rx.BRUTE_FORCE_CACHE_PATH, rx.brute_force_generator_hash())
+    assert reopened.get("field") == [("pattern", True)]
 
 
-def test_load_brute_force_cache_handles_bad_data(monkeypatch, tmp_path: Path):
-    bad_file = tmp_path / "cache.json"
-    bad_file.write_text(json.dumps({"version": 999, "patterns": {"x": "bad"}}))
-    monkeypatch.setattr(rx, "BRUTE_FORCE_CACHE_PATH", bad_file)
+def test_brute_force_cache_ignores_other_generators(tmp_cache):
+    stale = rx.BruteForcePatternStore(rx.BRUTE_FORCE_CACHE_PATH, "old-generator")
+    stale.put("x", [("stale", False)])
 
-    assert rx._load_brute_force_pattern_cache() == {}
+    assert rx._get_cached_brute_force_patterns("x") is None
+    assert rx.get_brute_force_store().prune() == 1
 
 
-def test_ensure_brute_force_executor(monkeypatch):
-    monkeypatch.setattr(rx, "_BRUTE_FORCE_EXECUTOR", None)
+def test_ensure_brute_force_executor():
+    from strategy.pool import get_cpu_pool
+
     executor = rx._ensure_brute_force_executor()
-    assert executor is not None
-    executor.shutdown(cancel_futures=True)
-    rx._BRUTE_FORCE_EXECUTOR = None
+    assert executor is get_cpu_pool()
+    assert executor.max_workers >= 1
 
 
 def test_numeric_and_text_cleaners():
@@ -129,7 +127,7 @@ def test_partnership_label_and_line_value_with_summary():
     assert combined(extractor) in {"222", "111"}
 
 
-def test_fallback_and_brute_force_strategies():
+def test_fallback_and_brute_force_strategies(tmp_cache):
     extractor = _sample_extractor()
     strat = rx._fallback_strategy(lambda _: "1", lambda _: "2")
     assert strat(extractor) == "1"
@@ -146,3 +144,46 @@ def test_extract_fields_from_file(tmp_path: Path):
     assert isinstance(result, dict)
     assert contexts
     assert strategies
+
+
+def test_extraction_engine_is_shared_and_resolves_config_once():
+    config = {"line_7_royalties": "table_lookup"}
+    engine = rx.get_extraction_engine(config)
+    assert rx.get_extraction_engine(dict(config)) is engine
+
+    plans = {plan.field_name: plan for plan in engine.plans}
+    assert plans["line_7_royalties"].strategy_name == "table_lookup"
+    assert plans["partnership_name"].strategy_name == "partnership_rows"
+
+    first = engine.document(_sample_extractor().text)
+    second = engine.document("| 7 | royalties | 12 |")
+    assert first.extract()["line_4a_guaranteed_payments_for_services"] == "3423"
+    assert second.extract()["line_7_royalties"] == "12"
+    assert first.contexts is not second.contexts
+    assert second.used_strategies["line_7_royalties"]["name"] == "table_lookup"
+
+
+def test_regex_strategies_use_precompiled_patterns():
+    extractor = _sample_extractor()
+    compiled = rx._compile_pattern(r"Ending capital account.*?\$\s*([\d,.\-()]+)")
+    assert compiled is rx._compile_pattern(r"Ending capital account.*?\$\s*([\d,.\-()]+)")
+    assert extractor._extract_with_regex(compiled, "ending_capital_account") == "777"
+
+
+def test_extract_field_subset_skips_main_table_and_unrequested_fields():
+    text = (
+        "| 1 | Ordinary business income | 1,000 |\n"
+        "| Partnership's name, address, city, state, and ZIP code<br>Acme LP |\n"
+    )
+    extractor = rx.get_extraction_engine().document(text)
+
+    values = extractor.extract(fields=["partnership_name"])
+
+    assert values == {"partnership_name": "Acme LP"}
+    assert list(extractor.used_strategies) == ["partnership_name"]
+    assert extractor._main_table is None
+    assert extractor.extract(fields=["line_1_ordinary_business_income_loss"]) == {
+        "line_1_ordinary_business_income_loss": "1000"
+    }
+    with pytest.raises(ValueError):
+        extractor.extract(fields=["not_a_field"])
@@ -33,6 +33,31 @@ def test_extract_numeric_values_updates_context_and_artifacts(pdf_path: Path, pa
     assert result.output.numeric_fields["4A"] == "3423"
     assert context.numeric_values["1"] == "34908"
     assert "4A" in result.artifacts["table_contexts"]
+    tokens = result.artifacts["numeric_tokens"]
+    assert any(token["value"] == 34908 for token in tokens.values())
+    for token in tokens.values():
+        start, end = token["span"]
+        assert parsed_markdown[start:end] == token["text"]
+
+
+def test_extraction_activities_share_one_document_index(
+    pdf_path: Path, parsed_markdown: str, monkeypatch
+):
+    import strategy.extraction as extraction
+
+    built = []
+
+    class CountingIndex(extraction.DocumentIndex):
+        def __init__(self, text):
+            built.append(text)
+            super().__init__(text)
+
+    monkeypatch.setattr(extraction, "DocumentIndex", CountingIndex)
+    context = WorkflowContext(pdf_path=pdf_path, parsed_markdown=parsed_markdown)
+    for strategy in (ExtractNumericValues(), ExtractRegexK1(), InferExtractionCompleteness()):
+        strategy.execute(context).merge_updates(context)
+
+    assert len(built) == 1
 
 
 def test_extract_regex_k1_populates_field_values_and_metadata(pdf_path: Path, parsed_markdown: str):
@@ -0,0 +1,115 @@
+from pathlib import Path
+
+import pytest
+
+from strategy.k1.document_index import MAIN_TABLE_ROW, DocumentIndex, MainTableRow
+from strategy.k1.regex_extractor import ParsedK1RegexExtractor
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "MockParsePdfToMarkdown" / "mock_markdown_response_body"
+
+TEXT = (
+    "{0}------------------------------------------------\n"
+    "| Line | Description | Amount |\n"
+    "|------|:------------|-------:|\n"
+    "| 1 | Ordinary business income | 1,000 |\n"
+    "| 4A | Guaranteed payments | (25) |\n"
+    "| 1 | Duplicate row | 99 |\n"
+    "\n"
+    "{1}------------------------------------------------\n"
+    "  | SWAP INCOME/(LOSS) | (48,613) | note |\n"
+    "| Partner name | Jane Doe |\n"
+)
+
+
+def _legacy_main_table_rows(text):
+    return tuple(
+        MainTableRow(
+            code=match.group("code").strip().upper(),
+            desc=match.group("desc"),
+            value=match.group("value"),
+            context=match.group(0).strip(),
+            start=match.start(),
+        )
+        for match in MAIN_TABLE_ROW.finditer(text)
+    )
+
+
+def test_tables_have_header_rows_numeric_columns_and_page():
+    first, second = DocumentIndex(TEXT).tables.tables
+
+    assert first.header == ("Line", "Description", "Amount")
+    assert [row.code for row in first.rows] == ["1", "4A", "1"]
+    assert first.numeric_columns == (0, 2)
+    assert first.column("amount") == ["1,000", "(25)", "99"]
+    assert (first.page, first.first_line, first.last_line) == (0, 1, 5)
+
+    assert second.header is None
+    assert second.page == 1
+    assert second.column(1) == ["(48,613)", "Jane Doe"]
+    with pytest.raises(KeyError):
+        second.column("Amount")
+
+
+def test_rows_keep_cells_and_spans():
+    index = DocumentIndex(TEXT)
+    row = next(index.tables.by_label("swap income"))
+
+    assert row.cells == ("SWAP INCOME/(LOSS)", "(48,613)", "note")
+    start, end = row.cell_span(1)
+    assert TEXT[start:end].strip() == "(48,613)"
+    assert TEXT[row.start:row.end] == index.lines[row.line_no]
+    assert index.tables.table_at(row.line_no).page == 1
+
+
+def test_by_code_returns_every_occurrence():
+    tables = DocumentIndex(TEXT).tables
+
+    assert [row.cells[1] for row in tables.by_code("1")] == [
+        "Ordinary business income",
+        "Duplicate row",
+    ]
+    assert [row.cells[2] for row in tables.by_code("4a")] == ["(25)"]
+    assert tables.by_code("20") == ()
+
+
+def test_lookups_can_include_header_lines():
+    tables = DocumentIndex("| 1 | Ordinary business income | 700 |\n|---|---|---|\n| 2 | Rental | 5 |\n").tables
+
+    assert tables.by_code("1") == ()
+    assert [row.cells[2] for row in tables.by_code("1", include_headers=True)] == ["700"]
+    assert list(tables.by_label("ordinary")) == []
+    assert [row.code for row in tables.by_label("ordinary", include_headers=True)] == ["1"]
+
+
+def test_table_strategies_read_the_first_row_for_a_code():
+    extractor = ParsedK1RegexExtractor(TEXT)
+
+    assert extractor._extract_table_value("1", "line_1") == "1000"
+    start = TEXT.index("| 1 | Ordinary")
+    # The context and span belong to the row the value came from.
+    assert extractor.contexts["line_1"] == "| 1 | Ordinary business income | 1,000 |"
+    assert extractor.spans["line_1"] == (start, start + len(extractor.contexts["line_1"]))
+    assert extractor._table_value_by_label("guaranteed", "line_4a") == "(25)"
+    assert extractor._extract_table_value("20", "line_20") == "0"
+    assert "line_20" not in extractor.spans
+    with pytest.raises(ValueError):
+        extractor._table_value_by_label("Partner name", "name")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        TEXT,
+        "| 1 | short |\n| 2 | swallowed | 3 |\n",
+        "| 1 | a | 5 |\r\n| 2 | b | 6 |",
+        "  | 1 | indented | 5 |\n|A1 B| bad code | 2 |\n",
+    ]
+    + [path.read_text() for path in sorted(FIXTURES.glob("*.md"))],
+)
+def test_main_table_rows_and_cells_match_legacy_scans(text):
+    index = DocumentIndex(text)
+
+    assert index.main_table_rows == _legacy_main_table_rows(text)
+    for line_no, line in enumerate(index.lines):
+        assert index.cells(line_no) == [cell.strip() for cell in line.split("|")[1:-1]]
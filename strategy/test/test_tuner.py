@@ -0,0 +1,122 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+import strategy.k1.regex_extractor as rx
+import strategy.k1.tuner as tuner
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "MockParsePdfToMarkdown" / "mock_markdown_response_body"
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    return tuner.TuningOutputStore(tmp_path / "tuning.sqlite3", "fingerprint")
+
+
+def _sample(name, text, **expected):
+    return tuner.TuningSample(name=name, text=text, expected=expected)
+
+
+def test_tuner_prefers_accuracy_then_caches_outputs(monkeypatch, store):
+    calls = []
+
+    def slow_but_right(extractor):
+        calls.append("right")
+        return extractor.text.split()[0]
+
+    monkeypatch.setitem(
+        rx.FIELD_STRATEGIES,
+        "synthetic_field",
+        {"wrong": lambda _: "nope", "right": slow_but_right},
+    )
+    samples = [
+        _sample("a", "alpha body", synthetic_field="alpha"),
+        _sample("b", "beta", synthetic_field="beta"),
+    ]
+
+    report = tuner.tune_field_strategies(samples, fields=["synthetic_field"], workers=1, store=store)
+
+    tuning = report.fields["synthetic_field"]
+    assert (tuning.default, tuning.best) == ("wrong", "right")
+    assert [score.accuracy for score in tuning.scores] == [1.0, 0.0]
+    assert report.strategy_config() == {"synthetic_field": "right"}
+    assert (report.evaluated, report.cached) == (4, 0)
+
+    again = tuner.tune_field_strategies(samples, fields=["synthetic_field"], workers=1, store=store)
+    assert (again.evaluated, again.cached) == (0, 4)
+    assert again.fields["synthetic_field"].best == "right"
+    assert len(calls) == 2
+
+
+def test_tuner_ties_keep_the_default_strategy(monkeypatch, store):
+    monkeypatch.setitem(
+        rx.FIELD_STRATEGIES,
+        "synthetic_field",
+        {"first": lambda _: "1,000", "second": lambda _: "1000"},
+    )
+    samples = [_sample("a", "text", synthetic_field="1000")]
+
+    report = tuner.tune_field_strategies(samples, fields=["synthetic_field"], workers=1, store=store)
+
+    assert report.fields["synthetic_field"].best == "first"
+    assert report.strategy_config() == {}
+
+
+def test_tuner_matches_engine_output_across_workers(store):
+    samples = tuner.load_tuning_samples(FIXTURES)
+    fields = ["partnership_name", "line_5_interest_income", "line_20N_interest_expense_for_corporate_partners"]
+
+    report = tuner.tune_field_strategies(samples, fields=fields, workers=2, store=store)
+
+    assert [sample.name for sample in samples] == ["doc_1.pdf", "doc_3.pdf", "doc_2.pdf"]
+    assert report.documents == 3
+    for sample in samples:
+        cached = store.get_document(sample.digest)
+        expected = rx.RegexExtractionEngine({}).document(sample.text).extract(fields)
+        for field_name in fields:
+            default = report.fields[field_name].default
+            assert cached[(field_name, default)][0] == expected[field_name]
+
+
+def test_tuner_cli_merges_untuned_fields(monkeypatch, tmp_path: Path, store):
+    monkeypatch.setattr(tuner, "get_tuning_store", lambda: store)
+    monkeypatch.setitem(
+        rx.FIELD_STRATEGIES,
+        "synthetic_field",
+        {"wrong": lambda _: "0", "right": lambda _: "7"},
+    )
+    csv_path = tmp_path / "truth.csv"
+    csv_path.write_text(",doc_a.pdf\nsynthetic_field,7\n", encoding="utf-8")
+    (tmp_path / "doc_a.md").write_text("document", encoding="utf-8")
+    output = tmp_path / "config.yaml"
+    rx.save_field_strategy_config({"line_7_royalties": "table_lookup"}, path=output)
+
+    code = tuner.main(
+        [str(tmp_path), "--ground-truth", str(csv_path), "--output", str(output),
+         "--fields", "synthetic_field", "--workers", "1"]
+    )
+
+    assert code == 0
+    assert yaml.safe_load(output.read_text())["fields"] == {
+        "line_7_royalties": "table_lookup",
+        "synthetic_field": "right",
+    }
+
+
+def test_strategy_fingerprint_covers_every_k1_module(monkeypatch, tmp_path: Path):
+    for module in Path(tuner.__file__).parent.glob("*.py"):
+        (tmp_path / module.name).write_bytes(module.read_bytes())
+    monkeypatch.setattr(tuner, "__file__", str(tmp_path / "tuner.py"))
+    tuner.strategy_fingerprint.cache_clear()
+    before = tuner.strategy_fingerprint()
+
+    for name in ("tables.py", "numeric_index.py", "budget.py", "brute_force.py"):
+        with (tmp_path / name).open("a") as handle:
+            handle.write("\n# changed\n")
+        tuner.strategy_fingerprint.cache_clear()
+        after = tuner.strategy_fingerprint()
+        assert after != before
+        before = after
+    tuner.strategy_fingerprint.cache_clear()
@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pytest
+
+import strategy.extraction as extraction
+import strategy.k1.versions as versions
+from strategy.extraction import ExtractRegexK1
+from workflow.context import WorkflowContext
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "MockParsePdfToMarkdown" / "mock_markdown_response_body"
+
+
+@pytest.fixture
+def manifest(tmp_path: Path) -> Path:
+    (tmp_path / "v1.yaml").write_text("fields:\n  partnership_name: cover_page_block\n", encoding="utf-8")
+    path = tmp_path / "versions.yaml"
+    path.write_text(
+        "default: v1.0.0\n"
+        "versions:\n"
+        "  v1.0.0:\n"
+        "    description: file config\n"
+        "    config: v1.yaml\n"
+        "  v1.1.0:\n"
+        "    fields:\n"
+        "      partnership_name: partnership_rows\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_registry_compiles_each_version_once(manifest):
+    registry = versions.StrategyRegistry(manifest)
+
+    assert [entry.version for entry in registry.versions()] == ["v1.0.0", "v1.1.0"]
+    assert not registry.is_loaded("v1.0.0")
+    first = registry.engine("v1.0.0")
+    assert registry.engine("v1.0.0") is first
+    assert registry.is_loaded("v1.0.0")
+    newer = registry.engine("v1.1.0")
+    assert first.plans_by_field["partnership_name"].strategy_name == "cover_page_block"
+    assert newer.plans_by_field["partnership_name"].strategy_name == "partnership_rows"
+
+    with pytest.raises(versions.UnknownStrategyVersionError, match="v1.0.0, v1.1.0"):
+        registry.engine("v9")
+
+
+def test_registry_clear_rereads_manifest_and_keeps_code_versions(manifest):
+    registry = versions.StrategyRegistry(manifest)
+    registry.register("v2.0.0", strategy_config={"partnership_name": "official_label"})
+    with pytest.raises(ValueError):
+        registry.register("v1.0.0", strategy_config={})
+    engine = registry.engine("v1.0.0")
+
+    manifest.write_text("default: v1.1.0\nversions:\n  v1.1.0: {}\n", encoding="utf-8")
+    registry.clear()
+
+    assert registry.default_version == "v1.1.0"
+    assert [entry.version for entry in registry.versions()] == ["v1.1.0", "v2.0.0"]
+    assert registry.engine("v2.0.0") is not engine
+
+
+def test_extract_regex_k1_serves_versions_without_reading_yaml(monkeypatch):
+    monkeypatch.setattr(versions, "STRATEGY_VERSIONS", versions.StrategyRegistry())
+    monkeypatch.setattr(extraction, "STRATEGY_VERSIONS", versions.STRATEGY_VERSIONS)
+    versions.STRATEGY_VERSIONS.register(
+        "v1.1.0", strategy_config={"partnership_name": "cover_page_block"}
+    )
+    markdown = (FIXTURES / "doc_1.md").read_text(encoding="utf-8")
+    stable, newer = ExtractRegexK1(version="v1.0.0"), ExtractRegexK1(version="v1.1.0")
+    stable.execute(WorkflowContext(pdf_path=Path("doc_1.pdf"), parsed_markdown=markdown))
+
+    def _no_yaml(*_args, **_kwargs):
+        raise AssertionError("config YAML read during execute")
+
+    monkeypatch.setattr(extraction, "load_field_strategy_config", _no_yaml)
+    for strategy, expected in ((stable, "partnership_rows"), (newer, "cover_page_block")):
+        context = WorkflowContext(pdf_path=Path("doc_1.pdf"), parsed_markdown=markdown)
+        result = strategy.execute(context)
+        assert result.artifacts["used_strategies"]["partnership_name"]["name"] == expected
+
+    with pytest.raises(versions.UnknownStrategyVersionError):
+        ExtractRegexK1(version="v0.0.1")
+
+
+def test_registry_follows_config_edits(manifest):
+    registry = versions.StrategyRegistry(manifest)
+    stable, newer = registry.engine("v1.0.0"), registry.engine("v1.1.0")
+
+    (manifest.parent / "v1.yaml").write_text(
+        "fields:\n  partnership_name: partnership_rows\n", encoding="utf-8"
+    )
+    reloaded = registry.engine("v1.0.0")
+    assert reloaded is not stable
+    assert reloaded.plans_by_field["partnership_name"].strategy_name == "partnership_rows"
+    assert registry.get("v1.0.0").strategy_config == {"partnership_name": "partnership_rows"}
+    assert registry.engine("v1.1.0") is newer
+
+
+def test_strategies_default_to_the_manifest_default(manifest, monkeypatch):
+    import strategy.progressive as progressive
+    from strategy.parse import MockParsePdfToDatalabMarkdown
+
+    registry = versions.StrategyRegistry(manifest)
+    monkeypatch.setattr(extraction, "STRATEGY_VERSIONS", registry)
+    monkeypatch.setattr(progressive, "STRATEGY_VERSIONS", registry)
+    assert ExtractRegexK1().version == "v1.0.0"
+
+    manifest.write_text(manifest.read_text().replace("default: v1.0.0", "default: v1.1.0"))
+    registry.clear()
+
+    assert ExtractRegexK1().version == "v1.1.0"
+    parse = progressive.ProgressiveParse(MockParsePdfToDatalabMarkdown())
+    assert parse.strategy_version == "v1.1.0"
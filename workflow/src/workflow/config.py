@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
 import yaml
 
+from strategy.config_cache import CONFIG_CACHE
+
 # Base defaults so callers can fall back when configs are missing.
 DEFAULT_WORKFLOW_OPTIONS: Dict[str, Any] = {
     "workflow": "regex",
@@ -51,13 +54,8 @@ class WorkflowConfig:
         }
 
 
-def _discover_config_path(start: Optional[Path] = None) -> Path:
-    """Locate the config file starting from `start` or this file and walking up."""
-    env_override = os.getenv(ENV_CONFIG_PATH)
-    if env_override:
-        return Path(env_override)
-
-    search_root = start or Path(__file__).resolve()
+@lru_cache(maxsize=32)
+def _find_config_upwards(search_root: Path) -> Path:
     for candidate in [search_root, *search_root.parents]:
         config_path = candidate / DEFAULT_CONFIG_DIRNAME / DEFAULT_CONFIG_FILENAME
         if config_path.exists():
@@ -65,15 +63,26 @@ def _discover_config_path(start: Optional[Path] = None) -> Path:
     raise FileNotFoundError("Workflow config file not found; expected config/workflows.yaml")
 
 
-def load_workflow_configs(
-    config_path: Optional[Path] = None, start: Optional[Path] = None
-) -> Tuple[Optional[str], Dict[str, WorkflowConfig]]:
-    """Load all workflow configs from YAML."""
-    path = Path(config_path) if config_path else _discover_config_path(start=start)
-    if not path.exists():
-        raise FileNotFoundError(f"Workflow config file not found at {path}")
+def _discover_config_path(start: Optional[Path] = None) -> Path:
+    """Locate the config file starting from `start` or this file and walking up.
 
-    raw = yaml.safe_load(path.read_text()) or {}
+    The walk is remembered per start directory and redone if the file it
+    found disappears; the env override is checked on every call.
+    """
+    env_override = os.getenv(ENV_CONFIG_PATH)
+    if env_override:
+        return Path(env_override)
+
+    search_root = start or Path(__file__).resolve()
+    config_path = _find_config_upwards(search_root)
+    if not config_path.exists():
+        _find_config_upwards.cache_clear()
+        config_path = _find_config_upwards(search_root)
+    return config_path
+
+
+def _parse_workflow_configs(text: str) -> Tuple[Optional[str], Dict[str, WorkflowConfig]]:
+    raw = yaml.safe_load(text) or {}
     selected = raw.get("selected")
     raw_workflows = raw.get("workflows") or {}
     if not isinstance(raw_workflows, Mapping):
@@ -103,6 +112,23 @@ def load_workflow_configs(
     return selected, configs
 
 
+def load_workflow_configs(
+    config_path: Optional[Path] = None, start: Optional[Path] = None
+) -> Tuple[Optional[str], Dict[str, WorkflowConfig]]:
+    """Load all workflow configs from YAML.
+
+    The file is parsed once and re-parsed only after it changes on disk (see
+    `strategy.config_cache`); an edit that fails validation keeps the last
+    good configs in service.
+    """
+    path = Path(config_path) if config_path else _discover_config_path(start=start)
+    if not path.exists():
+        raise FileNotFoundError(f"Workflow config file not found at {path}")
+
+    selected, configs = CONFIG_CACHE.load(path, _parse_workflow_configs)
+    return selected, dict(configs)
+
+
 def get_workflow_config(
     *,
     config_name: Optional[str] = None,
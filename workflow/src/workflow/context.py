@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -16,6 +19,10 @@ class WorkflowContext:
     inference: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
     errors: List[str] = field(default_factory=list)
+    # name -> (markdown digest, artifact); see `parsed_artifact`.
+    _artifacts: Dict[str, Tuple[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def apply_updates(self, updates: Mapping[str, Any]) -> None:
         """Apply updates to known fields, falling back to metadata for extras."""
@@ -27,3 +34,21 @@ class WorkflowContext:
 
     def add_error(self, message: str) -> None:
         self.errors.append(message)
+
+    def parsed_artifact(self, name: str, build: Callable[[str], T]) -> T:
+        """Return `build(parsed_markdown)`, built once per markdown content.
+
+        Activities that derive the same structure from the document (e.g. the
+        regex document index) share one instance per run. The artifact is
+        keyed by a hash of the markdown, so it is rebuilt if the markdown is
+        replaced.
+        """
+        if self.parsed_markdown is None:
+            raise ValueError("parsed_markdown is required to build a parsed artifact")
+        digest = hashlib.sha256(self.parsed_markdown.encode("utf-8")).hexdigest()
+        cached = self._artifacts.get(name)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+        artifact = build(self.parsed_markdown)
+        self._artifacts[name] = (digest, artifact)
+        return artifact
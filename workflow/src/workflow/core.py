@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, Generic, List, Optional, Sequence, TypeVar
 
-from strategy.base import BaseStrategy, StrategyError
+from strategy.base import BaseStrategy, StrategyError, StrategyResult
 from .context import WorkflowContext
 
 
@@ -36,21 +36,36 @@ class Activity(Generic[TResult]):
     def run(self, context: WorkflowContext) -> ActivityResult[TResult]:
         try:
             result = self.strategy.execute(context)
+        except Exception as exc:
+            return self._failed(context, exc)
+        return self._completed(context, result)
+
+    async def run_async(self, context: WorkflowContext) -> ActivityResult[TResult]:
+        """Like `run`, awaiting the strategy's `execute_async`."""
+        try:
+            result = await self.strategy.execute_async(context)
+        except Exception as exc:
+            return self._failed(context, exc)
+        return self._completed(context, result)
+
+    def _completed(
+        self, context: WorkflowContext, result: StrategyResult[TResult]
+    ) -> ActivityResult[TResult]:
+        try:
             result.merge_updates(context)
-            output = result.output
-            errors = list(result.errors)
-            artifacts = dict(result.artifacts)
-        except StrategyError as exc:
-            context.add_error(str(exc))
-            output = None
-            artifacts = {}
-            errors = [str(exc)]
         except Exception as exc:  # pragma: no cover - defensive
-            context.add_error(str(exc))
-            output = None
-            artifacts = {}
-            errors = [f"Unexpected error in {self.name}: {exc}"]
-
+            return self._failed(context, exc)
+        return self._result(result.output, dict(result.artifacts), list(result.errors))
+
+    def _failed(self, context: WorkflowContext, exc: Exception) -> ActivityResult[TResult]:
+        context.add_error(str(exc))
+        if isinstance(exc, StrategyError):
+            return self._result(None, {}, [str(exc)])
+        return self._result(None, {}, [f"Unexpected error in {self.name}: {exc}"])
+
+    def _result(
+        self, output: Optional[TResult], artifacts: Dict[str, Any], errors: List[str]
+    ) -> ActivityResult[TResult]:
         return ActivityResult(
             name=self.name,
             output=output,
@@ -85,3 +100,14 @@ class Workflow:
         for activity in self.activities:
             results.append(activity.run(context))
         return WorkflowResult(context=context, activity_results=results)
+
+    async def run_async(self, context: WorkflowContext) -> WorkflowResult:
+        """Run the activities in order on the event loop.
+
+        Activities still run one after another; awaiting them lets one event
+        loop keep many workflow runs (and their remote parses) in flight.
+        """
+        results: List[ActivityResult[Any]] = []
+        for activity in self.activities:
+            results.append(await activity.run_async(context))
+        return WorkflowResult(context=context, activity_results=results)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable, Optional, Sequence
+from typing import Callable, Dict, Iterable, Optional, Sequence
 
 from strategy.extraction import (
     ExtractNumericValues,
@@ -10,22 +10,37 @@ from strategy.extraction import (
 )
 from strategy.parse import MockParsePdfToDatalabMarkdown, ParsePdfToDatalabMarkdown
 from strategy.llm import MockOpenRouterExtractK1, OpenRouterExtractK1
+from strategy.progressive import ProgressiveParse
 from .context import WorkflowContext
 from .core import Activity, Workflow
 
 
+def _parse_strategy(
+    use_mock_parser: bool,
+    strategy_version: Optional[str],
+    on_partial: Optional[Callable[[Dict[str, str]], None]],
+):
+    parser = MockParsePdfToDatalabMarkdown() if use_mock_parser else ParsePdfToDatalabMarkdown()
+    if on_partial is None:
+        return parser
+    return ProgressiveParse(parser, version=strategy_version, on_partial=on_partial)
+
+
 def build_k1_workflow(
     *,
     pdf_path: Path,
     use_mock_parser: bool = True,
     required_fields: Optional[Iterable[str]] = None,
-    strategy_version: str = "v1.0.0",
+    strategy_version: Optional[str] = None,
+    on_partial: Optional[Callable[[Dict[str, str]], None]] = None,
 ) -> tuple[Workflow, WorkflowContext]:
-    """Assemble the default K-1 workflow with sensible defaults."""
+    """Assemble the default K-1 workflow with sensible defaults.
 
-    parse_strategy = (
-        MockParsePdfToDatalabMarkdown() if use_mock_parser else ParsePdfToDatalabMarkdown()
-    )
+    With `on_partial`, cover-page fields are extracted while the PDF is still
+    parsing and passed to it as soon as they are found.
+    """
+
+    parse_strategy = _parse_strategy(use_mock_parser, strategy_version, on_partial)
     activities: Sequence[Activity] = [
         Activity(name="parse", strategy=parse_strategy),
         Activity(name="extract_numbers", strategy=ExtractNumericValues()),
@@ -50,12 +65,11 @@ def build_k1_llm_extract_workflow(
     use_mock_llm: bool = True,
     required_fields: Optional[Iterable[str]] = None,
     llm_model: str = "openai/gpt-4o-mini",
+    on_partial: Optional[Callable[[Dict[str, str]], None]] = None,
 ) -> tuple[Workflow, WorkflowContext]:
     """Assemble a K-1 workflow that uses OpenRouter for field extraction."""
 
-    parse_strategy = (
-        MockParsePdfToDatalabMarkdown() if use_mock_parser else ParsePdfToDatalabMarkdown()
-    )
+    parse_strategy = _parse_strategy(use_mock_parser, None, on_partial)
     extract_strategy = (
         MockOpenRouterExtractK1()
         if use_mock_llm
@@ -32,6 +32,35 @@ workflows:
         wf_config.load_workflow_configs(config_path=cfg)
 
 
+def test_load_workflow_configs_reloads_edited_file(tmp_path: Path):
+    cfg = tmp_path / "workflows.yaml"
+    cfg.write_text("selected: a\nworkflows:\n  a:\n    workflow: regex\n")
+    assert wf_config.get_workflow_config(config_path=cfg).workflow == "regex"
+
+    cfg.write_text("selected: a\nworkflows:\n  a:\n    workflow: llm\n")
+    assert wf_config.get_workflow_config(config_path=cfg).workflow == "llm"
+
+    # A broken edit leaves the last valid presets in service.
+    cfg.write_text("workflows:\n  - invalid\n")
+    with pytest.warns(RuntimeWarning):
+        assert wf_config.get_workflow_config(config_path=cfg, config_name="a").workflow == "llm"
+
+
+def test_discover_config_path_redoes_walk_when_file_moves(tmp_path: Path):
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    outer = tmp_path / "config" / "workflows.yaml"
+    outer.parent.mkdir()
+    outer.write_text("workflows: {}\n")
+    assert wf_config._discover_config_path(start=nested) == outer
+
+    outer.unlink()
+    inner = tmp_path / "a" / "config" / "workflows.yaml"
+    inner.parent.mkdir()
+    inner.write_text("workflows: {}\n")
+    assert wf_config._discover_config_path(start=nested) == inner
+
+
 def test_get_workflow_config_unknown_name(tmp_path: Path):
     cfg = tmp_path / "workflows.yaml"
     cfg.write_text(
@@ -79,3 +108,23 @@ def test_workflow_context_add_error():
     ctx.add_error("boom")
 
     assert ctx.errors == ["boom"]
+
+
+def test_workflow_context_parsed_artifact_is_keyed_by_markdown():
+    context = WorkflowContext(pdf_path=Path("doc.pdf"), parsed_markdown="first")
+    builds = []
+
+    def build(text):
+        builds.append(text)
+        return object()
+
+    artifact = context.parsed_artifact("index", build)
+    assert context.parsed_artifact("index", build) is artifact
+    assert builds == ["first"]
+
+    context.parsed_markdown = "second"
+    assert context.parsed_artifact("index", build) is not artifact
+    assert builds == ["first", "second"]
+
+    with pytest.raises(ValueError):
+        WorkflowContext(pdf_path=Path("doc.pdf")).parsed_artifact("index", build)